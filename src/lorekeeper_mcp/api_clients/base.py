@@ -20,6 +20,24 @@ logger = logging.getLogger(__name__)
 # HTTP status code threshold for error responses
 HTTP_ERROR_STATUS_CODE = 400
 
+# Connection pool limits; kept-alive connections skip the TCP/TLS handshake
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0)
+
+
+def extract_results(response: dict[str, Any] | list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return the entity list from a bare-list or paginated API response.
+
+    Args:
+        response: Parsed response body from make_request()
+
+    Returns:
+        The response itself if it is a list, otherwise its "results" entries
+    """
+    if isinstance(response, list):
+        return response
+    results: list[dict[str, Any]] = response.get("results", [])
+    return results
+
 
 class BaseHttpClient:
     """Base HTTP client providing common functionality for API requests."""
@@ -50,6 +68,7 @@ class BaseHttpClient:
         if self._client is None:
             self._client = httpx.AsyncClient(
                 timeout=self.timeout,
+                limits=HTTP_LIMITS,
                 headers={"User-Agent": "LoreKeeper-MCP/0.1.0"},
             )
         return self._client
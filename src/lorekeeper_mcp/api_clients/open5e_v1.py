@@ -2,7 +2,7 @@
 
 from typing import Any, cast
 
-from lorekeeper_mcp.api_clients.base import BaseHttpClient
+from lorekeeper_mcp.api_clients.base import BaseHttpClient, extract_results
 from lorekeeper_mcp.models import Creature
 
 
@@ -42,7 +42,7 @@ class Open5eV1Client(BaseHttpClient):
         )
 
         # Handle both list and dict response formats
-        entities = result if isinstance(result, list) else result.get("results", [])
+        entities = extract_results(result)
 
         # Convert dictionaries to Creature objects
         return [Creature(**monster_data) for monster_data in entities]
@@ -79,10 +79,7 @@ class Open5eV1Client(BaseHttpClient):
             params=params,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return cast(list[dict[str, Any]], result.get("results", []))
+        return extract_results(result)
 
     async def get_races(self, **filters: Any) -> list[dict[str, Any]]:
         """Get character races from Open5e API v1.
@@ -97,10 +94,7 @@ class Open5eV1Client(BaseHttpClient):
             params=params,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return cast(list[dict[str, Any]], result.get("results", []))
+        return extract_results(result)
 
     async def get_magic_items(
         self,
@@ -138,10 +132,7 @@ class Open5eV1Client(BaseHttpClient):
             params=params,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return cast(list[dict[str, Any]], result.get("results", []))
+        return extract_results(result)
 
     async def get_planes(
         self,
@@ -167,10 +158,7 @@ class Open5eV1Client(BaseHttpClient):
             params=params,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return cast(list[dict[str, Any]], result.get("results", []))
+        return extract_results(result)
 
     async def get_sections(
         self,
@@ -200,10 +188,7 @@ class Open5eV1Client(BaseHttpClient):
             params=params,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return cast(list[dict[str, Any]], result.get("results", []))
+        return extract_results(result)
 
     async def get_spell_list(
         self,
@@ -229,10 +214,7 @@ class Open5eV1Client(BaseHttpClient):
             params=params,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return cast(list[dict[str, Any]], result.get("results", []))
+        return extract_results(result)
 
     async def get_manifest(self) -> dict[str, Any]:
         """Get API manifest/root endpoint from Open5e API v1.
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from lorekeeper_mcp.api_clients.base import BaseHttpClient
+from lorekeeper_mcp.api_clients.base import BaseHttpClient, extract_results
 from lorekeeper_mcp.models import Armor, Creature, Spell, Weapon
 
 
@@ -171,9 +171,7 @@ class Open5eV2Client(BaseHttpClient):
             params=params,
         )
 
-        spell_dicts: list[dict[str, Any]] = (
-            result if isinstance(result, list) else result.get("results", [])
-        )
+        spell_dicts = extract_results(result)
 
         # Extract document name for each spell
         for spell in spell_dicts:
@@ -221,9 +219,7 @@ class Open5eV2Client(BaseHttpClient):
             params=params,
         )
 
-        weapon_dicts: list[dict[str, Any]] = (
-            result if isinstance(result, list) else result.get("results", [])
-        )
+        weapon_dicts = extract_results(result)
 
         # Extract document name for each weapon
         for weapon in weapon_dicts:
@@ -271,9 +267,7 @@ class Open5eV2Client(BaseHttpClient):
             params=params,
         )
 
-        armor_dicts: list[dict[str, Any]] = (
-            result if isinstance(result, list) else result.get("results", [])
-        )
+        armor_dicts = extract_results(result)
 
         # Extract document name for each armor
         for armor_item in armor_dicts:
@@ -290,10 +284,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_feats(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get character feats."""
@@ -302,10 +293,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_conditions(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get game conditions."""
@@ -314,10 +302,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     # Task 1.6: Item-related methods
     async def get_items(self, **kwargs: Any) -> list[dict[str, Any]]:
@@ -334,10 +319,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_item_sets(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get item sets from Open5e API v2.
@@ -356,10 +338,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_item_categories(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get item categories from Open5e API v2.
@@ -378,10 +357,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     # Task 1.7: Creature methods
     async def get_creatures(
@@ -420,9 +396,7 @@ class Open5eV2Client(BaseHttpClient):
             params=params,
         )
 
-        creature_dicts: list[dict[str, Any]] = (
-            result if isinstance(result, list) else result.get("results", [])
-        )
+        creature_dicts = extract_results(result)
 
         # Transform each creature response to match Monster model format
         transformed_creatures = []
@@ -448,10 +422,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_creature_sets(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get creature sets from Open5e API v2.
@@ -469,10 +440,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     # Task 1.8: Reference data methods (30-day TTL for all)
     async def get_damage_types_v2(self, **kwargs: Any) -> list[dict[str, Any]]:
@@ -489,10 +457,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_languages_v2(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get language definitions from Open5e API v2.
@@ -508,10 +473,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_alignments_v2(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get alignment definitions from Open5e API v2.
@@ -527,10 +489,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_spell_schools_v2(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get spell school definitions from Open5e API v2.
@@ -546,10 +505,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_sizes(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get creature size definitions from Open5e API v2.
@@ -565,10 +521,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_item_rarities(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get item rarity level definitions from Open5e API v2.
@@ -584,10 +537,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_environments(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get encounter environment definitions from Open5e API v2.
@@ -603,10 +553,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_abilities(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get ability score definitions from Open5e API v2.
@@ -622,10 +569,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_skills_v2(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get skill definitions from Open5e API v2.
@@ -641,10 +585,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     # Task 1.9: Character option methods (7-day TTL)
     async def get_species(self, **kwargs: Any) -> list[dict[str, Any]]:
@@ -661,10 +602,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_classes_v2(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get character classes from Open5e API v2.
@@ -680,10 +618,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     # Task 1.10: Rules and metadata methods
     async def get_rules_v2(self, **kwargs: Any) -> list[dict[str, Any]]:
@@ -700,10 +635,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_rulesets(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get ruleset definitions from Open5e API v2.
@@ -719,10 +651,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_documents(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get game document definitions from Open5e API v2.
@@ -738,10 +667,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_licenses(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get license information from Open5e API v2.
@@ -757,10 +683,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_publishers(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get publisher information from Open5e API v2.
@@ -776,10 +699,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_game_systems(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get game system information from Open5e API v2.
@@ -795,10 +715,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     # Task 1.11: Additional content methods
     async def get_images(self, **kwargs: Any) -> list[dict[str, Any]]:
@@ -815,10 +732,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_weapon_properties_v2(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get weapon property definitions from Open5e API v2.
@@ -834,10 +748,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     async def get_services(self, **kwargs: Any) -> list[dict[str, Any]]:
         """Get service information from Open5e API v2.
@@ -853,10 +764,7 @@ class Open5eV2Client(BaseHttpClient):
             params=kwargs,
         )
 
-        if isinstance(result, list):
-            return result
-
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
 
     # Task 2.2: Unified Search Implementation
     DEFAULT_SEARCH_LIMIT = 50
@@ -915,9 +823,4 @@ class Open5eV2Client(BaseHttpClient):
             params=params,
         )
 
-        # The search endpoint returns a list directly
-        if isinstance(result, list):
-            return result
-
-        # Fallback in case the API returns a dict with results
-        return result.get("results", [])  # type: ignore[no-any-return]
+        return extract_results(result)
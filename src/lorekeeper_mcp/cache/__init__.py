@@ -1,7 +1,8 @@
 """Caching module for API responses.
 
 This module provides Milvus-based caching with semantic/vector search support
-for storing and retrieving D&D entity data.
+for storing and retrieving D&D entity data, plus a small in-process
+ResultCache that tools use to memoize repeated queries.
 
 Use the factory functions to create cache instances:
 
@@ -16,6 +17,7 @@ Use the factory functions to create cache instances:
 
 from lorekeeper_mcp.cache.embedding import EmbeddingService
 from lorekeeper_mcp.cache.factory import create_cache, get_cache_from_config
+from lorekeeper_mcp.cache.memory import ResultCache, make_cache_key
 from lorekeeper_mcp.cache.milvus import MilvusCache
 from lorekeeper_mcp.cache.protocol import CacheProtocol
 
@@ -23,6 +25,8 @@ __all__ = [
     "CacheProtocol",
     "EmbeddingService",
     "MilvusCache",
+    "ResultCache",
     "create_cache",
     "get_cache_from_config",
+    "make_cache_key",
 ]
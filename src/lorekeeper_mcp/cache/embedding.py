@@ -8,6 +8,7 @@ to avoid startup delays when the cache is not needed.
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -19,12 +20,17 @@ logger = logging.getLogger(__name__)
 DEFAULT_MODEL_NAME = "all-MiniLM-L6-v2"
 EMBEDDING_DIMENSION = 384
 
+# Number of encode() results kept per service; search queries repeat often
+QUERY_CACHE_SIZE = 1024
+
 
 class EmbeddingService:
     """Service for generating text embeddings using sentence-transformers.
 
     Uses lazy model loading to avoid ~2s startup delay when cache is not needed.
-    The model is loaded on first encode() or encode_batch() call.
+    The model is loaded on first encode() or encode_batch() call. Single-text
+    encodings, which serve search queries, are kept in a small LRU so repeated
+    queries skip the model.
 
     Attributes:
         model_name: Name of the sentence-transformers model to use.
@@ -39,6 +45,7 @@ class EmbeddingService:
         """
         self.model_name = model_name
         self._model: SentenceTransformer | None = None
+        self._query_cache: OrderedDict[str, tuple[float, ...]] = OrderedDict()
 
     @property
     def model(self) -> SentenceTransformer:
@@ -64,8 +71,16 @@ class EmbeddingService:
         Returns:
             List of floats representing the 384-dimensional embedding.
         """
+        cached = self._query_cache.get(text)
+        if cached is not None:
+            self._query_cache.move_to_end(text)
+            return list(cached)
+
         embedding = self.model.encode(text, convert_to_numpy=True)
         result: list[float] = embedding.tolist()
+        self._query_cache[text] = tuple(result)
+        if len(self._query_cache) > QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
         return result
 
     def encode_batch(self, texts: list[str], batch_size: int = 32) -> list[list[float]]:
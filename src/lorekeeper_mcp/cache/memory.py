@@ -0,0 +1,234 @@
+"""In-process segmented LRU cache for tool results.
+
+This module provides the ResultCache class, a small segmented LRU cache that
+tools use to skip repository and network round-trips for repeated
+queries within a single server process. It complements the persistent Milvus
+cache rather than replacing it.
+
+Concurrent misses for the same key are coalesced: the loader runs once in its
+own task, and every caller awaits its result instead of issuing their own
+repository or network calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, cast
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAXSIZE = 256
+
+# Share of ResultCache capacity reserved for entries that have been hit again
+PROTECTED_RATIO = 0.8
+
+_Rows = tuple[dict[str, Any], ...]
+# Monotonic expiry time paired with the cached rows
+_Entry = tuple[float, _Rows]
+
+
+def _freeze(part: Any) -> Hashable:
+    """Convert one key component to an interned, hashable form.
+
+    Args:
+        part: Key component (string, number, bool, None, or a collection).
+
+    Returns:
+        Interned string, sorted tuple for collections, or the part unchanged.
+    """
+    if isinstance(part, str):
+        return sys.intern(part)
+    if isinstance(part, list | tuple | set | frozenset):
+        return tuple(sorted(_freeze(item) for item in part))  # type: ignore[type-var]
+    return cast(Hashable, part)
+
+
+def make_cache_key(*parts: Any) -> tuple[Hashable, ...]:
+    """Build a frozen cache key from query arguments.
+
+    Strings are interned so repeated lookups compare by identity, and
+    collections (such as document lists) become sorted tuples so argument
+    order does not split entries. Callers should case-fold any argument whose
+    matching is case-insensitive before passing it in.
+
+    Args:
+        *parts: Query arguments in a fixed order.
+
+    Returns:
+        Hashable tuple suitable as a ResultCache key.
+    """
+    return tuple(_freeze(part) for part in parts)
+
+
+class ResultCache:
+    """Segmented least-recently-used (SLRU) cache for tool result lists.
+
+    New entries start in a probationary segment and are promoted to a
+    protected segment when they are hit again. Inserts evict from the
+    least-recently-used end of the probationary segment, so a burst of
+    one-off queries cannot flush results that are being reused. When the
+    protected segment outgrows its share, its least recently used entry is
+    demoted back to probation rather than dropped. Entries are stored as
+    tuples and every lookup returns a fresh list built from them, so callers
+    can reorder or trim what they get back without touching the cache.
+
+    With a ttl, entries expire that many seconds after they were stored.
+    Expired entries are dropped lazily when they are next looked up, so no
+    background sweeper is needed.
+
+    Attributes:
+        maxsize: Maximum number of entries kept before eviction.
+        protected_maxsize: Maximum number of entries in the protected segment.
+        ttl: Entry lifetime in seconds, or None for entries that never expire.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: float | None = None) -> None:
+        """Initialize ResultCache.
+
+        Args:
+            maxsize: Maximum number of entries to keep. Defaults to 256.
+            ttl: Entry lifetime in seconds. Defaults to None (no expiry).
+        """
+        self.maxsize = maxsize
+        self.protected_maxsize = int(maxsize * PROTECTED_RATIO)
+        self.ttl = ttl
+        self._probation: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._protected: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Future[_Rows]] = {}
+        # Bumped by clear() so loads started before it are not stored
+        self._generation = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._probation) + len(self._protected)
+
+    def get(self, key: Hashable) -> list[dict[str, Any]] | None:
+        """Look up a cached result and mark it as recently used.
+
+        A hit on a probationary entry promotes it to the protected segment.
+        An expired entry is removed and reported as a miss.
+
+        Args:
+            key: Hashable cache key.
+
+        Returns:
+            New list of the cached results, or None on a miss.
+        """
+        protected = key in self._protected
+        segment = self._protected if protected else self._probation
+        entry = segment.get(key)
+        if entry is None:
+            return None
+
+        expires_at, rows = entry
+        if expires_at <= time.monotonic():
+            del segment[key]
+            return None
+
+        if protected:
+            self._protected.move_to_end(key)
+        else:
+            del self._probation[key]
+            self._protect(key, entry)
+        return list(rows)
+
+    def set(self, key: Hashable, value: list[dict[str, Any]]) -> None:
+        """Store a result, evicting the least recently used probationary entry if full.
+
+        Args:
+            key: Hashable cache key.
+            value: Result list to cache. It is copied into an immutable tuple.
+        """
+        self._store(key, tuple(value))
+
+    def _store(self, key: Hashable, rows: _Rows) -> None:
+        expires_at = math.inf if self.ttl is None else time.monotonic() + self.ttl
+        value = (expires_at, rows)
+        if key in self._protected:
+            self._protected[key] = value
+            self._protected.move_to_end(key)
+            return
+        if key in self._probation:
+            self._probation.move_to_end(key)
+        elif len(self) >= self.maxsize:
+            segment = self._probation or self._protected
+            segment.popitem(last=False)
+        self._probation[key] = value
+
+    def _protect(self, key: Hashable, value: _Entry) -> None:
+        self._protected[key] = value
+        if len(self._protected) > self.protected_maxsize:
+            demoted_key, demoted = self._protected.popitem(last=False)
+            self._probation[demoted_key] = demoted
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[list[dict[str, Any]]]],
+    ) -> list[dict[str, Any]]:
+        """Return a cached result, loading it at most once per key concurrently.
+
+        On a miss ``loader`` runs in its own task and its result is stored.
+        Every caller for the key, including the one that started the load,
+        awaits that task through a shield, so cancelling one caller neither
+        cancels the load nor fails the others. Failures are propagated to
+        every waiter and are not cached.
+
+        Args:
+            key: Hashable cache key.
+            loader: Zero-argument coroutine function producing the result.
+
+        Returns:
+            Cached or freshly loaded result list.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._load(key, loader, self._generation))
+            # Nobody may be left to await a failed load once its callers are cancelled
+            pending.add_done_callback(_retrieve_exception)
+            self._inflight[key] = pending
+        return list(await asyncio.shield(pending))
+
+    async def _load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[list[dict[str, Any]]]],
+        generation: int,
+    ) -> _Rows:
+        try:
+            rows = tuple(await loader())
+        finally:
+            # clear() may already have dropped this load in favour of a newer one
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+        # Results loaded from before a clear() would bring back what it removed
+        if generation == self._generation:
+            self._store(key, rows)
+        return rows
+
+    def clear(self) -> None:
+        """Remove all cached entries.
+
+        Loads already in flight still answer their callers but are not
+        stored, and later callers start a fresh load instead of joining them.
+        """
+        self._probation = OrderedDict()
+        self._protected = OrderedDict()
+        self._inflight = {}
+        self._generation += 1
+
+
+def _retrieve_exception(task: asyncio.Future[_Rows]) -> None:
+    """Mark a finished load's exception as retrieved."""
+    if not task.cancelled():
+        task.exception()
@@ -10,6 +10,7 @@ using Milvus Lite as the storage backend. It supports:
 from __future__ import annotations
 
 import logging
+from collections import Counter
 from pathlib import Path
 from types import TracebackType
 from typing import TYPE_CHECKING, Any
@@ -139,6 +140,8 @@ class MilvusCache:
         self.db_path: Path = Path(db_path).expanduser()
         self._client: MilvusClient | None = None
         self._embedding_service: EmbeddingService = EmbeddingService()
+        # Collections whose rows are known to carry name_lower
+        self._name_lower_checked: set[str] = set()
 
     @property
     def client(self) -> MilvusClient:
@@ -286,6 +289,36 @@ class MilvusCache:
 
         logger.info("Collection created: %s", entity_type)
 
+    def _backfill_name_lower(self, entity_type: str) -> None:
+        """Add name_lower to rows stored before store_entities() wrote it.
+
+        name_icontains filters match against name_lower, so rows without it
+        would silently drop out of substring searches. Runs once per
+        collection for the lifetime of the client.
+
+        Args:
+            entity_type: Collection to backfill
+        """
+        if entity_type in self._name_lower_checked:
+            return
+
+        try:
+            rows = self.client.query(
+                collection_name=entity_type,
+                filter="not exists name_lower",
+                output_fields=["*"],
+            )
+            if rows:
+                for row in rows:
+                    row["name_lower"] = row.get("name", "").lower()
+                self.client.upsert(collection_name=entity_type, data=rows)
+                self.client.flush(entity_type)
+                logger.info("Backfilled name_lower for %d rows in %s", len(rows), entity_type)
+        except Exception as e:
+            logger.warning("Could not backfill name_lower for %s: %s", entity_type, e)
+
+        self._name_lower_checked.add(entity_type)
+
     def _build_filter_expression(self, filters: dict[str, Any]) -> str:
         """Build Milvus filter expression from keyword filters.
 
@@ -296,11 +329,15 @@ class MilvusCache:
         - Range max: {"level_max": 6} -> 'level <= 6'
         - String values: {"school": "Evocation"} -> 'school == "Evocation"'
         - List values (IN): {"document": ["srd", "phb"]} -> 'document in ["srd", "phb"]'
+        - Case-insensitive substring: {"name_icontains": "Chain"}
+          -> 'name_lower like "%chain%"'
 
         Args:
             filters: Dictionary of field names to filter values.
                 Field names ending in '_min' are converted to >= operators.
                 Field names ending in '_max' are converted to <= operators.
+                Field names ending in '_icontains' match a substring against the
+                lowercased '<field>_lower' copy written by store_entities().
 
         Returns:
             Milvus filter expression string, or empty string if no filters.
@@ -311,6 +348,12 @@ class MilvusCache:
             if value is None:
                 continue
 
+            if field.endswith("_icontains"):
+                # Substring match against the lowercased copy of the field
+                needle = str(value).lower().replace("\\", "\\\\").replace('"', '\\"')
+                expressions.append(f'{field[:-10]}_lower like "%{needle}%"')
+                continue
+
             # Detect range filter suffixes and determine operator
             if field.endswith("_min"):
                 actual_field = field[:-4]  # Remove '_min' suffix
@@ -420,6 +463,8 @@ class MilvusCache:
             prepared = {
                 "slug": entity.get("slug", ""),
                 "name": entity.get("name", ""),
+                # Lowercased copy backing case-insensitive name_icontains filters
+                "name_lower": entity.get("name", "").lower(),
                 "embedding": embedding,
                 "source_api": entity.get("source_api", ""),
             }
@@ -462,6 +507,7 @@ class MilvusCache:
         self,
         entity_type: str,
         document: str | list[str] | None = None,
+        limit: int | None = None,
         **filters: Any,
     ) -> list[dict[str, Any]]:
         """Retrieve entities from cache by type with optional filters.
@@ -469,6 +515,7 @@ class MilvusCache:
         Args:
             entity_type: Type of entities to retrieve (e.g., 'spells', 'creatures')
             document: Optional document filter (string or list of strings)
+            limit: Optional maximum number of entities to return
             **filters: Optional keyword arguments for filtering entities
 
         Returns:
@@ -487,6 +534,9 @@ class MilvusCache:
             logger.debug("Could not get collection stats for %s: %s", entity_type, e)
             # Continue anyway - query will fail/return empty if collection doesn't exist
 
+        if "name_icontains" in filters:
+            self._backfill_name_lower(entity_type)
+
         # Add document to filters if provided
         if document is not None:
             filters["document"] = document
@@ -494,22 +544,18 @@ class MilvusCache:
         # Build filter expression
         filter_expr = self._build_filter_expression(filters)
 
+        # Empty filter requires limit in Milvus Lite, so default to a large one
+        query_limit = limit or (None if filter_expr else 10000)
+        query_kwargs: dict[str, Any] = {"limit": query_limit} if query_limit else {}
+
         # Query the collection
         try:
-            if filter_expr:
-                results = self.client.query(
-                    collection_name=entity_type,
-                    filter=filter_expr,
-                    output_fields=["*"],
-                )
-            else:
-                # Empty filter requires limit in Milvus Lite
-                results = self.client.query(
-                    collection_name=entity_type,
-                    filter="",
-                    output_fields=["*"],
-                    limit=10000,  # Large limit to get all entities
-                )
+            results = self.client.query(
+                collection_name=entity_type,
+                filter=filter_expr,
+                output_fields=["*"],
+                **query_kwargs,
+            )
         except Exception as e:
             logger.warning("Query failed for %s: %s", entity_type, e)
             return []
@@ -584,6 +630,8 @@ class MilvusCache:
         query_embedding = self._embedding_service.encode(query)
 
         # Step 2: Build scalar filter expression for hybrid search
+        if "name_icontains" in filters:
+            self._backfill_name_lower(entity_type)
         if document is not None:
             filters["document"] = document
         filter_expr = self._build_filter_expression(filters)
@@ -702,6 +750,35 @@ class MilvusCache:
 
         return metadata
 
+    async def get_all_document_metadata(self) -> dict[str, dict[str, int]]:
+        """Get entity counts per type for every document in a single pass.
+
+        Each collection is queried once for its document field, rather than once
+        per document as get_document_metadata() would need.
+
+        Returns:
+            Dictionary mapping document keys to entity counts per type.
+        """
+        metadata: dict[str, dict[str, int]] = {}
+
+        for collection_name in self.client.list_collections():
+            try:
+                results = self.client.query(
+                    collection_name=collection_name,
+                    filter='document != ""',
+                    output_fields=["document"],
+                )
+            except Exception as e:
+                logger.debug("Failed to query documents from %s: %s", collection_name, e)
+                continue
+
+            counts = Counter(result.get("document") for result in results)
+            for document_key, count in counts.items():
+                if document_key:
+                    metadata.setdefault(document_key, {})[collection_name] = count
+
+        return metadata
+
     async def get_cache_stats(self) -> dict[str, Any]:
         """Get overall cache statistics.
 
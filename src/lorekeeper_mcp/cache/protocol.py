@@ -25,6 +25,7 @@ class CacheProtocol(Protocol):
         self,
         entity_type: str,
         document: str | list[str] | None = None,
+        limit: int | None = None,
         **filters: Any,
     ) -> list[dict[str, Any]]:
         """Retrieve entities from cache by type with optional filters.
@@ -33,6 +34,7 @@ class CacheProtocol(Protocol):
             entity_type: Type of entities to retrieve (e.g., 'spells',
                 'creatures', 'equipment')
             document: Optional document filter (string or list of strings)
+            limit: Optional maximum number of entities to return
             **filters: Optional keyword arguments for filtering entities
                 by indexed fields (e.g., level=3, school="Evocation")
 
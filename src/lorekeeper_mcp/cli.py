@@ -70,7 +70,9 @@ def import_cmd(ctx: click.Context, file: Path, dry_run: bool, force: bool) -> No
     Parses the EDN-formatted file and imports entities into the local cache.
     Supports spells, creatures, classes, equipment, and more.
 
-    Uses the Milvus cache backend for storage.
+    Uses the Milvus cache backend for storage. A server that is already
+    running lists the imported documents once its 60-second document list
+    cache expires.
 
     Example:
         lorekeeper import MegaPak_-_WotC_Books.orcbrew
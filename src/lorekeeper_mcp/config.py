@@ -80,6 +80,10 @@ class Settings(BaseSettings):
         embedding_model: Name of sentence-transformers model for embeddings.
         cache_ttl_days: TTL for cached responses in days.
         error_cache_ttl_seconds: TTL for cached error responses in seconds.
+        result_cache_ttl_seconds: TTL for in-process tool result caches in seconds.
+        equipment_fetch_concurrency: Maximum concurrent upstream equipment fetches.
+        warm_rule_cache: Preload every rule type into the rule cache at startup.
+        warm_spell_cache: Prefetch the full spell list into the cache at startup.
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
         debug: Enable debug mode with verbose logging.
         open5e_base_url: Base URL for Open5e API.
@@ -99,6 +103,7 @@ class Settings(BaseSettings):
     # Cache TTL configuration
     cache_ttl_days: int = Field(default=7)
     error_cache_ttl_seconds: int = Field(default=300)
+    result_cache_ttl_seconds: int = Field(default=3600)
 
     # Logging configuration
     log_level: str = Field(default="INFO")
@@ -106,6 +111,9 @@ class Settings(BaseSettings):
 
     # API configuration
     open5e_base_url: str = Field(default="https://api.open5e.com")
+    equipment_fetch_concurrency: int = Field(default=8, ge=1)
+    warm_rule_cache: bool = Field(default=False)
+    warm_spell_cache: bool = Field(default=False)
 
     @field_validator("milvus_db_path", mode="before")
     @classmethod
@@ -5,6 +5,30 @@ from typing import Any, Protocol
 from lorekeeper_mcp.repositories.base import Repository
 
 
+def _split_filters(filters: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Translate repository filters into cache filters and API parameters.
+
+    ``name`` is a case-insensitive substring match. The cache runs it as a
+    ``name_icontains`` filter inside the Milvus query and the Open5e API as
+    ``name__icontains``, so matching rows are selected before ``limit`` is
+    applied. ``document`` is a cache-only filter and is not sent to the API.
+
+    Args:
+        filters: Repository-level filters, without limit
+
+    Returns:
+        Tuple of (cache filters, API parameters)
+    """
+    cache_filters = dict(filters)
+    name = cache_filters.pop("name", None)
+    api_filters = dict(cache_filters)
+    api_filters.pop("document", None)
+    if name:
+        cache_filters["name_icontains"] = name
+        api_filters["name__icontains"] = name
+    return cache_filters, api_filters
+
+
 class CharacterOptionClient(Protocol):
     """Protocol for character option API client."""
 
@@ -88,6 +112,7 @@ class CharacterOptionRepository(Repository[dict[str, Any]]):
             **filters: Must include 'option_type' (class, race, background,
                 feat, or condition). Other filters depend on type.
                 - search: Natural language search query (uses vector search)
+                - name: Case-insensitive substring match on the option name
 
         Returns:
             List of matching character options
@@ -128,6 +153,10 @@ class CharacterOptionRepository(Repository[dict[str, Any]]):
         """
         limit = filters.pop("limit", None)
         search_limit = limit or 20
+        cache_filters, _ = _split_filters(filters)
+        # Without semantic search the query becomes the name filter, unless
+        # the caller already filtered by name
+        fallback_filters, _ = _split_filters({"name": query, **filters})
 
         # Determine which collections to search
         type_to_collection = {
@@ -149,12 +178,12 @@ class CharacterOptionRepository(Repository[dict[str, Any]]):
         for collection_name in collections:
             try:
                 results = await self.cache.semantic_search(
-                    collection_name, query, limit=search_limit, **filters
+                    collection_name, query, limit=search_limit, **cache_filters
                 )
                 all_results.extend(results)
             except NotImplementedError:
                 # Fall back to structured search
-                cached = await self.cache.get_entities(collection_name, name=query, **filters)
+                cached = await self.cache.get_entities(collection_name, **fallback_filters)
                 all_results.extend(cached)
 
         return all_results[:limit] if limit else all_results
@@ -166,15 +195,13 @@ class CharacterOptionRepository(Repository[dict[str, Any]]):
 
         # Try cache first with valid filter fields only
         # Note: document filter is kept in filters for cache (cache-only filter)
-        cached = await self.cache.get_entities("classes", **filters)
+        cache_filters, api_filters = _split_filters(filters)
+        cached = await self.cache.get_entities("classes", **cache_filters)
 
         if cached:
             return cached[:limit] if limit else cached
 
         # Cache miss - fetch from API with filters and limit
-        api_filters = dict(filters)
-        # Remove document from API filters (cache-only filter)
-        api_filters.pop("document", None)
         classes: list[dict[str, Any]] = await self.client.get_classes_v2(limit=limit, **api_filters)
 
         if classes:
@@ -189,15 +216,13 @@ class CharacterOptionRepository(Repository[dict[str, Any]]):
 
         # Try cache first with valid filter fields only
         # Note: document filter is kept in filters for cache (cache-only filter)
-        cached = await self.cache.get_entities("races", **filters)
+        cache_filters, api_filters = _split_filters(filters)
+        cached = await self.cache.get_entities("races", **cache_filters)
 
         if cached:
             return cached[:limit] if limit else cached
 
         # Cache miss - fetch from API with filters and limit
-        api_filters = dict(filters)
-        # Remove document from API filters (cache-only filter)
-        api_filters.pop("document", None)
         races: list[dict[str, Any]] = await self.client.get_species(limit=limit, **api_filters)
 
         if races:
@@ -212,15 +237,13 @@ class CharacterOptionRepository(Repository[dict[str, Any]]):
 
         # Try cache first with valid filter fields only
         # Note: document filter is kept in filters for cache (cache-only filter)
-        cached = await self.cache.get_entities("backgrounds", **filters)
+        cache_filters, api_filters = _split_filters(filters)
+        cached = await self.cache.get_entities("backgrounds", **cache_filters)
 
         if cached:
             return cached[:limit] if limit else cached
 
         # Cache miss - fetch from API with filters and limit
-        api_filters = dict(filters)
-        # Remove document from API filters (cache-only filter)
-        api_filters.pop("document", None)
         backgrounds: list[dict[str, Any]] = await self.client.get_backgrounds(
             limit=limit, **api_filters
         )
@@ -243,16 +266,13 @@ class CharacterOptionRepository(Repository[dict[str, Any]]):
 
         # Try cache first with valid filter fields only
         # Note: document filter is kept in filters for cache (cache-only filter)
-        cached = await self.cache.get_entities("feats", **filters)
+        cache_filters, api_filters = _split_filters(filters)
+        cached = await self.cache.get_entities("feats", **cache_filters)
 
         if cached:
             return cached[:limit] if limit else cached
 
         # Cache miss - fetch from API with filters and limit
-        api_filters = dict(filters)
-        # Remove document from API filters (cache-only filter)
-        api_filters.pop("document", None)
-
         # Use provided client (Open5e v2 or test mock)
         feats: list[dict[str, Any]] = await self.client.get_feats(limit=api_limit, **api_filters)
 
@@ -268,15 +288,13 @@ class CharacterOptionRepository(Repository[dict[str, Any]]):
 
         # Try cache first with valid filter fields only
         # Note: document filter is kept in filters for cache (cache-only filter)
-        cached = await self.cache.get_entities("conditions", **filters)
+        cache_filters, api_filters = _split_filters(filters)
+        cached = await self.cache.get_entities("conditions", **cache_filters)
 
         if cached:
             return cached[:limit] if limit else cached
 
         # Cache miss - fetch from API with filters and limit
-        api_filters = dict(filters)
-        # Remove document from API filters (cache-only filter)
-        api_filters.pop("document", None)
         conditions: list[dict[str, Any]] = await self.client.get_conditions(
             limit=limit, **api_filters
         )
@@ -2,11 +2,16 @@
 
 from typing import Any, Protocol
 
+from pydantic import TypeAdapter
+
 from lorekeeper_mcp.api_clients.open5e_v1 import Open5eV1Client
 from lorekeeper_mcp.api_clients.open5e_v2 import Open5eV2Client
 from lorekeeper_mcp.models import Creature
 from lorekeeper_mcp.repositories.base import Repository
 
+# Built once so a whole page is validated or dumped in a single call
+_creature_list_adapter: TypeAdapter[list[Creature]] = TypeAdapter(list[Creature])
+
 
 class CreatureClient(Protocol):
     """Protocol for creature API client."""
@@ -72,13 +77,13 @@ class CreatureRepository(Repository[Creature]):
         cached = await self.cache.get_entities("creatures")
 
         if cached:
-            return [Creature.model_validate(creature) for creature in cached]
+            return _creature_list_adapter.validate_python(cached)
 
         # Cache miss - fetch from API
         creatures: list[Creature] = await self.client.get_creatures()
 
         # Store in cache
-        creature_dicts = [creature.model_dump() for creature in creatures]
+        creature_dicts = _creature_list_adapter.dump_python(creatures)
         await self.cache.store_entities(creature_dicts, "creatures")
 
         return creatures
@@ -131,10 +136,12 @@ class CreatureRepository(Repository[Creature]):
         cached = await self.cache.get_entities("creatures", **cache_filters)
 
         if cached:
-            results = [Creature.model_validate(creature) for creature in cached]
-            # Apply API-only filters client-side if needed
-            if api_only_filters:
-                results = self._apply_api_filters(results, **api_only_filters)
+            if not api_only_filters:
+                # Only validate the rows that will actually be returned
+                return _creature_list_adapter.validate_python(cached[:limit] if limit else cached)
+            # Apply API-only filters client-side, which needs every row as a model
+            results = _creature_list_adapter.validate_python(cached)
+            results = self._apply_api_filters(results, **api_only_filters)
             return results[:limit] if limit else results
 
         # Cache miss - fetch from API with filters
@@ -146,9 +153,11 @@ class CreatureRepository(Repository[Creature]):
 
         # Store in cache if we got results
         if creatures:
-            creature_dicts = [creature.model_dump() for creature in creatures]
+            creature_dicts = _creature_list_adapter.dump_python(creatures)
             await self.cache.store_entities(creature_dicts, "creatures")
-        return creatures
+
+        # Cache everything fetched, but never hand more than limit rows upward
+        return creatures[:limit] if limit else creatures
 
     async def _semantic_search(
         self,
@@ -185,8 +194,11 @@ class CreatureRepository(Repository[Creature]):
             cached = await self.cache.get_entities("creatures", **cache_filters)
             results = cached if cached else []
 
-        creatures = [Creature.model_validate(creature) for creature in results]
-        return creatures[:limit] if limit else creatures
+        # The structured fallback is not limited, so stop before validating extra rows
+        creatures: list[Creature] = _creature_list_adapter.validate_python(
+            results[:limit] if limit else results
+        )
+        return creatures
 
     def _map_to_api_params(self, **filters: Any) -> dict[str, Any]:
         """Map repository parameters to API-specific filter operators.
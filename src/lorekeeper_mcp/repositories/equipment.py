@@ -1,10 +1,174 @@
 """Repository for equipment with cache-aside pattern."""
 
+import asyncio
+import weakref
+from collections.abc import Awaitable, Callable, Sequence
+from itertools import chain
 from typing import Any, Protocol
 
+from pydantic import TypeAdapter
+
+from lorekeeper_mcp.config import settings
 from lorekeeper_mcp.models import Armor, MagicItem, Weapon
 from lorekeeper_mcp.repositories.base import Repository
 
+EquipmentItem = Weapon | Armor | MagicItem
+
+# Cache collection and list adapter for each item type. The adapters are
+# built once so a whole page is validated or dumped in a single call.
+_ITEM_TYPE_COLLECTIONS: dict[str, tuple[str, TypeAdapter[Any]]] = {
+    "weapon": ("weapons", TypeAdapter(list[Weapon])),
+    "armor": ("armor", TypeAdapter(list[Armor])),
+    "magic-item": ("magic-items", TypeAdapter(list[MagicItem])),
+}
+
+# Bounds upstream equipment fetches across concurrent searches, so parallel
+# tool calls queue here instead of waiting on the HTTP connection pool. A
+# semaphore only works on one event loop, so each running loop gets its own.
+_fetch_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+# Filters that only make sense for one item type. Filters not listed here
+# (document, limit, ...) are shared by every item type.
+_ITEM_TYPE_FILTERS: dict[str, frozenset[str]] = {
+    "weapon": frozenset(
+        {
+            "damage_dice",
+            "is_simple",
+            "cost_min",
+            "cost_max",
+            "weight_max",
+            "is_finesse",
+            "is_light",
+            "is_magic",
+        }
+    ),
+    "armor": frozenset({"cost_min", "cost_max"}),
+    "magic-item": frozenset({"rarity", "requires_attunement"}),
+}
+
+_TYPE_SPECIFIC_FILTERS = frozenset().union(*_ITEM_TYPE_FILTERS.values())
+
+
+def _fetch_semaphore() -> asyncio.Semaphore:
+    """Return the upstream fetch semaphore for the running event loop.
+
+    The semaphore is created on first use in each loop, sized from the
+    equipment_fetch_concurrency setting at that time.
+
+    Returns:
+        Semaphore shared by all equipment fetches on the running loop
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _fetch_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(settings.equipment_fetch_concurrency)
+        _fetch_semaphores[loop] = semaphore
+    return semaphore
+
+
+def _filters_for_item_type(item_type: str, filters: dict[str, Any]) -> dict[str, Any]:
+    """Drop filters that belong exclusively to other item types.
+
+    Args:
+        item_type: 'weapon', 'armor', or 'magic-item'
+        filters: Filters requested for the search
+
+    Returns:
+        Filters applicable to the given item type
+    """
+    applicable = _ITEM_TYPE_FILTERS[item_type]
+    return {
+        key: value
+        for key, value in filters.items()
+        if key not in _TYPE_SPECIFIC_FILTERS or key in applicable
+    }
+
+
+def _item_types_for_filters(item_types: list[str], filters: dict[str, Any]) -> list[str]:
+    """Keep only the item types that every requested type-specific filter applies to.
+
+    A filter such as rarity or damage_dice can only match items of the types it
+    belongs to, so searching other types would return unfiltered rows.
+
+    Args:
+        item_types: Item types requested for the search
+        filters: Filters requested for the search
+
+    Returns:
+        Item types worth searching, in their original order
+    """
+    requested = _TYPE_SPECIFIC_FILTERS.intersection(filters)
+    if not requested:
+        return item_types
+    return [
+        item_type
+        for item_type in item_types
+        if requested <= _ITEM_TYPE_FILTERS.get(item_type, frozenset())
+    ]
+
+
+def _to_cache_filters(filters: dict[str, Any]) -> dict[str, Any]:
+    """Translate repository filters to cache filter names.
+
+    ``name`` is a case-insensitive substring match, which the cache expresses
+    as ``name_icontains`` so the match runs inside the Milvus query.
+
+    Args:
+        filters: Repository-level filters
+
+    Returns:
+        Filters ready to pass to the cache
+    """
+    if "name" not in filters:
+        return filters
+    cache_filters = dict(filters)
+    cache_filters["name_icontains"] = cache_filters.pop("name")
+    return cache_filters
+
+
+async def _merge_with_quotas(
+    item_types: list[str],
+    limit: int | None,
+    search: Callable[[str, int | None], Awaitable[list[EquipmentItem]]],
+) -> list[EquipmentItem]:
+    """Search several item types concurrently and merge results up to limit.
+
+    Each type is asked for the full limit, so types that come back short are
+    made up from the others without a second search, which would only be
+    answered from the rows the first one cached. Each type gets an even share
+    of the limit first, then any shortfall is filled in item type order.
+
+    Args:
+        item_types: Item types to search, in result order
+        limit: Maximum merged results, or None for no cap
+        search: Coroutine function searching one item type with a limit
+
+    Returns:
+        Merged list of equipment items, capped at limit
+    """
+    if not item_types:
+        return []
+    batches = await asyncio.gather(*(search(item_type, limit) for item_type in item_types))
+    if not limit:
+        return list(chain.from_iterable(batches))
+
+    share, extra = divmod(limit, len(item_types))
+    takes = [min(len(batch), share + (index < extra)) for index, batch in enumerate(batches)]
+    shortfall = limit - sum(takes)
+    for index, batch in enumerate(batches):
+        if shortfall <= 0:
+            break
+        # Types with rows beyond their share make up for the short ones
+        more = min(len(batch) - takes[index], shortfall)
+        takes[index] += more
+        shortfall -= more
+
+    return list(
+        chain.from_iterable(batch[:take] for batch, take in zip(batches, takes, strict=True))
+    )
+
 
 class EquipmentClient(Protocol):
     """Protocol for equipment API client."""
@@ -71,21 +235,7 @@ class EquipmentRepository(Repository[Weapon | Armor | MagicItem]):
         Returns:
             List of all Weapon objects
         """
-        # Try cache first
-        cached = await self.cache.get_entities("weapons")
-
-        if cached:
-            return [Weapon.model_validate(weapon) for weapon in cached]
-
-        # Cache miss - fetch from API
-        weapons: list[Weapon] = await self.client.get_weapons()
-
-        # Store in cache
-        # Store in cache
-        weapon_dicts = [weapon.model_dump() for weapon in weapons]
-        await self.cache.store_entities(weapon_dicts, "weapons")
-
-        return weapons
+        return await self._get_item_type("weapon")  # type: ignore[return-value]
 
     async def get_armor(self) -> list[Armor]:
         """Retrieve all armor using cache-aside pattern.
@@ -93,21 +243,7 @@ class EquipmentRepository(Repository[Weapon | Armor | MagicItem]):
         Returns:
             List of all Armor objects
         """
-        # Try cache first
-        cached = await self.cache.get_entities("armor")
-
-        if cached:
-            return [Armor.model_validate(armor) for armor in cached]
-
-        # Cache miss - fetch from API
-        armors: list[Armor] = await self.client.get_armor()
-
-        # Store in cache
-        # Store in cache
-        armor_dicts = [armor.model_dump() for armor in armors]
-        await self.cache.store_entities(armor_dicts, "armor")
-
-        return armors
+        return await self._get_item_type("armor")  # type: ignore[return-value]
 
     async def get_magic_items(self) -> list[MagicItem]:
         """Retrieve all magic items using cache-aside pattern.
@@ -115,44 +251,60 @@ class EquipmentRepository(Repository[Weapon | Armor | MagicItem]):
         Returns:
             List of all MagicItem objects
         """
-        # Try cache first
-        cached = await self.cache.get_entities("magic-items")
+        return await self._get_item_type("magic-item")  # type: ignore[return-value]
 
-        if cached:
-            return [MagicItem.model_validate(item) for item in cached]
+    async def _get_item_type(self, item_type: str) -> list[Weapon | Armor | MagicItem]:
+        """Retrieve every item of one type using cache-aside pattern.
+
+        Args:
+            item_type: 'weapon', 'armor', or 'magic-item'
 
-        # Cache miss - fetch from API
-        items: list[dict[str, Any]] = await self.client.get_magic_items()
+        Returns:
+            List of all equipment items of the given type
+        """
+        collection_name, adapter = _ITEM_TYPE_COLLECTIONS[item_type]
+
+        # Try cache first
+        cached = await self.cache.get_entities(collection_name)
 
-        # Convert to MagicItem objects
-        magic_items = [MagicItem.model_validate(item) for item in items]
+        if cached:
+            models: list[Weapon | Armor | MagicItem] = adapter.validate_python(cached)
+            return models
 
-        # Store in cache
-        item_dicts = [item.model_dump() for item in magic_items]
-        await self.cache.store_entities(item_dicts, "magic-items")
+        # Cache miss - fetch from API and store in cache
+        items = await self._fetch_item_type(item_type)
+        if items:
+            await self.cache.store_entities(adapter.dump_python(items), collection_name)
 
-        return magic_items
+        return items
 
     async def get_all(self) -> list[Weapon | Armor | MagicItem]:
         """Retrieve all equipment (weapons, armor, and magic items).
 
+        The three item types are fetched concurrently, so a cold cache costs
+        one round-trip of latency rather than three.
+
         Returns:
             List of all Weapon, Armor, and MagicItem objects
         """
-        weapons = await self.get_weapons()
-        armors = await self.get_armor()
-        magic_items = await self.get_magic_items()
-        return weapons + armors + magic_items
+        weapons, armors, magic_items = await asyncio.gather(
+            self.get_weapons(), self.get_armor(), self.get_magic_items()
+        )
+        return [*weapons, *armors, *magic_items]
 
     async def search(self, **filters: Any) -> list[Weapon | Armor | MagicItem]:
         """Search for equipment with optional filters using cache-aside pattern.
 
-        Supports both structured filtering and semantic search.
+        Supports both structured filtering and semantic search. Passing a list
+        of item types searches each of them concurrently and merges the results
+        up to ``limit``. Types that a requested type-specific filter does not
+        apply to (for example armor when rarity is set) are skipped.
 
         Args:
             **filters: Optional filters:
                 - search: Natural language search query (uses vector search)
-                - item_type: 'weapon', 'armor', or 'magic-item'
+                - item_type: 'weapon', 'armor', 'magic-item', or a list of them
+                - name: Case-insensitive substring match on the item name
                 - document: Filter by source document
                 - limit: Maximum results to return
 
@@ -165,165 +317,160 @@ class EquipmentRepository(Repository[Weapon | Armor | MagicItem]):
         if search:
             return await self._semantic_search(search, item_type=item_type, **filters)
 
-        if item_type == "armor":
-            return await self._search_armor(**filters)  # type: ignore[return-value]
-        if item_type == "magic-item":
-            return await self._search_magic_items(**filters)  # type: ignore[return-value]
-        return await self._search_weapons(**filters)  # type: ignore[return-value]
+        if isinstance(item_type, list | tuple):
+            item_types = _item_types_for_filters(list(item_type), filters)
+            return await self._search_item_types(item_types, **filters)
 
-    async def _semantic_search(
-        self,
-        query: str,
-        item_type: str | None = None,
-        **filters: Any,
+        return await self._search_item_type(item_type or "weapon", **filters)
+
+    async def _search_item_type(
+        self, item_type: str, **filters: Any
     ) -> list[Weapon | Armor | MagicItem]:
-        """Perform semantic search for equipment.
+        """Search a single item type with the filters applicable to it.
 
         Args:
-            query: Natural language search query
-            item_type: Optional item type filter
-            **filters: Additional scalar filters
+            item_type: 'weapon', 'armor', or 'magic-item'
+            **filters: Search filters, including limit
 
         Returns:
-            List of equipment items ranked by semantic similarity
+            List of equipment items of the given type
         """
-        limit = filters.pop("limit", None)
-        search_limit = limit or 20
-
-        # Determine which collections to search
-        if item_type == "armor":
-            collections: list[tuple[str, type[Weapon] | type[Armor] | type[MagicItem]]] = [
-                ("armor", Armor)
-            ]
-        elif item_type == "magic-item":
-            collections = [("magic-items", MagicItem)]
-        elif item_type == "weapon":
-            collections = [("weapons", Weapon)]
-        else:
-            # Search all equipment types
-            collections = [
-                ("weapons", Weapon),
-                ("armor", Armor),
-                ("magic-items", MagicItem),
-            ]
-
-        all_results: list[Weapon | Armor | MagicItem] = []
-
-        for collection_name, model_class in collections:
-            try:
-                results = await self.cache.semantic_search(
-                    collection_name, query, limit=search_limit, **filters
-                )
-                all_results.extend(model_class.model_validate(r) for r in results)
-            except NotImplementedError:
-                # Fall back to structured search
-                cached = await self.cache.get_entities(collection_name, name=query, **filters)
-                all_results.extend(model_class.model_validate(r) for r in cached)
-
-        return all_results[:limit] if limit else all_results
-
-    async def _search_weapons(self, **filters: Any) -> list[Weapon]:
-        """Search for weapons with optional filters.
-
-        Args:
-            **filters: Optional weapon filters
+        if item_type not in _ITEM_TYPE_FILTERS:
+            item_type = "weapon"
+        filters = _filters_for_item_type(item_type, filters)
+        collection_name, adapter = _ITEM_TYPE_COLLECTIONS[item_type]
 
-        Returns:
-            List of Weapon objects matching the filters
-        """
         # Extract limit parameter (not a cache filter field)
         limit = filters.pop("limit", None)
 
-        # Try cache first with valid filter fields only
-        # (document is kept in filters for cache filtering)
-        cached = await self.cache.get_entities("weapons", **filters)
+        # Try cache first (document is kept in filters for cache filtering)
+        cached = await self.cache.get_entities(collection_name, **_to_cache_filters(filters))
 
         if cached:
-            results = [Weapon.model_validate(weapon) for weapon in cached]
-            return results[:limit] if limit else results
+            # Only validate the rows that will actually be returned
+            models: list[Weapon | Armor | MagicItem] = adapter.validate_python(
+                cached[:limit] if limit else cached
+            )
+            return models
 
         # Cache miss - fetch from API with filters and limit
         # Remove document from API filters (cache-only filter)
         api_filters = dict(filters)
         api_filters.pop("document", None)
-        weapons = await self.client.get_weapons(limit=limit, **api_filters)
+        items = await self._fetch_item_type(item_type, limit=limit, **api_filters)
 
         # Store in cache if we got results
-        if weapons:
-            # Convert to dicts for caching
-            weapon_dicts = [weapon.model_dump() for weapon in weapons]
-            await self.cache.store_entities(weapon_dicts, "weapons")
+        if items:
+            await self.cache.store_entities(adapter.dump_python(items), collection_name)
 
-        # Return the weapons
-        return weapons
+        # Cache everything fetched, but never hand more than limit rows upward
+        return items[:limit] if limit else items
 
-    async def _search_armor(self, **filters: Any) -> list[Armor]:
-        """Search for armor with optional filters.
+    async def _fetch_item_type(
+        self, item_type: str, **api_filters: Any
+    ) -> list[Weapon | Armor | MagicItem]:
+        """Fetch one item type from the API client as models.
 
         Args:
-            **filters: Optional armor filters
+            item_type: 'weapon', 'armor', or 'magic-item'
+            **api_filters: Filters passed through to the client
 
         Returns:
-            List of Armor objects matching the filters
+            List of equipment models returned by the API
         """
-        # Extract limit parameter (not a cache filter field)
-        limit = filters.pop("limit", None)
-
-        # Try cache first with valid filter fields only
-        # (document is kept in filters for cache filtering)
-        cached = await self.cache.get_entities("armor", **filters)
+        fetched: Sequence[Any]
+        async with _fetch_semaphore():
+            if item_type == "armor":
+                fetched = await self.client.get_armor(**api_filters)
+            elif item_type == "magic-item":
+                # Magic items arrive as raw dicts
+                fetched = await self.client.get_magic_items(**api_filters)
+            else:
+                fetched = await self.client.get_weapons(**api_filters)
+
+        _, adapter = _ITEM_TYPE_COLLECTIONS[item_type]
+        models: list[Weapon | Armor | MagicItem] = adapter.validate_python(fetched)
+        return models
+
+    async def _search_item_types(
+        self, item_types: list[str], **filters: Any
+    ) -> list[Weapon | Armor | MagicItem]:
+        """Search several item types concurrently and merge the results.
 
-        if cached:
-            results = [Armor.model_validate(armor) for armor in cached]
-            return results[:limit] if limit else results
+        Args:
+            item_types: Item types to search, in result order
+            **filters: Search filters, including limit
 
-        # Cache miss - fetch from API with filters and limit
-        # Remove document from API filters (cache-only filter)
-        api_filters = dict(filters)
-        api_filters.pop("document", None)
-        armors = await self.client.get_armor(limit=limit, **api_filters)
+        Returns:
+            Merged list of equipment items, capped at limit
+        """
+        limit = filters.pop("limit", None)
 
-        # Store in cache if we got results
-        if armors:
-            # Convert to dicts for caching
-            armor_dicts = [armor.model_dump() for armor in armors]
-            await self.cache.store_entities(armor_dicts, "armor")
+        async def search(item_type: str, type_limit: int | None) -> list[EquipmentItem]:
+            return await self._search_item_type(item_type, limit=type_limit, **filters)
 
-        # Return the armor
-        return armors
+        return await _merge_with_quotas(item_types, limit, search)
 
-    async def _search_magic_items(self, **filters: Any) -> list[MagicItem]:
-        """Search for magic items with optional filters.
+    async def _semantic_search(
+        self,
+        query: str,
+        item_type: str | list[str] | None = None,
+        **filters: Any,
+    ) -> list[Weapon | Armor | MagicItem]:
+        """Perform semantic search for equipment.
 
         Args:
-            **filters: Optional magic item filters
+            query: Natural language search query
+            item_type: Optional item type, or list of item types, to search
+            **filters: Additional scalar filters
 
         Returns:
-            List of MagicItem objects matching the filters
+            List of equipment items ranked by semantic similarity
         """
-        # Extract limit parameter (not a cache filter field)
         limit = filters.pop("limit", None)
 
-        # Try cache first with valid filter fields only
-        # (document is kept in filters for cache filtering)
-        cached = await self.cache.get_entities("magic-items", **filters)
+        # Determine which item types to search (all of them by default)
+        if isinstance(item_type, str) and item_type in _ITEM_TYPE_COLLECTIONS:
+            item_types = [item_type]
+        elif isinstance(item_type, list | tuple):
+            item_types = _item_types_for_filters(list(item_type), filters)
+        else:
+            item_types = _item_types_for_filters(list(_ITEM_TYPE_COLLECTIONS), filters)
 
-        if cached:
-            results = [MagicItem.model_validate(item) for item in cached]
-            return results[:limit] if limit else results
+        async def search(item_type: str, type_limit: int | None) -> list[EquipmentItem]:
+            return await self._semantic_search_item_type(
+                item_type, query, type_limit or 20, _filters_for_item_type(item_type, filters)
+            )
 
-        # Cache miss - fetch from API with filters and limit
-        # Remove document from API filters (cache-only filter)
-        api_filters = dict(filters)
-        api_filters.pop("document", None)
-        items: list[dict[str, Any]] = await self.client.get_magic_items(limit=limit, **api_filters)
+        return await _merge_with_quotas(item_types, limit, search)
 
-        # Convert to MagicItem objects
-        magic_items = [MagicItem.model_validate(item) for item in items]
+    async def _semantic_search_item_type(
+        self,
+        item_type: str,
+        query: str,
+        limit: int,
+        filters: dict[str, Any],
+    ) -> list[Weapon | Armor | MagicItem]:
+        """Perform semantic search within a single item type's collection.
 
-        # Store in cache if we got results
-        if magic_items:
-            item_dicts = [item.model_dump() for item in magic_items]
-            await self.cache.store_entities(item_dicts, "magic-items")
+        Args:
+            item_type: 'weapon', 'armor', or 'magic-item'
+            query: Natural language search query
+            limit: Maximum results to return
+            filters: Scalar filters applicable to the item type
 
-        return magic_items
+        Returns:
+            List of equipment items ranked by semantic similarity
+        """
+        collection_name, adapter = _ITEM_TYPE_COLLECTIONS[item_type]
+        filters = _to_cache_filters(filters)
+        try:
+            results = await self.cache.semantic_search(
+                collection_name, query, limit=limit, **filters
+            )
+        except NotImplementedError:
+            # Fall back to structured search
+            results = await self.cache.get_entities(collection_name, name=query, **filters)
+        # The structured fallback is not limited, so stop before validating extra rows
+        models: list[Weapon | Armor | MagicItem] = adapter.validate_python(results[:limit])
+        return models
@@ -40,10 +40,12 @@ class RepositoryFactory:
     instances. Supports optional client and cache overrides for testing.
 
     Uses the cache factory to create Milvus cache instances based on environment
-    configuration.
+    configuration. Repositories created without a client override share one
+    Open5eV2Client, so they also share its HTTP connection pool.
     """
 
     _cache_instance: _CacheProtocol | None = None
+    _client_instance: Open5eV2Client | None = None
 
     @staticmethod
     def _get_cache() -> _CacheProtocol:
@@ -68,6 +70,33 @@ class RepositoryFactory:
         """
         RepositoryFactory._cache_instance = None
 
+    @staticmethod
+    def get_client() -> Open5eV2Client:
+        """Get or create the shared Open5e v2 API client.
+
+        Returns:
+            The Open5eV2Client shared by all factory-built repositories.
+        """
+        if RepositoryFactory._client_instance is None:
+            RepositoryFactory._client_instance = Open5eV2Client()
+        return RepositoryFactory._client_instance
+
+    @staticmethod
+    def reset_client() -> None:
+        """Reset the shared API client instance without closing it.
+
+        Useful for testing, where each event loop needs its own HTTP client.
+        """
+        RepositoryFactory._client_instance = None
+
+    @staticmethod
+    async def close_client() -> None:
+        """Close the shared API client's connections and reset it."""
+        client = RepositoryFactory._client_instance
+        RepositoryFactory._client_instance = None
+        if client is not None:
+            await client.close()
+
     @staticmethod
     def create_spell_repository(
         client: Any | None = None, cache: _CacheProtocol | None = None
@@ -75,14 +104,14 @@ class RepositoryFactory:
         """Create a SpellRepository instance.
 
         Args:
-            client: Optional custom client instance. Defaults to Open5eV2Client.
+            client: Optional custom client instance. Defaults to the shared Open5eV2Client.
             cache: Optional custom cache instance. Defaults to cache from config.
 
         Returns:
             A configured SpellRepository instance.
         """
         if client is None:
-            client = Open5eV2Client()
+            client = RepositoryFactory.get_client()
         if cache is None:
             cache = RepositoryFactory._get_cache()
         return SpellRepository(client=client, cache=cache)
@@ -94,14 +123,14 @@ class RepositoryFactory:
         """Create a CreatureRepository instance.
 
         Args:
-            client: Optional custom client instance. Defaults to Open5eV2Client.
+            client: Optional custom client instance. Defaults to the shared Open5eV2Client.
             cache: Optional custom cache instance. Defaults to cache from config.
 
         Returns:
             A configured CreatureRepository instance.
         """
         if client is None:
-            client = Open5eV2Client()
+            client = RepositoryFactory.get_client()
         if cache is None:
             cache = RepositoryFactory._get_cache()
         return CreatureRepository(client=client, cache=cache)
@@ -113,14 +142,14 @@ class RepositoryFactory:
         """Create an EquipmentRepository instance.
 
         Args:
-            client: Optional custom client instance. Defaults to Open5eV2Client.
+            client: Optional custom client instance. Defaults to the shared Open5eV2Client.
             cache: Optional custom cache instance. Defaults to cache from config.
 
         Returns:
             A configured EquipmentRepository instance.
         """
         if client is None:
-            client = Open5eV2Client()
+            client = RepositoryFactory.get_client()
         if cache is None:
             cache = RepositoryFactory._get_cache()
         return EquipmentRepository(client=client, cache=cache)  # type: ignore[arg-type]
@@ -132,14 +161,14 @@ class RepositoryFactory:
         """Create a CharacterOptionRepository instance.
 
         Args:
-            client: Optional custom client instance. Defaults to Open5eV2Client.
+            client: Optional custom client instance. Defaults to the shared Open5eV2Client.
             cache: Optional custom cache instance. Defaults to cache from config.
 
         Returns:
             A configured CharacterOptionRepository instance.
         """
         if client is None:
-            client = Open5eV2Client()
+            client = RepositoryFactory.get_client()
         if cache is None:
             cache = RepositoryFactory._get_cache()
         return CharacterOptionRepository(client=client, cache=cache)
@@ -151,14 +180,14 @@ class RepositoryFactory:
         """Create a RuleRepository instance.
 
         Args:
-            client: Optional custom client instance. Defaults to Open5eV2Client.
+            client: Optional custom client instance. Defaults to the shared Open5eV2Client.
             cache: Optional custom cache instance. Defaults to cache from config.
 
         Returns:
             A configured RuleRepository instance.
         """
         if client is None:
-            client = Open5eV2Client()
+            client = RepositoryFactory.get_client()
         if cache is None:
             cache = RepositoryFactory._get_cache()
         return RuleRepository(client=client, cache=cache)
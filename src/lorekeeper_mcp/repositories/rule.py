@@ -1,9 +1,65 @@
 """Repository for rules with cache-aside pattern."""
 
+from collections.abc import Awaitable, Callable
+from itertools import islice
 from typing import Any, Protocol
 
 from lorekeeper_mcp.repositories.base import Repository
 
+# Cache collection holding each rule type
+_RULE_TYPE_COLLECTIONS: dict[str, str] = {
+    "rule": "rules",
+    "condition": "conditions",
+    "damage-type": "damagetypes",
+    "weapon-property": "weapon_properties",
+    "skill": "skills",
+    "ability-score": "ability_scores",
+    "magic-school": "magic_schools",
+    "language": "languages",
+    "proficiency": "proficiencies",
+    "alignment": "alignments",
+}
+
+# RuleRepository method handling structured search for each rule type, so
+# search() dispatches with one dict lookup instead of a chain of comparisons
+_RULE_TYPE_SEARCHES: dict[str, str] = {
+    "rule": "_search_rules",
+    "condition": "_search_conditions",
+    "damage-type": "_search_damage_types",
+    "weapon-property": "_search_weapon_properties",
+    "skill": "_search_skills",
+    "ability-score": "_search_ability_scores",
+    "magic-school": "_search_magic_schools",
+    "language": "_search_languages",
+    "proficiency": "_search_proficiencies",
+    "alignment": "_search_alignments",
+}
+
+
+def _filter_by_name(
+    results: list[dict[str, Any]], name: str | None, limit: int | None
+) -> list[dict[str, Any]]:
+    """Apply a case-insensitive name substring filter and limit.
+
+    Names are compared with str.casefold(), which also folds characters that
+    lower() leaves distinct. The needle is folded once, and matching stops as
+    soon as ``limit`` results are found instead of filtering the whole list
+    and slicing afterwards.
+
+    Args:
+        results: Rule entities to filter
+        name: Optional substring to match against each entity name
+        limit: Optional maximum number of results
+
+    Returns:
+        Matching entities, at most ``limit`` of them
+    """
+    if not name:
+        return results[:limit] if limit else results
+    needle = name.casefold()
+    matches = (r for r in results if needle in r.get("name", "").casefold())
+    return list(islice(matches, limit or None))
+
 
 class RuleClient(Protocol):
     """Protocol for rule API client."""
@@ -115,27 +171,11 @@ class RuleRepository(Repository[dict[str, Any]]):
         if search:
             return await self._semantic_search(search, rule_type=rule_type, **filters)
 
-        if rule_type == "rule":
-            return await self._search_rules(**filters)
-        if rule_type == "condition":
-            return await self._search_conditions(**filters)
-        if rule_type == "damage-type":
-            return await self._search_damage_types(**filters)
-        if rule_type == "weapon-property":
-            return await self._search_weapon_properties(**filters)
-        if rule_type == "skill":
-            return await self._search_skills(**filters)
-        if rule_type == "ability-score":
-            return await self._search_ability_scores(**filters)
-        if rule_type == "magic-school":
-            return await self._search_magic_schools(**filters)
-        if rule_type == "language":
-            return await self._search_languages(**filters)
-        if rule_type == "proficiency":
-            return await self._search_proficiencies(**filters)
-        if rule_type == "alignment":
-            return await self._search_alignments(**filters)
-        return []
+        method_name = _RULE_TYPE_SEARCHES.get(rule_type)
+        if method_name is None:
+            return []
+        search_type: Callable[..., Awaitable[list[dict[str, Any]]]] = getattr(self, method_name)
+        return await search_type(**filters)
 
     async def _semantic_search(
         self,
@@ -156,25 +196,11 @@ class RuleRepository(Repository[dict[str, Any]]):
         limit = filters.pop("limit", None)
         search_limit = limit or 20
 
-        # Map rule types to collection names
-        type_to_collection = {
-            "rule": "rules",
-            "condition": "conditions",
-            "damage-type": "damagetypes",
-            "weapon-property": "weapon_properties",
-            "skill": "skills",
-            "ability-score": "ability_scores",
-            "magic-school": "magic_schools",
-            "language": "languages",
-            "proficiency": "proficiencies",
-            "alignment": "alignments",
-        }
-
-        if rule_type and rule_type in type_to_collection:
-            collections = [type_to_collection[rule_type]]
+        if rule_type and rule_type in _RULE_TYPE_COLLECTIONS:
+            collections = [_RULE_TYPE_COLLECTIONS[rule_type]]
         else:
             # Search all rule types
-            collections = list(type_to_collection.values())
+            collections = list(_RULE_TYPE_COLLECTIONS.values())
 
         all_results: list[dict[str, Any]] = []
 
@@ -236,12 +262,7 @@ class RuleRepository(Repository[dict[str, Any]]):
 
             results = damage_types
 
-        # Client-side filtering by name if requested
-        if name:
-            name_lower = name.lower()
-            results = [r for r in results if name_lower in r.get("name", "").lower()]
-
-        return results[:limit] if limit else results
+        return _filter_by_name(results, name, limit)
 
     async def _search_skills(self, **filters: Any) -> list[dict[str, Any]]:
         """Search for skills."""
@@ -263,12 +284,7 @@ class RuleRepository(Repository[dict[str, Any]]):
 
             results = skills
 
-        # Client-side filtering by name if requested
-        if name:
-            name_lower = name.lower()
-            results = [r for r in results if name_lower in r.get("name", "").lower()]
-
-        return results[:limit] if limit else results
+        return _filter_by_name(results, name, limit)
 
     async def _search_conditions(self, **filters: Any) -> list[dict[str, Any]]:
         """Search for conditions."""
@@ -292,12 +308,7 @@ class RuleRepository(Repository[dict[str, Any]]):
 
             results = conditions
 
-        # Client-side filtering by name if requested
-        if name:
-            name_lower = name.lower()
-            results = [r for r in results if name_lower in r.get("name", "").lower()]
-
-        return results[:limit] if limit else results
+        return _filter_by_name(results, name, limit)
 
     async def _search_weapon_properties(self, **filters: Any) -> list[dict[str, Any]]:
         """Search for weapon properties."""
@@ -342,12 +353,7 @@ class RuleRepository(Repository[dict[str, Any]]):
 
             results = ability_scores
 
-        # Client-side filtering by name if requested
-        if name:
-            name_lower = name.lower()
-            results = [r for r in results if name_lower in r.get("name", "").lower()]
-
-        return results[:limit] if limit else results
+        return _filter_by_name(results, name, limit)
 
     async def _search_magic_schools(self, **filters: Any) -> list[dict[str, Any]]:
         """Search for magic schools."""
@@ -2,9 +2,31 @@
 
 from typing import Any, Protocol
 
+from pydantic import TypeAdapter
+
 from lorekeeper_mcp.models import Spell
 from lorekeeper_mcp.repositories.base import Repository
 
+# Built once so a whole page is validated or dumped in a single call
+_spell_list_adapter: TypeAdapter[list[Spell]] = TypeAdapter(list[Spell])
+
+
+def _filter_by_class(spells: list[Spell], class_key: str) -> list[Spell]:
+    """Keep the spells available to a class.
+
+    Spell validation already lowercases every class name, so only the key is
+    folded, once, and each spell costs a single membership test.
+
+    Args:
+        spells: Spells to filter
+        class_key: Class name to match, in any case
+
+    Returns:
+        Spells whose classes include class_key, in their original order
+    """
+    wanted = class_key.lower()
+    return [spell for spell in spells if wanted in spell.classes]
+
 
 class SpellClient(Protocol):
     """Protocol for spell API client."""
@@ -70,13 +92,13 @@ class SpellRepository(Repository[Spell]):
         cached = await self.cache.get_entities("spells")
 
         if cached:
-            return [Spell.model_validate(spell) for spell in cached]
+            return _spell_list_adapter.validate_python(cached)
 
         # Cache miss - fetch from API
         spells: list[Spell] = await self.client.get_spells()
 
         # Store in cache
-        spell_dicts = [spell.model_dump() for spell in spells]
+        spell_dicts = _spell_list_adapter.dump_python(spells)
         await self.cache.store_entities(spell_dicts, "spells")
 
         return spells
@@ -107,18 +129,17 @@ class SpellRepository(Repository[Spell]):
             return await self._semantic_search(search, limit=limit, class_key=class_key, **filters)
 
         # Regular structured search (existing behavior)
-        cached = await self.cache.get_entities("spells", **filters)
+        cache_filters = dict(filters)
+        # The class filter runs client-side, so the cache can only cap plain queries
+        if limit and not class_key:
+            cache_filters["limit"] = limit
+        cached = await self.cache.get_entities("spells", **cache_filters)
 
         if cached:
-            results = [Spell.model_validate(spell) for spell in cached]
+            results = _spell_list_adapter.validate_python(cached)
             # Client-side filter by class_key if specified
             if class_key:
-                results = [
-                    spell
-                    for spell in results
-                    if hasattr(spell, "classes")
-                    and class_key.lower() in [c.lower() for c in spell.classes]
-                ]
+                results = _filter_by_class(results, class_key)
             return results[:limit] if limit else results
 
         # Cache miss - fetch from API with filters and limit
@@ -133,7 +154,7 @@ class SpellRepository(Repository[Spell]):
 
         # Store in cache if we got results
         if spells:
-            spell_dicts = [spell.model_dump() for spell in spells]
+            spell_dicts = _spell_list_adapter.dump_python(spells)
             await self.cache.store_entities(spell_dicts, "spells")
 
         return spells
@@ -168,16 +189,11 @@ class SpellRepository(Repository[Spell]):
                 query, limit=limit, class_key=class_key, **filters
             )
 
-        spells = [Spell.model_validate(spell) for spell in results]
+        spells = _spell_list_adapter.validate_python(results)
 
         # Apply class_key filter client-side if specified
         if class_key:
-            spells = [
-                spell
-                for spell in spells
-                if hasattr(spell, "classes")
-                and class_key.lower() in [c.lower() for c in spell.classes]
-            ]
+            spells = _filter_by_class(spells, class_key)
 
         return spells[:limit] if limit else spells
 
@@ -204,14 +220,9 @@ class SpellRepository(Repository[Spell]):
         cached = await self.cache.get_entities("spells", **filters)
 
         if cached:
-            results = [Spell.model_validate(spell) for spell in cached]
+            results = _spell_list_adapter.validate_python(cached)
             if class_key:
-                results = [
-                    spell
-                    for spell in results
-                    if hasattr(spell, "classes")
-                    and class_key.lower() in [c.lower() for c in spell.classes]
-                ]
+                results = _filter_by_class(results, class_key)
             return results[:limit] if limit else results
 
         return []
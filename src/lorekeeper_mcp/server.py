@@ -1,19 +1,28 @@
 """FastMCP server instance and lifecycle management."""
 
+import asyncio
+import contextlib
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from fastmcp import FastMCP
 
+from lorekeeper_mcp.config import settings
+from lorekeeper_mcp.repositories.factory import RepositoryFactory
 from lorekeeper_mcp.tools import (
     list_documents,
     search_all,
     search_character_option,
     search_creature,
+    search_creatures,
     search_equipment,
     search_rule,
+    search_rules,
     search_spell,
+    search_spells,
 )
+from lorekeeper_mcp.tools.search_rule import warm_up_rules
+from lorekeeper_mcp.tools.search_spell import warm_up_spells
 
 
 @asynccontextmanager
@@ -21,7 +30,21 @@ async def lifespan(app: FastMCP) -> AsyncGenerator[None]:
     """Initialize resources on startup, cleanup on shutdown."""
     # Milvus Lite initializes lazily on first cache access
     # No explicit init_db() needed
-    yield
+    # Warm caches in the background so startup is not blocked on the network
+    warm_ups: list[asyncio.Task[None]] = []
+    if settings.warm_rule_cache:
+        warm_ups.append(asyncio.create_task(warm_up_rules()))
+    if settings.warm_spell_cache:
+        warm_ups.append(asyncio.create_task(warm_up_spells()))
+    try:
+        yield
+    finally:
+        for warm_up in warm_ups:
+            warm_up.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await warm_up
+        # Release pooled keep-alive connections held by the shared API client
+        await RepositoryFactory.close_client()
 
 
 mcp = FastMCP(
@@ -32,7 +55,10 @@ mcp = FastMCP(
 mcp.tool()(list_documents)
 mcp.tool()(search_spell)
 mcp.tool()(search_creature)
+mcp.tool()(search_creatures)
 mcp.tool()(search_character_option)
 mcp.tool()(search_equipment)
 mcp.tool()(search_rule)
+mcp.tool()(search_rules)
+mcp.tool()(search_spells)
 mcp.tool()(search_all)
@@ -3,17 +3,20 @@
 from lorekeeper_mcp.tools.list_documents import list_documents
 from lorekeeper_mcp.tools.search_all import search_all
 from lorekeeper_mcp.tools.search_character_option import search_character_option
-from lorekeeper_mcp.tools.search_creature import search_creature
+from lorekeeper_mcp.tools.search_creature import search_creature, search_creatures
 from lorekeeper_mcp.tools.search_equipment import search_equipment
-from lorekeeper_mcp.tools.search_rule import search_rule
-from lorekeeper_mcp.tools.search_spell import search_spell
+from lorekeeper_mcp.tools.search_rule import search_rule, search_rules
+from lorekeeper_mcp.tools.search_spell import search_spell, search_spells
 
 __all__ = [
     "list_documents",
     "search_all",
     "search_character_option",
     "search_creature",
+    "search_creatures",
     "search_equipment",
     "search_rule",
+    "search_rules",
     "search_spell",
+    "search_spells",
 ]
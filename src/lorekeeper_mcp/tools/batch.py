@@ -0,0 +1,46 @@
+"""Shared execution for the batch search tools.
+
+search_creatures, search_rules and search_spells each run a list of queries
+through their single-query tool. Every query can cost an upstream Open5e
+request, so batches are capped in size and run a few queries at a time.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from pydantic import BaseModel
+
+# Most batch use cases (a party's classes, an encounter's CR bands) fit well within this
+MAX_BATCH_QUERIES = 20
+
+# Queries run concurrently in chunks of this size, bounding upstream fan-out per call
+BATCH_CONCURRENCY = 4
+
+
+async def run_batch(
+    search: Callable[..., Awaitable[list[dict[str, Any]]]],
+    queries: Sequence[BaseModel],
+) -> list[list[dict[str, Any]]]:
+    """Run a batch of queries through a single-query search tool.
+
+    Args:
+        search: Single-query tool coroutine function, called with each query's fields
+        queries: Query models whose fields match the parameters of search
+
+    Returns:
+        One result list per query, in the order of queries
+
+    Raises:
+        ValueError: If the batch holds more than MAX_BATCH_QUERIES queries
+    """
+    if len(queries) > MAX_BATCH_QUERIES:
+        raise ValueError(
+            f"Too many queries: {len(queries)}. A batch holds at most {MAX_BATCH_QUERIES}."
+        )
+
+    results: list[list[dict[str, Any]]] = []
+    for start in range(0, len(queries), BATCH_CONCURRENCY):
+        chunk = queries[start : start + BATCH_CONCURRENCY]
+        results.extend(await asyncio.gather(*(search(**query.model_dump()) for query in chunk)))
+    return results
@@ -1,14 +1,33 @@
 """Tool for listing available D&D content documents across all sources.
 
 This module provides document discovery functionality that shows all documents
-available in the cache across all sources (Open5e, OrcBrew).
+available in the cache across all sources (Open5e, OrcBrew). Results are kept
+in a short-lived in-process cache because the document set only changes when
+content is imported or fetched.
 """
 
+from operator import itemgetter
 from typing import Any
 
+from lorekeeper_mcp.cache.memory import ResultCache, make_cache_key
 from lorekeeper_mcp.cache.milvus import MilvusCache
 from lorekeeper_mcp.config import settings
 
+# Short TTL so documents imported by another process show up within a minute
+DOCUMENTS_CACHE_TTL_SECONDS = 60
+
+_documents_cache = ResultCache(maxsize=8, ttl=DOCUMENTS_CACHE_TTL_SECONDS)
+
+
+def clear_documents_cache() -> None:
+    """Clear the in-process list_documents result cache.
+
+    Call this after importing content in the same process so the next listing
+    reflects it. Imports from another process, such as the import command,
+    show up once DOCUMENTS_CACHE_TTL_SECONDS have passed.
+    """
+    _documents_cache.clear()
+
 
 async def list_documents(
     source: str | None = None,
@@ -53,32 +72,32 @@ async def list_documents(
 
     Note:
         This queries only the cache and does not make API calls. You must
-        populate your cache first using the build command.
+        populate your cache first using the build command. Listings are
+        reused for up to a minute, so newly imported documents can take that
+        long to appear.
     """
-    # Get cache instance - MilvusCache is the only supported backend
-    cache = MilvusCache(str(settings.milvus_db_path))
-
-    # Get list of available documents from cache
-    document_keys = await cache.get_available_documents()
 
-    # Build result with metadata for each document
-    enriched_documents: list[dict[str, Any]] = []
-    for doc_key in document_keys:
-        # Get entity counts per type for this document
-        metadata = await cache.get_document_metadata(doc_key)
+    async def load() -> list[dict[str, Any]]:
+        # Get cache instance - MilvusCache is the only supported backend
+        cache = MilvusCache(str(settings.milvus_db_path))
 
-        # Calculate total entity count
-        total_count = sum(metadata.values())
+        # Count entities per type for every document in one pass over the collections
+        metadata_by_document = await cache.get_all_document_metadata()
 
-        enriched: dict[str, Any] = {
-            "document": doc_key,
-            "entity_count": total_count,
-            "entity_types": metadata,
-        }
+        enriched_documents: list[dict[str, Any]] = [
+            {
+                "document": doc_key,
+                "entity_count": sum(metadata.values()),
+                "entity_types": metadata,
+            }
+            for doc_key, metadata in sorted(metadata_by_document.items())
+        ]
 
-        enriched_documents.append(enriched)
+        # Sort by entity count (highest first)
+        enriched_documents.sort(key=itemgetter("entity_count"), reverse=True)
 
-    # Sort by entity count (highest first)
-    enriched_documents.sort(key=lambda x: x["entity_count"], reverse=True)
+        return enriched_documents
 
-    return enriched_documents
+    documents = await _documents_cache.get_or_load(make_cache_key(source), load)
+    # Copy the rows so callers cannot edit the cached listing
+    return [{**doc, "entity_types": dict(doc["entity_types"])} for doc in documents]
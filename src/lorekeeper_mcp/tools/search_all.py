@@ -9,6 +9,7 @@ Architecture:
     - Supports searching across multiple content types
     - Handles limit distribution when searching multiple types
     - Semantic search is always enabled for better matching
+    - Memoizes results in an in-process segmented LRU cache
 
 Examples:
     Basic search:
@@ -24,18 +25,62 @@ Examples:
         results = await search_all(query="fireball", documents=["srd-5e"])
 """
 
+import asyncio
+from itertools import zip_longest
 from typing import Any
 
 from lorekeeper_mcp.api_clients.open5e_v2 import Open5eV2Client
+from lorekeeper_mcp.cache.memory import ResultCache, make_cache_key
+from lorekeeper_mcp.config import settings
+from lorekeeper_mcp.repositories.factory import RepositoryFactory
+
+# The unified search endpoint cannot filter by document, so document-restricted
+# searches fetch extra rows to still fill the limit after post-filtering
+_DOCUMENT_FILTER_OVERFETCH = 3
+
+# Popular queries such as "fireball" recur across sessions and the content is static
+_search_all_cache = ResultCache(maxsize=1024, ttl=settings.result_cache_ttl_seconds)
+
+
+def clear_search_all_cache() -> None:
+    """Clear the in-process unified search result cache."""
+    _search_all_cache.clear()
 
 
 def _get_open5e_client() -> Open5eV2Client:
-    """Get Open5eV2Client instance.
+    """Get the shared Open5eV2Client instance.
+
+    Reuses the client held by RepositoryFactory so unified searches share its
+    connection pool instead of opening new connections on every call.
 
     Returns:
         Open5eV2Client for unified search
     """
-    return Open5eV2Client()
+    return RepositoryFactory.get_client()
+
+
+def _filter_by_documents(
+    results: list[dict[str, Any]], documents: list[str]
+) -> list[dict[str, Any]]:
+    """Keep only results whose source document is in documents.
+
+    Args:
+        results: Unified search results
+        documents: Document keys to keep
+
+    Returns:
+        Results from the requested documents, in their original order
+    """
+    wanted = frozenset(documents)
+    filtered = []
+    for result in results:
+        document = result.get("document")
+        # v2 search results nest the document as {"key": ..., "name": ...}
+        if isinstance(document, dict):
+            document = document.get("key")
+        if document in wanted or result.get("document__slug") in wanted:
+            filtered.append(result)
+    return filtered
 
 
 async def search_all(
@@ -77,7 +122,8 @@ async def search_all(
             "Background", "Feat"]. Default None searches all content types.
         documents: Filter results to specific documents. Provide list of
             document names from list_documents() tool. Post-filters search
-            results by document field. Examples: ["srd-5e"], ["srd-5e", "tce"].
+            results by document field, fetching extra results upstream so the
+            limit can still be filled. Examples: ["srd-5e"], ["srd-5e", "tce"].
         limit: Maximum number of results to return (default 20)
 
     Returns:
@@ -88,46 +134,91 @@ async def search_all(
     Raises:
         ApiError: If the API request fails due to network issues or errors
     """
+    # limit=0 would still query every content type, so answer it here
+    if limit <= 0:
+        return []
+
     if documents is not None and len(documents) == 0:
         return []
 
+    # Surrounding whitespace never changes the search, so send and key on the trimmed
+    # query; case is kept because upstream ranking may depend on it
+    query = query.strip()
+
+    # Repeated content types would each trigger their own upstream search
+    if content_types:
+        content_types = list(dict.fromkeys(content_types))
+
+    # Content-type order decides result order, so keep it instead of sorting
+    cache_key = make_cache_key(
+        query,
+        ",".join(content_types) if content_types else None,
+        documents,
+        limit,
+    )
+
+    async def load() -> list[dict[str, Any]]:
+        return await _unified_search(query, content_types, documents, limit)
+
+    return await _search_all_cache.get_or_load(cache_key, load)
+
+
+async def _unified_search(
+    query: str,
+    content_types: list[str] | None,
+    documents: list[str] | None,
+    limit: int,
+) -> list[dict[str, Any]]:
+    """Run the unified search against Open5e without result caching.
+
+    Args:
+        query: Search term
+        content_types: Content types to search, or None for all types
+        documents: Document keys to keep, or None for all documents
+        limit: Maximum number of results to return
+
+    Returns:
+        Search results, at most limit of them
+    """
     client = _get_open5e_client()
+    fetch_limit = limit * _DOCUMENT_FILTER_OVERFETCH if documents else limit
 
     if content_types:
-        all_results: list[dict[str, Any]] = []
-        per_type_limit = limit // len(content_types)
-
-        for content_type in content_types:
-            results = await client.unified_search(
-                query=query,
-                fuzzy=True,
-                vector=True,
-                object_model=content_type,
-                limit=per_type_limit,
+        # Round up, and never below one, so every type is asked for a result
+        per_type_limit = max(1, -(-fetch_limit // len(content_types)))
+
+        # Per-type searches are independent requests, so issue them together
+        results_per_type = await asyncio.gather(
+            *(
+                client.unified_search(
+                    query=query,
+                    fuzzy=True,
+                    vector=True,
+                    object_model=content_type,
+                    limit=per_type_limit,
+                )
+                for content_type in content_types
             )
-            all_results.extend(results)
-
+        )
         if documents:
-            all_results = [
-                r
-                for r in all_results
-                if r.get("document") in documents or r.get("document__slug") in documents
+            results_per_type = [
+                _filter_by_documents(results, documents) for results in results_per_type
             ]
 
+        # Interleave per-type results so truncating to limit keeps every type's best hits
+        all_results: list[dict[str, Any]] = [
+            result for row in zip_longest(*results_per_type) for result in row if result is not None
+        ]
         return all_results[:limit]
 
     results = await client.unified_search(
         query=query,
         fuzzy=True,
         vector=True,
-        limit=limit,
+        limit=fetch_limit,
     )
 
     if documents:
-        results = [
-            r
-            for r in results
-            if r.get("document") in documents or r.get("document__slug") in documents
-        ]
+        results = _filter_by_documents(results, documents)
 
     return results[:limit]
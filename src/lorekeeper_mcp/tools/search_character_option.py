@@ -27,28 +27,43 @@ Examples:
         all_classes = await search_character_option(type="class")
         backgrounds = await search_character_option(type="background", search="soldier")"""
 
-from typing import Any, Literal, cast
+from functools import cache
+from typing import Any, Literal, cast, get_args
 
 from lorekeeper_mcp.repositories.character_option import CharacterOptionRepository
 from lorekeeper_mcp.repositories.factory import RepositoryFactory
 
 OptionType = Literal["class", "race", "background", "feat"]
 
+# Derived from OptionType so runtime validation cannot drift from the Literal
+VALID_OPTION_TYPES: frozenset[str] = frozenset(get_args(OptionType))
+_VALID_OPTION_TYPES_TEXT = ", ".join(sorted(VALID_OPTION_TYPES))
+
 _repository_context: dict[str, Any] = {}
 
 
+@cache
+def _default_repository() -> CharacterOptionRepository:
+    """Create the default repository once and reuse it for later calls.
+
+    Returns:
+        Shared CharacterOptionRepository built by RepositoryFactory.
+    """
+    return RepositoryFactory.create_character_option_repository()
+
+
 def _get_repository() -> CharacterOptionRepository:
     """Get character option repository, respecting test context.
 
-    Returns the repository from _repository_context if set, otherwise creates
-    a default CharacterOptionRepository using RepositoryFactory.
+    Returns the repository from _repository_context if set, otherwise returns
+    the shared default character option repository, creating it on first use.
 
     Returns:
         CharacterOptionRepository instance for character option lookups.
     """
     if "repository" in _repository_context:
         return cast(CharacterOptionRepository, _repository_context["repository"])
-    return RepositoryFactory.create_character_option_repository()
+    return _default_repository()
 
 
 async def search_character_option(
@@ -56,6 +71,7 @@ async def search_character_option(
     documents: list[str] | None = None,  # Replaces document_keys
     search: str | None = None,
     limit: int = 20,
+    name: str | None = None,
 ) -> list[dict[str, Any]]:
     """
     Retrieve D&D 5e character creation and advancement options.
@@ -76,6 +92,7 @@ async def search_character_option(
             elves = await search_character_option(type="race", search="elf")
             backgrounds = await search_character_option(type="background", search="soldier")
             feats = await search_character_option(type="feat", search="great")
+            archers = await search_character_option(type="feat", name="archer")
 
         With test context injection (testing):
             from lorekeeper_mcp.tools.search_character_option import _repository_context
@@ -120,6 +137,9 @@ async def search_character_option(
             "stealthy rogue", "divine magic healer"
         limit: Maximum number of results to return. Default 20, useful for limiting
             output or pagination. Examples: 1, 5, 50
+        name: Case-insensitive substring match on the option name. Applied by the
+            cache and the API before limit, so up to limit matches are returned.
+            Examples: "elf", "archer", "sage"
 
     Returns:
         List of option dictionaries. Structure varies by type:
@@ -161,20 +181,30 @@ async def search_character_option(
         ValueError: If type parameter is not one of the valid options
         ApiError: If the API request fails due to network issues or server errors
     """
-    valid_types = {"class", "race", "background", "feat"}
-    if type not in valid_types:
-        raise ValueError(f"Invalid type '{type}'. Must be one of: {', '.join(valid_types)}")
+    if type not in VALID_OPTION_TYPES:
+        raise ValueError(f"Invalid type '{type}'. Must be one of: {_VALID_OPTION_TYPES_TEXT}")
+
+    # Repositories read a limit of 0 as unlimited, so return early instead
+    if limit <= 0:
+        return []
+
+    # A blank name is no filter at all rather than a match on the empty string
+    if name is not None:
+        name = name.strip() or None
 
     repository = _get_repository()
 
     params: dict[str, Any] = {
-        "option_type": type,
-        "limit": limit,
+        key: value
+        for key, value in (
+            ("option_type", type),
+            ("limit", limit),
+            ("document", documents),
+            ("search", search),
+            ("name", name),
+        )
+        if value is not None
     }
-    if documents is not None:
-        params["document"] = documents
-    if search is not None:
-        params["search"] = search
 
     results: list[dict[str, Any]] = await repository.search(**params)
 
@@ -7,6 +7,8 @@ Architecture:
     - Uses CreatureRepository for cache-aside pattern with multi-source support
     - Repository manages cache automatically
     - Supports test context-based repository injection
+    - Memoizes serialized results in an in-process segmented LRU cache and coalesces
+      concurrent identical lookups into a single repository call
     - Handles Open5e v1 and D&D 5e API data normalization
     - Returns canonical Creature models from lorekeeper_mcp.models
 
@@ -25,28 +27,84 @@ Examples:
 
     Challenge rating queries:
         low_level = await search_creature(cr_max=2)
-        bosses = await search_creature(cr_min=10)"""
+        bosses = await search_creature(cr_min=10)
 
+    Several searches in one call:
+        batches = await search_creatures(
+            [CreatureQuery(cr=1), CreatureQuery(cr=3, type="undead")]
+        )"""
+
+from functools import cache
 from typing import Any, cast
 
+from pydantic import BaseModel, TypeAdapter
+
+from lorekeeper_mcp.cache.memory import ResultCache, make_cache_key
+from lorekeeper_mcp.config import settings
+from lorekeeper_mcp.models import Creature
 from lorekeeper_mcp.repositories.creature import CreatureRepository
 from lorekeeper_mcp.repositories.factory import RepositoryFactory
+from lorekeeper_mcp.tools.batch import run_batch
 
 _repository_context: dict[str, Any] = {}
 
+# Built once so serialization skips per-call schema lookups
+_creature_list_adapter: TypeAdapter[list[Creature]] = TypeAdapter(list[Creature])
+
+_creature_cache = ResultCache(maxsize=256, ttl=settings.result_cache_ttl_seconds)
+
+_DEFAULT_LIMIT = 20
+
+# Key for a call with no filters and the default limit
+_DEFAULT_BROWSE_KEY = make_cache_key(*(None,) * 9, _DEFAULT_LIMIT)
+
+
+class CreatureQuery(BaseModel):
+    """One search_creature query within a search_creatures batch.
+
+    Fields mirror the search_creature parameters of the same name.
+    """
+
+    cr: float | None = None
+    cr_min: float | None = None
+    cr_max: float | None = None
+    type: str | None = None
+    size: str | None = None
+    armor_class_min: int | None = None
+    hit_points_min: int | None = None
+    documents: list[str] | None = None
+    search: str | None = None
+    limit: int = _DEFAULT_LIMIT
+
+
+def clear_creature_cache() -> None:
+    """Clear the in-process creature result cache."""
+    _creature_cache.clear()
+
+
+@cache
+def _default_repository() -> CreatureRepository:
+    """Create the default repository once and reuse it for later calls.
+
+    Returns:
+        Shared CreatureRepository built by RepositoryFactory.
+    """
+    return RepositoryFactory.create_creature_repository()
+
 
 def _get_repository() -> CreatureRepository:
     """Get creature repository, respecting test context.
 
-    Returns the repository from _repository_context if set, otherwise creates
-    a default creature repository using RepositoryFactory.
+    Returns the repository from _repository_context if set, otherwise returns
+    the shared default creature repository, creating it on first use so its API
+    client keeps a single HTTP connection pool across calls.
 
     Returns:
         CreatureRepository instance for creature lookups.
     """
     if "repository" in _repository_context:
         return cast(CreatureRepository, _repository_context["repository"])
-    return RepositoryFactory.create_creature_repository()
+    return _default_repository()
 
 
 async def search_creature(
@@ -59,7 +117,7 @@ async def search_creature(
     hit_points_min: int | None = None,
     documents: list[str] | None = None,
     search: str | None = None,
-    limit: int = 20,
+    limit: int = _DEFAULT_LIMIT,
 ) -> list[dict[str, Any]]:
     """
     Search and retrieve D&D 5e creatures using the repository pattern.
@@ -176,30 +234,88 @@ async def search_creature(
      Raises:
          ApiError: If the API request fails due to network issues or server errors
     """
-    repository = _get_repository()
-
-    params: dict[str, Any] = {}
-    if cr is not None:
-        params["challenge_rating"] = float(cr)
-    if cr_min is not None:
-        params["cr_min"] = cr_min
-    if cr_max is not None:
-        params["cr_max"] = cr_max
-    if type is not None:
-        params["type"] = type
-    if size is not None:
-        params["size"] = size
-    if armor_class_min is not None:
-        params["armor_class_min"] = armor_class_min
-    if hit_points_min is not None:
-        params["hit_points_min"] = hit_points_min
-    if documents is not None:
-        params["document"] = documents
-    if search is not None:
-        params["search"] = search
-
-    creatures = await repository.search(limit=limit, **params)
-
-    creatures = creatures[:limit]
-
-    return [creature.model_dump() for creature in creatures]
+    # limit=0 would read as "no limit" in the repository, so answer it here
+    if limit <= 0:
+        return []
+
+    params: dict[str, Any] = {
+        key: value
+        for key, value in (
+            ("challenge_rating", float(cr) if cr is not None else None),
+            ("cr_min", cr_min),
+            ("cr_max", cr_max),
+            ("type", type),
+            ("size", size),
+            ("armor_class_min", armor_class_min),
+            ("hit_points_min", hit_points_min),
+            ("document", documents),
+            ("search", search),
+        )
+        if value is not None
+    }
+
+    # Unfiltered browsing is the most common call shape; reuse its prebuilt key
+    if not params and limit == _DEFAULT_LIMIT:
+        cache_key = _DEFAULT_BROWSE_KEY
+    else:
+        # Type and size keep their case: the Milvus cache compares them exactly
+        cache_key = make_cache_key(
+            cr,
+            cr_min,
+            cr_max,
+            type,
+            size,
+            armor_class_min,
+            hit_points_min,
+            documents,
+            search,
+            limit,
+        )
+
+    async def load() -> list[dict[str, Any]]:
+        repository = _get_repository()
+        creatures = await repository.search(limit=limit, **params)
+
+        # Serialize the whole page in one call instead of one model_dump() per row
+        results: list[dict[str, Any]] = _creature_list_adapter.dump_python(creatures[:limit])
+        return results
+
+    return await _creature_cache.get_or_load(cache_key, load)
+
+
+async def search_creatures(
+    queries: list[CreatureQuery],
+) -> list[list[dict[str, Any]]]:
+    """
+    Run several creature searches in one call.
+
+    Use this instead of repeated search_creature calls when one answer needs
+    several creature lists, such as CR 1, 3 and 5 undead for an encounter.
+    The searches run a few at a time, and identical queries in the batch share a
+    single lookup through the creature result cache.
+
+    Examples:
+        Several challenge ratings at once:
+            by_cr = await search_creatures(
+                [CreatureQuery(cr=1, type="undead"), CreatureQuery(cr=3, type="undead")]
+            )
+
+        Mixing semantic and structured queries:
+            results = await search_creatures(
+                [CreatureQuery(search="fire breathing"), CreatureQuery(size="Tiny", limit=5)]
+            )
+
+    Args:
+        queries: Creature queries to run. Each accepts the same filters as
+            search_creature (cr, cr_min, cr_max, type, size, armor_class_min,
+            hit_points_min, documents, search, limit). At most 20 queries per call.
+
+    Returns:
+        One list of creature dictionaries per query, in the order of queries.
+        Each list has the same shape as the search_creature result.
+
+    Raises:
+        ValueError: If queries holds more than 20 queries
+        ApiError: If an API request fails due to network issues or server errors
+    """
+    return await run_batch(search_creature, queries)
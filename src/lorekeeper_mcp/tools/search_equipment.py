@@ -9,6 +9,8 @@ Architecture:
     - Repository manages Milvus cache automatically
     - Supports test context-based repository injection
     - Handles weapon, armor, and magic item filtering
+    - Searches all item types through a single repository call for type="all"
+    - Memoizes serialized results in an in-process segmented LRU cache
 
 Examples:
     Default usage (automatically creates repository):
@@ -27,8 +29,14 @@ Examples:
         all_items = await search_equipment(type="all", name="chain")
         simple_weapons = await search_equipment(type="weapon", is_simple=True)"""
 
+from functools import cache
 from typing import Any, Literal, cast
 
+from pydantic import TypeAdapter
+
+from lorekeeper_mcp.cache.memory import ResultCache, make_cache_key
+from lorekeeper_mcp.config import settings
+from lorekeeper_mcp.models import Armor, MagicItem, Weapon
 from lorekeeper_mcp.repositories.equipment import EquipmentRepository
 from lorekeeper_mcp.repositories.factory import RepositoryFactory
 
@@ -36,19 +44,49 @@ _repository_context: dict[str, Any] = {}
 
 EquipmentType = Literal["weapon", "armor", "magic-item", "all"]
 
+_ALL_ITEM_TYPES = ("weapon", "armor", "magic-item")
+
+# Built once so serialization skips per-call schema lookups
+_equipment_list_adapter: TypeAdapter[list[Weapon | Armor | MagicItem]] = TypeAdapter(
+    list[Weapon | Armor | MagicItem]
+)
+
+_equipment_cache = ResultCache(maxsize=256, ttl=settings.result_cache_ttl_seconds)
+
+_DEFAULT_LIMIT = 20
+
+# Key for a type="all" call with no filters and the default limit
+_DEFAULT_BROWSE_KEY = make_cache_key("all", *(None,) * 13, _DEFAULT_LIMIT)
+
+
+def clear_equipment_cache() -> None:
+    """Clear the in-process equipment result cache."""
+    _equipment_cache.clear()
+
+
+@cache
+def _default_repository() -> EquipmentRepository:
+    """Create the default repository once and reuse it for later calls.
+
+    Returns:
+        Shared EquipmentRepository built by RepositoryFactory.
+    """
+    return RepositoryFactory.create_equipment_repository()
+
 
 def _get_repository() -> EquipmentRepository:
     """Get equipment repository, respecting test context.
 
-    Returns the repository from _repository_context if set, otherwise creates
-    a default EquipmentRepository using RepositoryFactory.
+    Returns the repository from _repository_context if set, otherwise returns
+    the shared default EquipmentRepository, creating it on first use so its API
+    client keeps a single HTTP connection pool across calls.
 
     Returns:
         EquipmentRepository instance for equipment lookups.
     """
     if "repository" in _repository_context:
         return cast(EquipmentRepository, _repository_context["repository"])
-    return RepositoryFactory.create_equipment_repository()
+    return _default_repository()
 
 
 async def search_equipment(
@@ -65,7 +103,8 @@ async def search_equipment(
     is_magic: bool | None = None,
     documents: list[str] | None = None,  # Replaces document and document_keys
     search: str | None = None,
-    limit: int = 20,
+    limit: int = _DEFAULT_LIMIT,
+    name: str | None = None,
 ) -> list[dict[str, Any]]:
     """
         Search and retrieve D&D 5e weapons, armor, and magic items using the repository pattern.
@@ -117,6 +156,9 @@ async def search_equipment(
                     type="all", search="chain"
                 )
 
+            Name matching (case-insensitive substring):
+                chain_armor = await search_equipment(type="armor", name="chain")
+
             Semantic search (natural language queries):
                 melee_weapons = await search_equipment(
                     type="weapon", search="slashing blade for close combat"
@@ -141,7 +183,9 @@ async def search_equipment(
                 - "weapon": Melee weapons (longsword, dagger, etc.) and ranged weapons (bow, crossbow)
                 - "armor": Protective gear (leather armor, chain mail, plate, etc.)
                 - "magic-item": Magical items (Bag of Holding, Wand of Fireballs, etc.)
-                - "all": Search all equipment types simultaneously (may return many results)
+                - "all": Search all equipment types simultaneously (may return many results).
+                  Type-specific filters narrow the search to the types they apply to,
+                  e.g. rarity searches only magic items and damage_dice only weapons.
             rarity: Magic item rarity filter (weapon/armor types don't use this).
                 Valid values: common, uncommon, rare, very rare, legendary, artifact
                 Example: "rare" for high-value magical items
@@ -177,6 +221,10 @@ async def search_equipment(
                  melee combat", "protective heavy armor", "magical wand for spells"
              limit: Maximum number of results to return. Default 20. For type="all" with many
                  matches, limit applies to total results. Examples: 5, 20, 100
+             name: Case-insensitive substring match on the item name, applied by the
+                 cache query or the API rather than after fetching. Surrounding
+                 whitespace is ignored.
+                 Examples: "chain" (Chain Mail, Chain Shirt), "sword"
 
         Returns:
             List of equipment dictionaries. Structure varies by type:
@@ -213,74 +261,70 @@ async def search_equipment(
         Raises:
             ApiError: If the API request fails due to network issues or server errors
     """
-    repository = _get_repository()
-
-    results: list[dict[str, Any]] = []
-
-    if type in ("weapon", "all"):
-        weapon_filters: dict[str, Any] = {"item_type": "weapon"}
-        if damage_dice is not None:
-            weapon_filters["damage_dice"] = damage_dice
-        if is_simple is not None:
-            weapon_filters["is_simple"] = is_simple
-        if cost_min is not None:
-            weapon_filters["cost_min"] = cost_min
-        if cost_max is not None:
-            weapon_filters["cost_max"] = cost_max
-        if weight_max is not None:
-            weapon_filters["weight_max"] = weight_max
-        if is_finesse is not None:
-            weapon_filters["is_finesse"] = is_finesse
-        if is_light is not None:
-            weapon_filters["is_light"] = is_light
-        if is_magic is not None:
-            weapon_filters["is_magic"] = is_magic
-        if documents is not None:
-            weapon_filters["document"] = documents
-        if search is not None:
-            weapon_filters["search"] = search
-
-        weapons = await repository.search(limit=limit, **weapon_filters)
-
-        weapon_dicts = [w.model_dump() for w in weapons]
-        results.extend(weapon_dicts)
-
-    if type in ("armor", "all"):
-        armor_filters: dict[str, Any] = {"item_type": "armor"}
-        if cost_min is not None:
-            armor_filters["cost_min"] = cost_min
-        if cost_max is not None:
-            armor_filters["cost_max"] = cost_max
-        if documents is not None:
-            armor_filters["document"] = documents
-        if search is not None:
-            armor_filters["search"] = search
-
-        armors = await repository.search(limit=limit, **armor_filters)
-
-        armor_dicts = [a.model_dump() for a in armors]
-        results.extend(armor_dicts)
-
-    if type in ("magic-item", "all"):
-        magic_item_filters: dict[str, Any] = {"item_type": "magic-item"}
-        if rarity is not None:
-            magic_item_filters["rarity"] = rarity
-        if requires_attunement is not None:
-            if requires_attunement.lower() in ("yes", "true", "1"):
-                magic_item_filters["requires_attunement"] = True
-            else:
-                magic_item_filters["requires_attunement"] = False
-        if documents is not None:
-            magic_item_filters["document"] = documents
-        if search is not None:
-            magic_item_filters["search"] = search
-
-        magic_items = await repository.search(limit=limit, **magic_item_filters)
-
-        magic_item_dicts = [m.model_dump() for m in magic_items]
-        results.extend(magic_item_dicts)
-
-    if type == "all" and len(results) > limit:
-        results = results[:limit]
-
-    return results
+    # Nothing can be returned for a non-positive limit, so skip the lookup
+    if limit <= 0:
+        return []
+
+    # Normalize name so padded or blank values share one cache entry and filter
+    if name is not None:
+        name = name.strip() or None
+    attunement = (
+        requires_attunement.lower() in ("yes", "true", "1")
+        if requires_attunement is not None
+        else None
+    )
+    filters: dict[str, Any] = {
+        key: value
+        for key, value in (
+            ("name", name),
+            ("rarity", rarity),
+            ("damage_dice", damage_dice),
+            ("is_simple", is_simple),
+            ("requires_attunement", attunement),
+            ("cost_min", cost_min),
+            ("cost_max", cost_max),
+            ("weight_max", weight_max),
+            ("is_finesse", is_finesse),
+            ("is_light", is_light),
+            ("is_magic", is_magic),
+            ("document", documents),
+            ("search", search),
+        )
+        if value is not None
+    }
+
+    # Unfiltered browsing is the most common call shape; reuse its prebuilt key
+    if not filters and type == "all" and limit == _DEFAULT_LIMIT:
+        cache_key = _DEFAULT_BROWSE_KEY
+    else:
+        # name is matched case-insensitively, so case-only variants share an entry
+        cache_key = make_cache_key(
+            type,
+            name.lower() if name is not None else None,
+            rarity,
+            damage_dice,
+            is_simple,
+            attunement,
+            cost_min,
+            cost_max,
+            weight_max,
+            is_finesse,
+            is_light,
+            is_magic,
+            documents,
+            search,
+            limit,
+        )
+
+    # The repository applies each filter only to the item types it belongs to,
+    # and searches every type in one call (concurrently) for type="all"
+    item_type: str | list[str] = list(_ALL_ITEM_TYPES) if type == "all" else type
+
+    async def load() -> list[dict[str, Any]]:
+        repository = _get_repository()
+        items = await repository.search(limit=limit, item_type=item_type, **filters)
+
+        results: list[dict[str, Any]] = _equipment_list_adapter.dump_python(items)
+        return results
+
+    return await _equipment_cache.get_or_load(cache_key, load)
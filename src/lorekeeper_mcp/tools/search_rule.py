@@ -9,6 +9,7 @@ Architecture:
     - Repository manages Milvus cache automatically
     - Supports dependency injection for testing
     - Handles rule, condition, damage-type, skill, and other reference data filtering
+    - Memoizes results in an in-process segmented LRU cache
 
 Examples:
     Default usage (automatically creates repository):
@@ -28,26 +29,57 @@ Examples:
         damage_types = await search_rule(rule_type="damage-type")
         alignments = await search_rule(rule_type="alignment")"""
 
-from typing import Any, Literal, cast
+import asyncio
+import logging
+from functools import cache
+from typing import Any, Literal, cast, get_args
 
+from pydantic import BaseModel
+
+from lorekeeper_mcp.cache.memory import ResultCache, make_cache_key
+from lorekeeper_mcp.config import settings
 from lorekeeper_mcp.repositories.factory import RepositoryFactory
 from lorekeeper_mcp.repositories.rule import RuleRepository
+from lorekeeper_mcp.tools.batch import run_batch
+
+logger = logging.getLogger(__name__)
 
 _repository_context: dict[str, Any] = {}
 
+# Rule data is static reference content, so sessions repeat the same lookups
+_rule_cache = ResultCache(maxsize=1024, ttl=settings.result_cache_ttl_seconds)
+
+# Comfortably above the number of entries Open5e publishes for any rule type
+_WARM_UP_LIMIT = 5000
+
+
+def clear_rule_cache() -> None:
+    """Clear the in-process rule result cache."""
+    _rule_cache.clear()
+
+
+@cache
+def _default_repository() -> RuleRepository:
+    """Create the default repository once and reuse it for later calls.
+
+    Returns:
+        Shared RuleRepository built by RepositoryFactory.
+    """
+    return RepositoryFactory.create_rule_repository()
+
 
 def _get_repository() -> RuleRepository:
     """Get rule repository, respecting test context.
 
-    Returns the repository from _repository_context if set, otherwise creates
-    a default RuleRepository using RepositoryFactory.
+    Returns the repository from _repository_context if set, otherwise returns
+    the shared default rule repository, creating it on first use.
 
     Returns:
         RuleRepository instance for rule lookups.
     """
     if "repository" in _repository_context:
         return cast(RuleRepository, _repository_context["repository"])
-    return RepositoryFactory.create_rule_repository()
+    return _default_repository()
 
 
 RuleType = Literal[
@@ -63,6 +95,23 @@ RuleType = Literal[
     "alignment",
 ]
 
+# Derived from RuleType so runtime validation cannot drift from the Literal
+VALID_RULE_TYPES: frozenset[str] = frozenset(get_args(RuleType))
+_VALID_RULE_TYPES_TEXT = ", ".join(sorted(VALID_RULE_TYPES))
+
+
+class RuleQuery(BaseModel):
+    """One search_rule query within a search_rules batch.
+
+    Fields mirror the search_rule parameters of the same name.
+    """
+
+    rule_type: RuleType
+    section: str | None = None
+    documents: list[str] | None = None
+    search: str | None = None
+    limit: int = 20
+
 
 async def search_rule(
     rule_type: RuleType,
@@ -184,32 +233,99 @@ async def search_rule(
         ValueError: If rule_type is not one of the valid options
         APIError: If the API request fails due to network issues or server errors
     """
-    valid_types = {
-        "rule",
-        "condition",
-        "damage-type",
-        "weapon-property",
-        "skill",
-        "ability-score",
-        "magic-school",
-        "language",
-        "proficiency",
-        "alignment",
-    }
-    if rule_type not in valid_types:
-        raise ValueError(
-            f"Invalid type '{rule_type}'. Must be one of: {', '.join(sorted(valid_types))}"
+    if rule_type not in VALID_RULE_TYPES:
+        raise ValueError(f"Invalid type '{rule_type}'. Must be one of: {_VALID_RULE_TYPES_TEXT}")
+
+    # A non-positive limit can match nothing; repositories treat 0 as "no limit"
+    if limit <= 0:
+        return []
+
+    # Sections only exist on core rules; other reference types ignore them
+    if rule_type != "rule":
+        section = None
+    params: dict[str, Any] = {
+        key: value
+        for key, value in (
+            ("rule_type", rule_type),
+            ("limit", limit),
+            ("section", section),
+            ("document", documents),
+            ("search", search),
         )
+        if value is not None
+    }
+
+    cache_key = make_cache_key(rule_type, section, documents, search, limit)
+
+    async def load() -> list[dict[str, Any]]:
+        repository = _get_repository()
+        return await repository.search(**params)
 
-    repository = _get_repository()
-
-    params: dict[str, Any] = {"rule_type": rule_type}
-    if limit is not None:
-        params["limit"] = limit
-    if rule_type == "rule" and section is not None:
-        params["section"] = section
-    if documents is not None:
-        params["document"] = documents
-    if search is not None:
-        params["search"] = search
-    return await repository.search(**params)
+    return await _rule_cache.get_or_load(cache_key, load)
+
+
+async def search_rules(queries: list[RuleQuery]) -> list[list[dict[str, Any]]]:
+    """
+    Run several rule lookups in one call.
+
+    Use this instead of repeated search_rule calls when one answer needs
+    several references at once, such as the grappled, prone and restrained
+    conditions. The lookups run a few at a time, and identical queries in the
+    batch share a single lookup through the rule result cache.
+
+    Examples:
+        Several conditions at once:
+            conditions = await search_rules(
+                [
+                    RuleQuery(rule_type="condition", search="grappled"),
+                    RuleQuery(rule_type="condition", search="prone"),
+                ]
+            )
+
+        Mixing reference types:
+            results = await search_rules(
+                [RuleQuery(rule_type="skill", search="stealth"), RuleQuery(rule_type="alignment")]
+            )
+
+    Args:
+        queries: Rule queries to run. Each accepts the same parameters as
+            search_rule (rule_type, section, documents, search, limit). At most
+            20 queries per call.
+
+    Returns:
+        One list of rule dictionaries per query, in the order of queries.
+        Each list has the same shape as the search_rule result.
+
+    Raises:
+        ValueError: If queries holds more than 20 queries
+        APIError: If an API request fails due to network issues or server errors
+    """
+    return await run_batch(search_rule, queries)
+
+
+async def _warm_up_rule_type(rule_type: RuleType) -> None:
+    """Fetch every entry of one rule type and prime its default search.
+
+    Args:
+        rule_type: Rule type to load
+    """
+    await _get_repository().search(rule_type=rule_type, limit=_WARM_UP_LIMIT)
+    # Also answer the default call for this rule type from the result cache
+    await search_rule(rule_type=rule_type)
+
+
+async def warm_up_rules() -> None:
+    """Load every rule type into the rule caches concurrently.
+
+    Intended to run in the background at server startup so search_rule calls
+    for each type are answered from the cache. A rule type that fails to load
+    is logged and left to load on demand later.
+    """
+    rule_types = get_args(RuleType)
+    results = await asyncio.gather(
+        *(_warm_up_rule_type(rule_type) for rule_type in rule_types),
+        return_exceptions=True,
+    )
+    for rule_type, result in zip(rule_types, results, strict=True):
+        if isinstance(result, Exception):
+            logger.warning("Failed to warm %s rules: %s", rule_type, result)
@@ -7,6 +7,7 @@ Architecture:
     - Uses SpellRepository for cache-aside pattern
     - Repository manages Milvus cache automatically
     - Supports test context-based repository injection
+    - Memoizes results in an in-process segmented LRU cache
 
 Examples:
     Default usage (automatically creates repository):
@@ -26,26 +27,112 @@ Examples:
     Advanced filtering:
         spells = await search_spell(level=0, class_key="wizard")"""
 
+import logging
+from functools import cache
 from typing import Any, cast
 
+from pydantic import BaseModel, TypeAdapter
+
+from lorekeeper_mcp.cache.memory import ResultCache, make_cache_key
+from lorekeeper_mcp.config import settings
+from lorekeeper_mcp.models import Spell
 from lorekeeper_mcp.repositories.factory import RepositoryFactory
 from lorekeeper_mcp.repositories.spell import SpellRepository
+from lorekeeper_mcp.tools.batch import run_batch
+
+logger = logging.getLogger(__name__)
 
 _repository_context: dict[str, Any] = {}
 
+_spell_list_adapter: TypeAdapter[list[Spell]] = TypeAdapter(list[Spell])
+
+# Agents often repeat a lookup verbatim, e.g. when retrying a tool call
+_spell_cache = ResultCache(maxsize=256, ttl=settings.result_cache_ttl_seconds)
+
+# Comfortably above the number of spells Open5e publishes across all documents
+_WARM_UP_LIMIT = 5000
+
+_DEFAULT_LIMIT = 20
+
+# Key for a call with no filters and the default limit
+_DEFAULT_BROWSE_KEY = make_cache_key(*(None,) * 11, _DEFAULT_LIMIT)
+
+
+class SpellQuery(BaseModel):
+    """One search_spell query within a search_spells batch.
+
+    Fields mirror the search_spell parameters of the same name.
+    """
+
+    level: int | None = None
+    level_min: int | None = None
+    level_max: int | None = None
+    school: str | None = None
+    class_key: str | None = None
+    concentration: bool | None = None
+    ritual: bool | None = None
+    casting_time: str | None = None
+    damage_type: str | None = None
+    documents: list[str] | None = None
+    search: str | None = None
+    limit: int = _DEFAULT_LIMIT
+
+
+def _normalize_levels(
+    level: int | None, level_min: int | None, level_max: int | None
+) -> tuple[int | None, int | None, int | None]:
+    """Reduce level filters to their simplest equivalent form.
+
+    A range with equal bounds becomes an exact level, and a range that an
+    exact level already satisfies is dropped, so equivalent calls share one
+    result cache entry and send one predicate instead of three.
+
+    Args:
+        level: Exact spell level filter
+        level_min: Minimum spell level filter
+        level_max: Maximum spell level filter
+
+    Returns:
+        Tuple of (level, level_min, level_max) after normalization.
+    """
+    if level is None and level_min is not None and level_min == level_max:
+        return level_min, None, None
+    if (
+        level is not None
+        and (level_min is None or level_min <= level)
+        and (level_max is None or level <= level_max)
+    ):
+        return level, None, None
+    return level, level_min, level_max
+
+
+def clear_spell_cache() -> None:
+    """Clear the in-process spell result cache."""
+    _spell_cache.clear()
+
+
+@cache
+def _default_repository() -> SpellRepository:
+    """Create the default repository once and reuse it for later calls.
+
+    Returns:
+        Shared SpellRepository built by RepositoryFactory.
+    """
+    return RepositoryFactory.create_spell_repository()
+
 
 def _get_repository() -> SpellRepository:
     """Get spell repository, respecting test context.
 
-    Returns the repository from _repository_context if set, otherwise creates
-    a default SpellRepository using RepositoryFactory.
+    Returns the repository from _repository_context if set, otherwise returns
+    the shared default spell repository, creating it on first use.
 
     Returns:
         SpellRepository instance for spell lookups.
     """
     if "repository" in _repository_context:
         return cast(SpellRepository, _repository_context["repository"])
-    return RepositoryFactory.create_spell_repository()
+    return _default_repository()
 
 
 async def search_spell(
@@ -60,7 +147,7 @@ async def search_spell(
     damage_type: str | None = None,
     documents: list[str] | None = None,
     search: str | None = None,
-    limit: int = 20,
+    limit: int = _DEFAULT_LIMIT,
 ) -> list[dict[str, Any]]:
     """
     Search and retrieve D&D 5e spells using the repository pattern.
@@ -195,34 +282,110 @@ async def search_spell(
     Raises:
         ApiError: If the API request fails due to network issues or server errors
     """
-    repository = _get_repository()
-
-    params: dict[str, Any] = {}
-    if level is not None:
-        params["level"] = level
-    if level_min is not None:
-        params["level_min"] = level_min
-    if level_max is not None:
-        params["level_max"] = level_max
-    if school is not None:
-        params["school"] = school
-    if class_key is not None:
-        params["class_key"] = class_key
-    if concentration is not None:
-        params["concentration"] = concentration
-    if ritual is not None:
-        params["ritual"] = ritual
-    if casting_time is not None:
-        params["casting_time"] = casting_time
-    if damage_type is not None:
-        params["damage_type"] = damage_type
-    if documents is not None:
-        params["document"] = documents
-    if search is not None:
-        params["search"] = search
-
-    spells = await repository.search(limit=limit, **params)
-
-    spells = spells[:limit]
-
-    return [spell.model_dump() for spell in spells]
+    # Skip the repository when no results can be returned
+    if limit <= 0:
+        return []
+
+    level, level_min, level_max = _normalize_levels(level, level_min, level_max)
+    params: dict[str, Any] = {
+        key: value
+        for key, value in (
+            ("level", level),
+            ("level_min", level_min),
+            ("level_max", level_max),
+            ("school", school),
+            ("class_key", class_key),
+            ("concentration", concentration),
+            ("ritual", ritual),
+            ("casting_time", casting_time),
+            ("damage_type", damage_type),
+            ("document", documents),
+            ("search", search),
+        )
+        if value is not None
+    }
+
+    # Agents exploring the tool usually start with an unfiltered call
+    if not params and limit == _DEFAULT_LIMIT:
+        cache_key = _DEFAULT_BROWSE_KEY
+    else:
+        # Class and damage type match case-insensitively, so fold them in the key;
+        # school is compared exactly by the cache and keeps its case
+        cache_key = make_cache_key(
+            level,
+            level_min,
+            level_max,
+            school,
+            class_key.lower() if class_key is not None else None,
+            concentration,
+            ritual,
+            casting_time,
+            damage_type.lower() if damage_type is not None else None,
+            documents,
+            search,
+            limit,
+        )
+
+    async def load() -> list[dict[str, Any]]:
+        repository = _get_repository()
+        spells = await repository.search(limit=limit, **params)
+
+        # One adapter call dumps the page; the slice guards clients that ignore limit
+        return cast(list[dict[str, Any]], _spell_list_adapter.dump_python(spells[:limit]))
+
+    return await _spell_cache.get_or_load(cache_key, load)
+
+
+async def search_spells(queries: list[SpellQuery]) -> list[list[dict[str, Any]]]:
+    """
+    Run several spell searches in one call.
+
+    Use this instead of repeated search_spell calls when one answer needs
+    several spell lists, such as the 3rd-level spells of each class in a
+    party. The searches run a few at a time, and identical queries in the batch
+    share a single lookup through the spell result cache.
+
+    Examples:
+        One spell list per class:
+            by_class = await search_spells(
+                [
+                    SpellQuery(class_key="wizard", level=3),
+                    SpellQuery(class_key="cleric", level=3),
+                ]
+            )
+
+        Mixing semantic and structured queries:
+            results = await search_spells(
+                [SpellQuery(search="protection from fire"), SpellQuery(ritual=True, limit=5)]
+            )
+
+    Args:
+        queries: Spell queries to run. Each accepts the same filters as
+            search_spell (level, level_min, level_max, school, class_key,
+            concentration, ritual, casting_time, damage_type, documents,
+            search, limit). At most 20 queries per call.
+
+    Returns:
+        One list of spell dictionaries per query, in the order of queries.
+        Each list has the same shape as the search_spell result.
+
+    Raises:
+        ValueError: If queries holds more than 20 queries
+        ApiError: If an API request fails due to network issues or server errors
+    """
+    return await run_batch(search_spell, queries)
+
+
+async def warm_up_spells() -> None:
+    """Fetch the full spell list once so later searches hit the cache.
+
+    Intended to run in the background at server startup. The default
+    unfiltered search is then primed in the result cache. A failed fetch is
+    logged and the cache is left to fill on demand.
+    """
+    try:
+        await _get_repository().search(limit=_WARM_UP_LIMIT)
+        # Also answer the default unfiltered call from the result cache
+        await search_spell()
+    except Exception:
+        logger.warning("Failed to warm spell cache", exc_info=True)
@@ -129,15 +129,21 @@ async def clear_cache(live_db: MilvusCache) -> AsyncGenerator[None, None]:
     instead of the global cache, which may be corrupted or cause hangs.
     """
     from lorekeeper_mcp.repositories.factory import RepositoryFactory
+    from lorekeeper_mcp.tools.list_documents import clear_documents_cache
+    from lorekeeper_mcp.tools.search_all import clear_search_all_cache
     from lorekeeper_mcp.tools.search_character_option import (
         _repository_context as char_option_ctx,
     )
     from lorekeeper_mcp.tools.search_creature import _repository_context as creature_ctx
+    from lorekeeper_mcp.tools.search_creature import clear_creature_cache
     from lorekeeper_mcp.tools.search_equipment import _repository_context as equipment_ctx
+    from lorekeeper_mcp.tools.search_equipment import clear_equipment_cache
     from lorekeeper_mcp.tools.search_rule import _repository_context as rule_ctx
+    from lorekeeper_mcp.tools.search_rule import clear_rule_cache
 
     # Import _repository_context from each tool module
     from lorekeeper_mcp.tools.search_spell import _repository_context as spell_ctx
+    from lorekeeper_mcp.tools.search_spell import clear_spell_cache
 
     # Create repositories with the test cache
     spell_repo = RepositoryFactory.create_spell_repository(cache=live_db)
@@ -153,6 +159,14 @@ async def clear_cache(live_db: MilvusCache) -> AsyncGenerator[None, None]:
     rule_ctx["repository"] = rule_repo
     char_option_ctx["repository"] = char_option_repo
 
+    # Drop in-process tool results so live tests exercise the repositories
+    clear_spell_cache()
+    clear_creature_cache()
+    clear_equipment_cache()
+    clear_rule_cache()
+    clear_search_all_cache()
+    clear_documents_cache()
+
     yield
 
     # Cleanup - clear repository contexts
@@ -161,3 +175,9 @@ async def clear_cache(live_db: MilvusCache) -> AsyncGenerator[None, None]:
     equipment_ctx.clear()
     rule_ctx.clear()
     char_option_ctx.clear()
+    clear_spell_cache()
+    clear_creature_cache()
+    clear_equipment_cache()
+    clear_rule_cache()
+    clear_search_all_cache()
+    clear_documents_cache()
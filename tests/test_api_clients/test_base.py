@@ -9,7 +9,7 @@ import httpx
 import pytest
 import respx
 
-from lorekeeper_mcp.api_clients.base import BaseHttpClient
+from lorekeeper_mcp.api_clients.base import BaseHttpClient, extract_results
 from lorekeeper_mcp.api_clients.exceptions import ApiError, NetworkError
 
 
@@ -222,3 +222,15 @@ async def test_make_request_500_still_raises(base_client: BaseHttpClient) -> Non
         await base_client.make_request("/error")
 
     assert exc_info.value.status_code == 500
+
+
+def test_extract_results_unwraps_paginated_response() -> None:
+    """Test that paginated responses yield their results entries."""
+    assert extract_results({"count": 1, "results": [{"name": "Dagger"}]}) == [{"name": "Dagger"}]
+    assert extract_results({"count": 0}) == []
+
+
+def test_extract_results_passes_lists_through() -> None:
+    """Test that bare-list responses are returned unchanged."""
+    response = [{"name": "Dagger"}]
+    assert extract_results(response) is response
@@ -1,5 +1,11 @@
 """Tests for EmbeddingService."""
 
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from lorekeeper_mcp.cache import embedding
 from lorekeeper_mcp.cache.embedding import EmbeddingService
 
 
@@ -84,6 +90,43 @@ class TestEmbeddingServiceEncode:
         assert len(result) == 384
 
 
+class TestEmbeddingServiceQueryCache:
+    """Tests for the encode() result cache."""
+
+    @staticmethod
+    def _service_with_fake_model() -> tuple[EmbeddingService, MagicMock]:
+        service = EmbeddingService()
+        model = MagicMock()
+        model.encode.side_effect = lambda text, **kwargs: np.array([float(len(text)), 0.5])
+        service._model = model
+        return service, model
+
+    def test_repeated_text_skips_model(self) -> None:
+        """Test that encoding the same text twice runs the model once."""
+        service, model = self._service_with_fake_model()
+
+        first = service.encode("healing magic")
+        first.clear()
+        second = service.encode("healing magic")
+
+        assert second == [13.0, 0.5]
+        assert model.encode.call_count == 1
+
+    def test_cache_evicts_least_recently_used(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the cache is bounded by QUERY_CACHE_SIZE."""
+        monkeypatch.setattr(embedding, "QUERY_CACHE_SIZE", 2)
+        service, model = self._service_with_fake_model()
+
+        service.encode("a")
+        service.encode("bb")
+        service.encode("a")
+        service.encode("ccc")
+        service.encode("a")
+        service.encode("bb")
+
+        assert model.encode.call_count == 4
+
+
 class TestEmbeddingServiceEncodeBatch:
     """Tests for EmbeddingService.encode_batch method."""
 
@@ -0,0 +1,242 @@
+"""Tests for the in-process ResultCache."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from lorekeeper_mcp.cache import memory
+from lorekeeper_mcp.cache.memory import ResultCache, make_cache_key
+
+
+class TestResultCache:
+    """Tests for ResultCache segmented LRU behavior."""
+
+    def test_get_miss_returns_none(self) -> None:
+        """Test that a missing key returns None."""
+        cache = ResultCache(maxsize=2)
+
+        assert cache.get(("missing",)) is None
+
+    def test_set_then_get_returns_value(self) -> None:
+        """Test that stored values are returned on lookup."""
+        cache = ResultCache(maxsize=2)
+        cache.set(("dragon",), [{"name": "Red Dragon"}])
+
+        assert cache.get(("dragon",)) == [{"name": "Red Dragon"}]
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test that a hit protects an entry from eviction."""
+        cache = ResultCache(maxsize=2)
+        cache.set("a", [{"name": "a"}])
+        cache.set("b", [{"name": "b"}])
+
+        # Touch "a" so "b" becomes the least recently used entry
+        assert cache.get("a") is not None
+        cache.set("c", [{"name": "c"}])
+
+        assert cache.get("a") == [{"name": "a"}]
+        assert cache.get("b") is None
+        assert cache.get("c") == [{"name": "c"}]
+
+    def test_overwrite_does_not_evict(self) -> None:
+        """Test that re-setting an existing key does not evict other entries."""
+        cache = ResultCache(maxsize=2)
+        cache.set("a", [{"name": "a"}])
+        cache.set("b", [{"name": "b"}])
+        cache.set("a", [{"name": "a2"}])
+
+        assert cache.get("a") == [{"name": "a2"}]
+        assert cache.get("b") == [{"name": "b"}]
+
+    def test_reused_entry_survives_scan(self) -> None:
+        """Test that a burst of one-off keys does not evict a reused entry."""
+        cache = ResultCache(maxsize=4)
+        cache.set("hot", [{"name": "hot"}])
+        assert cache.get("hot") is not None
+
+        for key in ("w", "x", "y", "z", "v"):
+            cache.set(key, [{"name": key}])
+
+        assert cache.get("hot") == [{"name": "hot"}]
+        assert cache.get("w") is None
+        assert len(cache) == 4
+
+    def test_protected_overflow_demotes_to_probation(self) -> None:
+        """Test that the protected segment demotes rather than drops entries."""
+        cache = ResultCache(maxsize=3)
+        assert cache.protected_maxsize == 2
+        for key in ("a", "b", "c"):
+            cache.set(key, [{"name": key}])
+            assert cache.get(key) is not None
+
+        # "a" was demoted when "c" was promoted, so it is evicted first
+        cache.set("d", [{"name": "d"}])
+
+        assert cache.get("a") is None
+        assert cache.get("b") == [{"name": "b"}]
+        assert cache.get("c") == [{"name": "c"}]
+        assert cache.get("d") == [{"name": "d"}]
+
+    def test_set_and_get_do_not_share_lists(self) -> None:
+        """Test that neither the stored nor the returned list aliases the cache."""
+        cache = ResultCache(maxsize=2)
+        value = [{"name": "a"}]
+        cache.set("a", value)
+        value.append({"name": "b"})
+
+        first = cache.get("a")
+        assert first == [{"name": "a"}]
+        first.clear()
+        assert cache.get("a") == [{"name": "a"}]
+
+    def test_expired_entry_is_a_miss(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that entries older than the ttl are dropped on lookup."""
+        now = 1000.0
+        monkeypatch.setattr(memory.time, "monotonic", lambda: now)
+        cache = ResultCache(maxsize=2, ttl=60)
+        cache.set("a", [{"name": "a"}])
+
+        now += 59
+        assert cache.get("a") == [{"name": "a"}]
+
+        now += 1
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_clear_removes_entries(self) -> None:
+        """Test that clear empties the cache."""
+        cache = ResultCache(maxsize=2)
+        cache.set("a", [{"name": "a"}])
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_clear_during_load_does_not_store_stale_result(self) -> None:
+        """Test that a load finishing after clear() answers its caller but is not cached."""
+        cache = ResultCache(maxsize=2)
+        release = asyncio.Event()
+
+        async def loader() -> list[dict[str, Any]]:
+            await release.wait()
+            return [{"name": "a"}]
+
+        task = asyncio.create_task(cache.get_or_load("a", loader))
+        await asyncio.sleep(0)
+        cache.clear()
+        release.set()
+
+        assert await task == [{"name": "a"}]
+        assert cache.get("a") is None
+
+
+class TestResultCacheGetOrLoad:
+    """Tests for ResultCache single-flight loading."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self) -> None:
+        """Test that concurrent callers for the same key run the loader once."""
+        cache = ResultCache()
+        calls = 0
+        release = asyncio.Event()
+
+        async def loader() -> list[dict[str, Any]]:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return [{"name": "Goblin"}]
+
+        tasks = [asyncio.create_task(cache.get_or_load("goblin", loader)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert all(result == [{"name": "Goblin"}] for result in results)
+        assert cache.get("goblin") == [{"name": "Goblin"}]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_first_caller_does_not_fail_waiters(self) -> None:
+        """Test that cancelling the caller that started a load leaves the others served."""
+        cache = ResultCache()
+        calls = 0
+        release = asyncio.Event()
+
+        async def loader() -> list[dict[str, Any]]:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return [{"name": "Goblin"}]
+
+        first = asyncio.create_task(cache.get_or_load("goblin", loader))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(cache.get_or_load("goblin", loader)) for _ in range(2)]
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert first.cancelled()
+        assert calls == 1
+        assert results == [[{"name": "Goblin"}], [{"name": "Goblin"}]]
+        assert cache.get("goblin") == [{"name": "Goblin"}]
+
+    @pytest.mark.asyncio
+    async def test_failed_load_propagates_and_is_not_cached(self) -> None:
+        """Test that loader errors reach all waiters and are retried later."""
+        cache = ResultCache()
+        release = asyncio.Event()
+
+        async def failing_loader() -> list[dict[str, Any]]:
+            await release.wait()
+            raise RuntimeError("upstream down")
+
+        tasks = [asyncio.create_task(cache.get_or_load("key", failing_loader)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert cache.get("key") is None
+
+        async def loader() -> list[dict[str, Any]]:
+            return []
+
+        assert await cache.get_or_load("key", loader) == []
+
+    @pytest.mark.asyncio
+    async def test_returned_list_is_a_copy(self) -> None:
+        """Test that mutating a returned list does not change the cached entry."""
+        cache = ResultCache()
+
+        async def loader() -> list[dict[str, Any]]:
+            return [{"name": "Dagger"}]
+
+        first = await cache.get_or_load("dagger", loader)
+        first.clear()
+
+        assert await cache.get_or_load("dagger", loader) == [{"name": "Dagger"}]
+
+
+class TestMakeCacheKey:
+    """Tests for make_cache_key."""
+
+    def test_lists_become_sorted_tuples(self) -> None:
+        """Test that collection order does not affect the key."""
+        assert make_cache_key(["tce", "srd-5e"], 5) == make_cache_key(["srd-5e", "tce"], 5)
+        assert make_cache_key(["tce", "srd-5e"]) == (("srd-5e", "tce"),)
+
+    def test_strings_are_interned(self) -> None:
+        """Test that equal strings share one object in the key."""
+        first = make_cache_key("".join(["dra", "gon"]))
+        second = make_cache_key("".join(["drag", "on"]))
+
+        assert first[0] is second[0]
+
+    def test_none_and_numbers_pass_through(self) -> None:
+        """Test that scalar components are kept as-is."""
+        assert make_cache_key(None, 3, 0.5, True) == (None, 3, 0.5, True)
@@ -461,6 +461,16 @@ class TestMilvusCacheBuildFilterExpression:
         result = cache._build_filter_expression({"challenge_rating_max": 5})
         assert result == "challenge_rating <= 5"
 
+    def test_build_filter_icontains(self, tmp_path: Path):
+        """Test icontains filter matches the lowercased field copy."""
+        from lorekeeper_mcp.cache.milvus import MilvusCache
+
+        db_path = tmp_path / "test_milvus.db"
+        cache = MilvusCache(str(db_path))
+
+        result = cache._build_filter_expression({"name_icontains": "Chain"})
+        assert result == 'name_lower like "%chain%"'
+
 
 class TestMilvusCacheGetEntities:
     """Tests for MilvusCache.get_entities method."""
@@ -539,6 +549,29 @@ class TestMilvusCacheGetEntities:
         assert len(result) == 1
         assert result[0]["slug"] == "fireball"
 
+    @pytest.mark.asyncio
+    async def test_get_entities_respects_limit(self, tmp_path: Path):
+        """Test get_entities caps results with and without filters."""
+        from lorekeeper_mcp.cache.milvus import MilvusCache
+
+        db_path = tmp_path / "test_milvus.db"
+        cache = MilvusCache(str(db_path))
+
+        entities = [
+            {
+                "slug": f"spell-{i}",
+                "name": f"Spell {i}",
+                "level": 1,
+                "school": "Evocation",
+                "document": "srd",
+            }
+            for i in range(3)
+        ]
+        await cache.store_entities(entities, "spells")
+
+        assert len(await cache.get_entities("spells", limit=2)) == 2
+        assert len(await cache.get_entities("spells", level=1, limit=1)) == 1
+
     @pytest.mark.asyncio
     async def test_get_entities_with_document_filter(self, tmp_path: Path):
         """Test get_entities with document filter."""
@@ -577,6 +610,39 @@ class TestMilvusCacheGetEntities:
         slugs = {e["slug"] for e in result}
         assert slugs == {"fireball", "custom-spell"}
 
+    @pytest.mark.asyncio
+    async def test_get_entities_name_icontains_backfills_legacy_rows(self, tmp_path: Path):
+        """Test that rows stored without name_lower still match name_icontains."""
+        from lorekeeper_mcp.cache.embedding import EMBEDDING_DIMENSION
+        from lorekeeper_mcp.cache.milvus import MilvusCache
+
+        db_path = tmp_path / "test_milvus.db"
+        cache = MilvusCache(str(db_path))
+
+        # Rows written before store_entities() added the lowercased name copy
+        cache._ensure_collection("weapons")
+        cache.client.insert(
+            collection_name="weapons",
+            data=[
+                {
+                    "slug": slug,
+                    "name": name,
+                    "embedding": [0.1] * EMBEDDING_DIMENSION,
+                    "source_api": "open5e",
+                    "document": "srd",
+                    "category": "",
+                    "damage_type": "",
+                    "entity_data": {"slug": slug, "name": name},
+                }
+                for slug, name in (("chain-whip", "Chain Whip"), ("dagger", "Dagger"))
+            ],
+        )
+        cache.client.flush("weapons")
+
+        result = await cache.get_entities("weapons", name_icontains="chain")
+
+        assert [e["slug"] for e in result] == ["chain-whip"]
+
 
 class TestMilvusCacheStoreEntities:
     """Tests for MilvusCache.store_entities method."""
@@ -934,6 +1000,30 @@ class TestMilvusCacheAdditionalMethods:
         assert "spells" in metadata
         assert metadata["spells"] >= 1
 
+    @pytest.mark.asyncio
+    async def test_get_all_document_metadata(self, tmp_path: Path):
+        """Test get_all_document_metadata counts entities per document and type."""
+        from lorekeeper_mcp.cache.milvus import MilvusCache
+
+        db_path = tmp_path / "test_milvus.db"
+        cache = MilvusCache(str(db_path))
+
+        await cache.store_entities(
+            [
+                {"slug": "fireball", "name": "Fireball", "document": "srd"},
+                {"slug": "custom-spell", "name": "Custom Spell", "document": "homebrew"},
+            ],
+            "spells",
+        )
+        await cache.store_entities(
+            [{"slug": "goblin", "name": "Goblin", "document": "srd"}],
+            "creatures",
+        )
+
+        metadata = await cache.get_all_document_metadata()
+        assert metadata["srd"] == {"spells": 1, "creatures": 1}
+        assert metadata["homebrew"] == {"spells": 1}
+
     @pytest.mark.asyncio
     async def test_get_cache_stats(self, tmp_path: Path):
         """Test get_cache_stats returns cache statistics."""
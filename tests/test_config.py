@@ -28,6 +28,10 @@ class TestSettings:
         assert test_settings.milvus_db_path == expected_xdg_path
         assert test_settings.cache_ttl_days == 7
         assert test_settings.error_cache_ttl_seconds == 300
+        assert test_settings.result_cache_ttl_seconds == 3600
+        assert test_settings.equipment_fetch_concurrency == 8
+        assert test_settings.warm_rule_cache is False
+        assert test_settings.warm_spell_cache is False
         assert test_settings.log_level == "INFO"
         assert test_settings.debug is False
         assert test_settings.open5e_base_url == "https://api.open5e.com"
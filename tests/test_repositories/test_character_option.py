@@ -188,3 +188,52 @@ async def test_character_option_repository_search_document_not_passed_to_api() -
     mock_client.get_classes_v2.assert_called_once()
     call_kwargs = mock_client.get_classes_v2.call_args[1]
     assert "document" not in call_kwargs
+
+
+@pytest.mark.asyncio
+async def test_character_option_repository_name_filter_is_pushed_down(
+    mock_cache: MagicMock, mock_client: MagicMock
+) -> None:
+    """Test that name becomes a cache icontains filter and an API name filter."""
+    mock_cache.get_entities.return_value = []
+    mock_client.get_species.return_value = [{"name": "High Elf", "slug": "high-elf"}]
+    mock_cache.store_entities.return_value = 1
+
+    repo = CharacterOptionRepository(client=mock_client, cache=mock_cache)
+    await repo.search(option_type="race", name="elf", document=["srd-5e"], limit=5)
+
+    mock_cache.get_entities.assert_awaited_once_with(
+        "races", name_icontains="elf", document=["srd-5e"]
+    )
+    mock_client.get_species.assert_awaited_once_with(limit=5, name__icontains="elf")
+
+
+@pytest.mark.asyncio
+async def test_character_option_repository_semantic_search_with_name_filter(
+    mock_cache: MagicMock, mock_client: MagicMock
+) -> None:
+    """Test that semantic search sends name to the cache as an icontains filter."""
+    mock_cache.semantic_search = AsyncMock(return_value=[{"name": "High Elf"}])
+
+    repo = CharacterOptionRepository(client=mock_client, cache=mock_cache)
+    results = await repo.search(option_type="race", search="graceful", name="elf", limit=5)
+
+    assert results == [{"name": "High Elf"}]
+    mock_cache.semantic_search.assert_awaited_once_with(
+        "races", "graceful", limit=5, name_icontains="elf"
+    )
+
+
+@pytest.mark.asyncio
+async def test_character_option_repository_semantic_fallback_with_name_filter(
+    mock_cache: MagicMock, mock_client: MagicMock
+) -> None:
+    """Test that the structured fallback keeps an explicit name filter."""
+    mock_cache.semantic_search = AsyncMock(side_effect=NotImplementedError)
+    mock_cache.get_entities.return_value = [{"name": "High Elf"}]
+
+    repo = CharacterOptionRepository(client=mock_client, cache=mock_cache)
+    results = await repo.search(option_type="race", search="graceful", name="elf")
+
+    assert results == [{"name": "High Elf"}]
+    mock_cache.get_entities.assert_awaited_once_with("races", name_icontains="elf")
@@ -661,6 +661,36 @@ class TestCreatureRepositorySemanticSearch:
         assert len(results) == 1
 
 
+@pytest.mark.asyncio
+async def test_monster_repository_cache_miss_returns_at_most_limit(
+    mock_cache: MagicMock, mock_client: MagicMock, creatures: list[Creature]
+) -> None:
+    """Test that over-returned API rows are cached but not returned past limit."""
+    mock_cache.get_entities.return_value = []
+    mock_client.get_creatures.return_value = creatures
+
+    repo = CreatureRepository(client=mock_client, cache=mock_cache)
+    results = await repo.search(limit=2)
+
+    assert [creature.name for creature in results] == ["Goblin", "Orc"]
+    stored = mock_cache.store_entities.await_args.args[0]
+    assert len(stored) == 3
+
+
+@pytest.mark.asyncio
+async def test_monster_repository_cache_hit_validates_only_limit(
+    mock_cache: MagicMock, mock_client: MagicMock, monster_data: list[dict[str, Any]]
+) -> None:
+    """Test that cached rows past limit are never validated."""
+    # An invalid row past the limit would fail validation if it were reached
+    mock_cache.get_entities.return_value = [*monster_data[:2], {"name": "Broken"}]
+
+    repo = CreatureRepository(client=mock_client, cache=mock_cache)
+    results = await repo.search(type="humanoid", limit=2)
+
+    assert [creature.name for creature in results] == ["Goblin", "Orc"]
+
+
 def test_creature_repository_imports_from_creature_module() -> None:
     """Test CreatureRepository imports from repositories.creature not monster."""
     from lorekeeper_mcp.repositories.creature import CreatureRepository
@@ -1,11 +1,13 @@
 """Tests for EquipmentRepository implementation."""
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from lorekeeper_mcp.models import Armor, Weapon
+from lorekeeper_mcp.repositories import equipment as equipment_module
 from lorekeeper_mcp.repositories.equipment import EquipmentRepository
 
 
@@ -402,3 +404,319 @@ async def test_search_armor_by_document_cache_miss(
     assert "document" not in call_kwargs
 
     assert len(results) == 1
+
+
+@pytest.mark.asyncio
+async def test_search_multiple_item_types_routes_filters(
+    mock_cache: MagicMock,
+    weapon_data: list[dict[str, Any]],
+    armor_data: list[dict[str, Any]],
+) -> None:
+    """Test that a list of item types searches each with its own filters."""
+
+    async def get_entities(entity_type: str, **filters: Any) -> list[dict[str, Any]]:
+        return {"weapons": weapon_data, "armor": armor_data}.get(entity_type, [])
+
+    mock_cache.get_entities.side_effect = get_entities
+
+    repo = EquipmentRepository(client=MagicMock(), cache=mock_cache)
+    results = await repo.search(
+        item_type=["weapon", "armor", "magic-item"], cost_max=50, document="srd"
+    )
+
+    assert [item.name for item in results] == ["Longsword", "Dagger", "Plate", "Leather"]
+    calls = {call.args[0]: call.kwargs for call in mock_cache.get_entities.call_args_list}
+    assert calls == {
+        "weapons": {"cost_max": 50, "document": "srd"},
+        "armor": {"cost_max": 50, "document": "srd"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_search_multiple_item_types_caps_merged_results(
+    mock_cache: MagicMock,
+    weapon_data: list[dict[str, Any]],
+    armor_data: list[dict[str, Any]],
+) -> None:
+    """Test that merged multi-type results are capped at limit."""
+
+    async def get_entities(entity_type: str, **filters: Any) -> list[dict[str, Any]]:
+        return {"weapons": weapon_data, "armor": armor_data}.get(entity_type, [])
+
+    mock_cache.get_entities.side_effect = get_entities
+
+    repo = EquipmentRepository(client=MagicMock(), cache=mock_cache)
+    results = await repo.search(item_type=["weapon", "armor"], limit=3)
+
+    assert [item.name for item in results] == ["Longsword", "Dagger", "Plate"]
+
+
+@pytest.mark.asyncio
+async def test_search_by_name_pushes_substring_filter_down(
+    mock_cache: MagicMock, mock_client: MagicMock, armor_data: list[dict[str, Any]]
+) -> None:
+    """Test that name becomes a cache icontains filter and an API name filter."""
+    mock_cache.get_entities.return_value = []
+    mock_client.get_armor.return_value = [Armor.model_validate(armor_data[0])]
+    mock_cache.store_entities.return_value = 1
+
+    repo = EquipmentRepository(client=mock_client, cache=mock_cache)
+    await repo.search(item_type="armor", name="plate", limit=5)
+
+    mock_cache.get_entities.assert_awaited_once_with("armor", name_icontains="plate")
+    mock_client.get_armor.assert_awaited_once_with(limit=5, name="plate")
+
+
+@pytest.mark.asyncio
+async def test_search_multiple_item_types_fetches_full_limit(
+    mock_cache: MagicMock, mock_client: MagicMock
+) -> None:
+    """Test that each item type is fetched with the full limit, once."""
+    mock_cache.get_entities.return_value = []
+    mock_client.get_weapons.return_value = []
+    mock_client.get_armor.return_value = []
+    mock_client.get_magic_items.return_value = []
+
+    repo = EquipmentRepository(client=mock_client, cache=mock_cache)
+    await repo.search(item_type=["weapon", "armor", "magic-item"], limit=7)
+
+    mock_client.get_weapons.assert_awaited_once_with(limit=7)
+    mock_client.get_armor.assert_awaited_once_with(limit=7)
+    mock_client.get_magic_items.assert_awaited_once_with(limit=7)
+
+
+@pytest.mark.asyncio
+async def test_search_multiple_item_types_fills_limit_on_cold_cache(
+    weapon_data: list[dict[str, Any]], armor_data: list[dict[str, Any]]
+) -> None:
+    """Test that a short type is made up from the API, not partially cached rows."""
+    api_rows = {
+        "weapons": [
+            Weapon.model_validate({**weapon_data[0], "name": f"Weapon {i}", "key": f"weapon-{i}"})
+            for i in range(50)
+        ],
+        "armor": [
+            Armor.model_validate({**armor_data[0], "name": f"Armor {i}", "key": f"armor-{i}"})
+            for i in range(50)
+        ],
+        "magic-items": [{"name": f"Ring {i}", "key": f"ring-{i}"} for i in range(2)],
+    }
+    stored: dict[str, list[dict[str, Any]]] = {}
+
+    async def get_entities(entity_type: str, **filters: Any) -> list[dict[str, Any]]:
+        return stored.get(entity_type, [])
+
+    async def store_entities(entities: list[dict[str, Any]], entity_type: str) -> int:
+        stored.setdefault(entity_type, []).extend(entities)
+        return len(entities)
+
+    def fetch(entity_type: str) -> AsyncMock:
+        return AsyncMock(side_effect=lambda limit=None: api_rows[entity_type][:limit])
+
+    cache = MagicMock()
+    cache.get_entities = AsyncMock(side_effect=get_entities)
+    cache.store_entities = AsyncMock(side_effect=store_entities)
+    client = MagicMock()
+    client.get_weapons = fetch("weapons")
+    client.get_armor = fetch("armor")
+    client.get_magic_items = fetch("magic-items")
+
+    repo = EquipmentRepository(client=client, cache=cache)
+    results = await repo.search(item_type=["weapon", "armor", "magic-item"], limit=20)
+    weapons = await repo.search(item_type="weapon", limit=20)
+
+    assert len(results) == 20
+    assert sum(isinstance(item, Weapon) for item in results) == 11
+    assert sum(isinstance(item, Armor) for item in results) == 7
+    assert len(weapons) == 20
+
+
+@pytest.mark.asyncio
+async def test_search_multiple_item_types_refills_shortfall(
+    mock_cache: MagicMock,
+    mock_client: MagicMock,
+    weapon_data: list[dict[str, Any]],
+    armor_data: list[dict[str, Any]],
+) -> None:
+    """Test that types which filled their share make up for short types."""
+
+    async def get_entities(entity_type: str, **filters: Any) -> list[dict[str, Any]]:
+        return {"weapons": weapon_data, "armor": armor_data, "magic-items": []}[entity_type]
+
+    mock_cache.get_entities.side_effect = get_entities
+    mock_client.get_magic_items.return_value = []
+
+    repo = EquipmentRepository(client=mock_client, cache=mock_cache)
+    results = await repo.search(item_type=["armor", "magic-item", "weapon"], limit=4)
+
+    assert [item.name for item in results] == ["Plate", "Leather", "Longsword", "Dagger"]
+
+
+@pytest.mark.asyncio
+async def test_semantic_search_shares_limit_across_item_types(
+    mock_cache: MagicMock,
+    weapon_data: list[dict[str, Any]],
+    armor_data: list[dict[str, Any]],
+) -> None:
+    """Test that multi-type semantic search gives each type its share."""
+
+    async def semantic_search(
+        entity_type: str, query: str, limit: int = 20, **filters: Any
+    ) -> list[dict[str, Any]]:
+        rows = {"weapons": weapon_data, "armor": armor_data}.get(entity_type, [])
+        return rows[:limit]
+
+    mock_cache.semantic_search = AsyncMock(side_effect=semantic_search)
+
+    repo = EquipmentRepository(client=MagicMock(), cache=mock_cache)
+    results = await repo.search(search="heavy", item_type=["weapon", "armor"], limit=2)
+
+    assert [item.name for item in results] == ["Longsword", "Plate"]
+    limits = {
+        call.args[0]: call.kwargs["limit"] for call in mock_cache.semantic_search.call_args_list
+    }
+    assert limits == {"weapons": 2, "armor": 2}
+
+
+@pytest.mark.asyncio
+async def test_semantic_search_fills_limit_when_item_type_runs_short(
+    mock_cache: MagicMock,
+    weapon_data: list[dict[str, Any]],
+    armor_data: list[dict[str, Any]],
+) -> None:
+    """Test that semantic results short in one type are made up from the others."""
+    rows = {
+        "weapons": [{**weapon_data[0], "name": f"Weapon {i}"} for i in range(50)],
+        "armor": [{**armor_data[0], "name": f"Armor {i}"} for i in range(50)],
+        "magic-items": [{"name": f"Ring {i}", "key": f"ring-{i}"} for i in range(2)],
+    }
+
+    async def semantic_search(
+        entity_type: str, query: str, limit: int = 20, **filters: Any
+    ) -> list[dict[str, Any]]:
+        return rows[entity_type][:limit]
+
+    mock_cache.semantic_search = AsyncMock(side_effect=semantic_search)
+
+    repo = EquipmentRepository(client=MagicMock(), cache=mock_cache)
+    results = await repo.search(search="shiny", limit=20)
+
+    assert len(results) == 20
+    assert mock_cache.semantic_search.await_count == 3
+    assert {call.kwargs["limit"] for call in mock_cache.semantic_search.call_args_list} == {20}
+
+
+@pytest.mark.asyncio
+async def test_search_multiple_item_types_skips_incompatible_types(
+    mock_cache: MagicMock, weapon_data: list[dict[str, Any]]
+) -> None:
+    """Test that item types a type-specific filter cannot match are not searched."""
+    mock_cache.get_entities.return_value = weapon_data
+
+    repo = EquipmentRepository(client=MagicMock(), cache=mock_cache)
+    await repo.search(item_type=["weapon", "armor", "magic-item"], damage_dice="1d8")
+
+    mock_cache.get_entities.assert_awaited_once_with("weapons", damage_dice="1d8")
+
+
+@pytest.mark.asyncio
+async def test_search_multiple_item_types_with_conflicting_filters(
+    mock_cache: MagicMock,
+) -> None:
+    """Test that filters no single item type supports return no results."""
+    repo = EquipmentRepository(client=MagicMock(), cache=mock_cache)
+    results = await repo.search(
+        item_type=["weapon", "armor", "magic-item"], damage_dice="1d8", rarity="rare", limit=5
+    )
+
+    assert results == []
+    mock_cache.get_entities.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_search_cache_miss_returns_at_most_limit(
+    mock_cache: MagicMock, mock_client: MagicMock, weapons: list[Weapon]
+) -> None:
+    """Test that over-returned API rows are cached but not returned past limit."""
+    mock_cache.get_entities.return_value = []
+    mock_client.get_weapons.return_value = weapons
+
+    repo = EquipmentRepository(client=mock_client, cache=mock_cache)
+    results = await repo.search(item_type="weapon", limit=1)
+
+    assert [item.name for item in results] == ["Longsword"]
+    stored = mock_cache.store_entities.await_args.args[0]
+    assert [row["name"] for row in stored] == ["Longsword", "Dagger"]
+
+
+@pytest.mark.asyncio
+async def test_semantic_fallback_validates_at_most_limit(
+    mock_cache: MagicMock, weapon_data: list[dict[str, Any]]
+) -> None:
+    """Test that the structured fallback is cut to limit before validation."""
+    mock_cache.semantic_search = AsyncMock(side_effect=NotImplementedError)
+    mock_cache.get_entities.return_value = weapon_data
+
+    repo = EquipmentRepository(client=MagicMock(), cache=mock_cache)
+    results = await repo.search(search="sword", item_type="weapon", limit=1)
+
+    assert [item.name for item in results] == ["Longsword"]
+
+
+@pytest.mark.asyncio
+async def test_upstream_fetches_are_bounded(
+    mock_cache: MagicMock, mock_client: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that concurrent cache misses share a bounded number of API slots."""
+    monkeypatch.setattr(equipment_module.settings, "equipment_fetch_concurrency", 2)
+    mock_cache.get_entities.return_value = []
+    active = peak = 0
+
+    async def get_weapons(**filters: Any) -> list[Weapon]:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+        return []
+
+    mock_client.get_weapons.side_effect = get_weapons
+
+    repo = EquipmentRepository(client=mock_client, cache=mock_cache)
+    await asyncio.gather(*(repo.search(item_type="weapon", limit=5) for _ in range(6)))
+
+    assert mock_client.get_weapons.await_count == 6
+    assert peak == 2
+
+
+def test_upstream_fetch_bound_works_across_event_loops(
+    mock_cache: MagicMock, mock_client: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that one repository keeps fetching when reused on a new event loop."""
+    mock_cache.get_entities.return_value = []
+    active = peak = 0
+
+    async def get_weapons(**filters: Any) -> list[Weapon]:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+        return []
+
+    mock_client.get_weapons.side_effect = get_weapons
+    repo = EquipmentRepository(client=mock_client, cache=mock_cache)
+
+    async def search_concurrently() -> None:
+        await asyncio.gather(*(repo.search(item_type="weapon", limit=5) for _ in range(4)))
+
+    monkeypatch.setattr(equipment_module.settings, "equipment_fetch_concurrency", 1)
+    asyncio.run(search_concurrently())
+    assert peak == 1
+
+    # A later loop picks up the setting as it stands then
+    monkeypatch.setattr(equipment_module.settings, "equipment_fetch_concurrency", 2)
+    asyncio.run(search_concurrently())
+
+    assert mock_client.get_weapons.await_count == 8
+    assert peak == 2
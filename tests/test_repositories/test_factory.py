@@ -250,3 +250,31 @@ class TestRepositoryFactoryCacheIntegration:
 
         # Should be different instances
         assert first_cache is not second_cache
+
+
+def test_factory_shares_default_client() -> None:
+    """Test that repositories built without a client share one API client."""
+    RepositoryFactory.reset_client()
+    mock_cache = MagicMock()
+
+    creature_repo = RepositoryFactory.create_creature_repository(cache=mock_cache)
+    equipment_repo = RepositoryFactory.create_equipment_repository(cache=mock_cache)
+
+    assert isinstance(creature_repo.client, Open5eV2Client)
+    assert creature_repo.client is equipment_repo.client
+    RepositoryFactory.reset_client()
+
+
+@pytest.mark.asyncio
+async def test_factory_close_client_closes_and_resets() -> None:
+    """Test that close_client closes the shared client and forgets it."""
+    RepositoryFactory.reset_client()
+    client = RepositoryFactory.get_client()
+    await client._get_client()
+
+    await RepositoryFactory.close_client()
+
+    assert client._client is None
+    assert RepositoryFactory._client_instance is None
+    assert RepositoryFactory.get_client() is not client
+    RepositoryFactory.reset_client()
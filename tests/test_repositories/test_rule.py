@@ -1,10 +1,13 @@
 """Tests for RuleRepository implementation."""
 
+from typing import get_args
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from lorekeeper_mcp.repositories import rule as rule_module
 from lorekeeper_mcp.repositories.rule import RuleRepository
+from lorekeeper_mcp.tools.search_rule import RuleType
 
 
 @pytest.fixture
@@ -120,3 +123,58 @@ async def test_rule_repository_search_document_filter_cache_miss(
     # Get the actual call args to verify document was not passed
     call_kwargs = mock_client.get_rules_v2.call_args[1]
     assert "document" not in call_kwargs
+
+
+@pytest.mark.asyncio
+async def test_rule_repository_name_filter_respects_limit(
+    mock_cache: MagicMock, mock_client: MagicMock
+) -> None:
+    """Test that name filtering stops once limit matches are found."""
+    mock_cache.get_entities.return_value = [
+        {"name": "Acrobatics", "slug": "acrobatics"},
+        {"name": "Athletics", "slug": "athletics"},
+        {"name": "Arcana", "slug": "arcana"},
+        {"name": "Stealth", "slug": "stealth"},
+    ]
+
+    repo = RuleRepository(client=mock_client, cache=mock_cache)
+    results = await repo.search(rule_type="skill", name="ics", limit=1)
+
+    assert results == [{"name": "Acrobatics", "slug": "acrobatics"}]
+
+
+@pytest.mark.asyncio
+async def test_rule_repository_name_filter_uses_casefold(
+    mock_cache: MagicMock, mock_client: MagicMock
+) -> None:
+    """Test that name matching folds case beyond str.lower()."""
+    mock_cache.get_entities.return_value = [
+        {"name": "Großer Schild", "slug": "grosser-schild"},
+        {"name": "Stealth", "slug": "stealth"},
+    ]
+
+    repo = RuleRepository(client=mock_client, cache=mock_cache)
+    results = await repo.search(rule_type="skill", name="GROSSER")
+
+    assert results == [{"name": "Großer Schild", "slug": "grosser-schild"}]
+
+
+def test_every_rule_type_has_a_search_method() -> None:
+    """Test that the dispatch tables cover every RuleType with real methods."""
+    rule_types = set(get_args(RuleType))
+
+    assert set(rule_module._RULE_TYPE_SEARCHES) == rule_types
+    assert set(rule_module._RULE_TYPE_COLLECTIONS) == rule_types
+    for method_name in rule_module._RULE_TYPE_SEARCHES.values():
+        assert callable(getattr(RuleRepository, method_name))
+
+
+@pytest.mark.asyncio
+async def test_rule_repository_unknown_rule_type_returns_empty(
+    mock_cache: MagicMock, mock_client: MagicMock
+) -> None:
+    """Test that an unrecognized rule type returns no results without lookups."""
+    repo = RuleRepository(client=mock_client, cache=mock_cache)
+
+    assert await repo.search(rule_type="spell-slot") == []
+    mock_cache.get_entities.assert_not_awaited()
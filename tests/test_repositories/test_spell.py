@@ -657,3 +657,35 @@ def test_repository_class_and_school_together() -> None:
     assert result["classes__key"] == "srd_sorcerer"
     assert result["school__key"] == "abjuration"
     assert result["concentration"] is True
+
+
+@pytest.mark.asyncio
+async def test_spell_repository_cached_class_filter_ignores_case(
+    mock_cache: MagicMock, mock_client: MagicMock, spell_data: list[dict[str, Any]]
+) -> None:
+    """Test that cached results are filtered by class regardless of case."""
+    spell_data[0]["classes"] = ["Wizard", "Sorcerer"]
+    spell_data[1]["classes"] = [{"index": "wizard"}]
+    spell_data[2]["classes"] = ["sorcerer"]
+    mock_cache.get_entities.return_value = spell_data
+
+    repo = SpellRepository(client=mock_client, cache=mock_cache)
+    results = await repo.search(class_key="WIZARD")
+
+    assert [spell.name for spell in results] == ["Fireball", "Magic Missile"]
+    mock_client.get_spells.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_spell_repository_pushes_limit_to_cache_query(
+    mock_cache: MagicMock, mock_client: MagicMock, spell_data: list[dict[str, Any]]
+) -> None:
+    """Test that limit reaches the cache unless a client-side class filter needs every row."""
+    mock_cache.get_entities.return_value = spell_data[:1]
+    repo = SpellRepository(client=mock_client, cache=mock_cache)
+
+    await repo.search(level=3, limit=5)
+    mock_cache.get_entities.assert_called_with("spells", level=3, limit=5)
+
+    await repo.search(level=3, class_key="wizard", limit=5)
+    mock_cache.get_entities.assert_called_with("spells", level=3)
@@ -1,6 +1,11 @@
 """Tests for FastMCP server initialization."""
 
-from lorekeeper_mcp import mcp
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from lorekeeper_mcp import mcp, server
 
 
 def test_server_instance_exists(mcp_server):
@@ -12,3 +17,38 @@ def test_server_instance_exists(mcp_server):
 def test_server_exports_from_package():
     """Test that server is exported from package."""
     assert mcp is not None
+
+
+@pytest.mark.asyncio
+async def test_lifespan_warms_rule_cache_when_enabled(monkeypatch):
+    """Test that the lifespan starts rule warm-up only when it is enabled."""
+    warm_up = AsyncMock()
+    monkeypatch.setattr(server, "warm_up_rules", warm_up)
+    monkeypatch.setattr(server.RepositoryFactory, "close_client", AsyncMock())
+
+    monkeypatch.setattr(server.settings, "warm_rule_cache", False)
+    async with server.lifespan(mcp):
+        await asyncio.sleep(0)
+    warm_up.assert_not_called()
+
+    monkeypatch.setattr(server.settings, "warm_rule_cache", True)
+    async with server.lifespan(mcp):
+        await asyncio.sleep(0)
+    warm_up.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_warms_spell_cache_when_enabled(monkeypatch):
+    """Test that spell warm-up runs only when its setting is enabled."""
+    warm_up = AsyncMock()
+    monkeypatch.setattr(server, "warm_up_spells", warm_up)
+    monkeypatch.setattr(server.RepositoryFactory, "close_client", AsyncMock())
+
+    async with server.lifespan(mcp):
+        await asyncio.sleep(0)
+    warm_up.assert_not_called()
+
+    monkeypatch.setattr(server.settings, "warm_spell_cache", True)
+    async with server.lifespan(mcp):
+        await asyncio.sleep(0)
+    warm_up.assert_awaited_once()
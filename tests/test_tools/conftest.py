@@ -20,11 +20,25 @@ def cleanup_tool_contexts():
     char_mod = sys.modules.get("lorekeeper_mcp.tools.search_character_option")
     equip_mod = sys.modules.get("lorekeeper_mcp.tools.search_equipment")
     rule_mod = sys.modules.get("lorekeeper_mcp.tools.search_rule")
+    docs_mod = sys.modules.get("lorekeeper_mcp.tools.list_documents")
+    all_mod = sys.modules.get("lorekeeper_mcp.tools.search_all")
 
     if spell_mod and hasattr(spell_mod, "_repository_context"):
         spell_mod._repository_context.clear()
     if creature_mod and hasattr(creature_mod, "_repository_context"):
         creature_mod._repository_context.clear()
+    if spell_mod and hasattr(spell_mod, "clear_spell_cache"):
+        spell_mod.clear_spell_cache()
+    if creature_mod and hasattr(creature_mod, "clear_creature_cache"):
+        creature_mod.clear_creature_cache()
+    if equip_mod and hasattr(equip_mod, "clear_equipment_cache"):
+        equip_mod.clear_equipment_cache()
+    if rule_mod and hasattr(rule_mod, "clear_rule_cache"):
+        rule_mod.clear_rule_cache()
+    if docs_mod and hasattr(docs_mod, "clear_documents_cache"):
+        docs_mod.clear_documents_cache()
+    if all_mod and hasattr(all_mod, "clear_search_all_cache"):
+        all_mod.clear_search_all_cache()
     if char_mod and hasattr(char_mod, "_repository_context"):
         char_mod._repository_context.clear()
     if equip_mod and hasattr(equip_mod, "_repository_context"):
@@ -32,8 +46,14 @@ def cleanup_tool_contexts():
     if rule_mod and hasattr(rule_mod, "_repository_context"):
         rule_mod._repository_context.clear()
 
-    # Clear the factory cache singleton to prevent test isolation issues
+    # Drop memoized default repositories so each test builds its own
+    for mod in (spell_mod, creature_mod, char_mod, equip_mod, rule_mod):
+        if mod and hasattr(mod, "_default_repository"):
+            mod._default_repository.cache_clear()
+
+    # Clear the factory singletons to prevent test isolation issues
     RepositoryFactory._cache_instance = None
+    RepositoryFactory.reset_client()
 
 
 @pytest.fixture
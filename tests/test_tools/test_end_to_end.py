@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from lorekeeper_mcp.models import Creature, Spell
+from lorekeeper_mcp.models import Creature, Spell, Weapon
 
 # Import actual modules to access both functions and _repository_context
 # Use importlib to get the actual module objects (not the re-exported functions)
@@ -178,17 +178,23 @@ async def test_character_option_search_workflow():
 @pytest.mark.asyncio
 async def test_equipment_search_workflow():
     """Test equipment search workflow."""
-    # Create mock equipment objects with model_dump method
-    mock_weapon = MagicMock()
-    mock_weapon.name = "Longsword"
-    mock_weapon.damage_dice = "1d8"
-    mock_weapon.model_dump.return_value = {
-        "name": "Longsword",
-        "damage_dice": "1d8",
-    }
+    # Equipment is serialized through a pydantic TypeAdapter, so use a real model
+    weapon = Weapon(
+        name="Longsword",
+        slug="longsword",
+        desc="A versatile martial blade",
+        document_url="https://example.com/longsword",
+        damage_dice="1d8",
+        damage_type="Slashing",
+        range=5,
+        long_range=5,
+        distance_unit="feet",
+        is_simple=False,
+        is_improvised=False,
+    )
 
     mock_equipment_repository = MagicMock()
-    mock_equipment_repository.search = AsyncMock(return_value=[mock_weapon])
+    mock_equipment_repository.search = AsyncMock(return_value=[weapon])
 
     # Set up context injection
     search_equipment_module._repository_context["repository"] = mock_equipment_repository
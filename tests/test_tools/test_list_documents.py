@@ -4,7 +4,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from lorekeeper_mcp.tools.list_documents import list_documents
+from lorekeeper_mcp.tools.list_documents import clear_documents_cache, list_documents
 
 
 @pytest.mark.asyncio
@@ -12,8 +12,9 @@ async def test_list_documents() -> None:
     """Test list_documents returns document list."""
     # Mock the MilvusCache to return test data
     mock_cache = AsyncMock()
-    mock_cache.get_available_documents = AsyncMock(return_value=["srd-5e"])
-    mock_cache.get_document_metadata = AsyncMock(return_value={"spells": 50, "creatures": 50})
+    mock_cache.get_all_document_metadata = AsyncMock(
+        return_value={"srd-5e": {"spells": 50, "creatures": 50}}
+    )
 
     with patch("lorekeeper_mcp.tools.list_documents.MilvusCache", return_value=mock_cache):
         result = await list_documents()
@@ -25,6 +26,23 @@ async def test_list_documents() -> None:
         assert result[0]["entity_types"] == {"spells": 50, "creatures": 50}
 
 
+@pytest.mark.asyncio
+async def test_list_documents_sorts_by_entity_count() -> None:
+    """Test list_documents orders documents by total entity count."""
+    mock_cache = AsyncMock()
+    mock_cache.get_all_document_metadata = AsyncMock(
+        return_value={"srd-5e": {"spells": 5}, "tce": {"spells": 3, "creatures": 9}}
+    )
+
+    with patch("lorekeeper_mcp.tools.list_documents.MilvusCache", return_value=mock_cache):
+        result = await list_documents()
+
+    assert [(doc["document"], doc["entity_count"]) for doc in result] == [
+        ("tce", 12),
+        ("srd-5e", 5),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_list_documents_source_filter() -> None:
     """Test list_documents with source filter."""
@@ -37,6 +55,39 @@ async def test_list_documents_source_filter() -> None:
             assert doc["source_api"] == "open5e_v2"
 
 
+@pytest.mark.asyncio
+async def test_list_documents_reuses_recent_listing() -> None:
+    """Test list_documents serves repeated calls from its result cache."""
+    mock_cache = AsyncMock()
+    mock_cache.get_all_document_metadata = AsyncMock(return_value={"srd-5e": {"spells": 5}})
+
+    with patch("lorekeeper_mcp.tools.list_documents.MilvusCache", return_value=mock_cache):
+        first = await list_documents()
+        first.clear()
+        second = await list_documents()
+        clear_documents_cache()
+        await list_documents()
+
+    assert [doc["document"] for doc in second] == ["srd-5e"]
+    assert mock_cache.get_all_document_metadata.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_list_documents_rows_do_not_share_cached_state() -> None:
+    """Test that editing a returned row leaves the cached listing intact."""
+    mock_cache = AsyncMock()
+    mock_cache.get_all_document_metadata = AsyncMock(return_value={"srd-5e": {"spells": 5}})
+
+    with patch("lorekeeper_mcp.tools.list_documents.MilvusCache", return_value=mock_cache):
+        first = await list_documents()
+        first[0]["entity_count"] = 0
+        first[0]["entity_types"]["spells"] = 0
+        second = await list_documents()
+
+    assert second == [{"document": "srd-5e", "entity_count": 5, "entity_types": {"spells": 5}}]
+    mock_cache.get_all_document_metadata.assert_awaited_once()
+
+
 def test_list_documents_docstring_references() -> None:
     """Test that docstring references documents parameter, not document_keys."""
     docstring = list_documents.__doc__
@@ -5,9 +5,12 @@ from lorekeeper_mcp.tools import (
     search_all,
     search_character_option,
     search_creature,
+    search_creatures,
     search_equipment,
     search_rule,
+    search_rules,
     search_spell,
+    search_spells,
 )
 
 
@@ -23,6 +26,9 @@ def test_tools_init_exports():
     assert callable(search_all)
     assert callable(search_spell)
     assert callable(search_creature)
+    assert callable(search_creatures)
     assert callable(search_character_option)
     assert callable(search_equipment)
     assert callable(search_rule)
+    assert callable(search_rules)
+    assert callable(search_spells)
@@ -1,10 +1,12 @@
 """Tests for search_all tool."""
 
+import asyncio
 import sys
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from lorekeeper_mcp.repositories.factory import RepositoryFactory
 from lorekeeper_mcp.tools.search_all import search_all
 
 
@@ -301,6 +303,16 @@ async def test_search_all_empty_documents(mock_client_factory):
     mock_client_factory.unified_search.assert_not_awaited()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [0, -1])
+async def test_search_all_non_positive_limit_skips_api(mock_client_factory, limit):
+    """Test that a non-positive limit returns no results without an API call."""
+    result = await search_all(query="fire", content_types=["Spell", "Item"], limit=limit)
+
+    assert result == []
+    mock_client_factory.unified_search.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_search_all_documents_with_content_types(mock_client_factory):
     """Test documents post-filtering with content_types specified."""
@@ -355,3 +367,163 @@ async def test_search_all_both_fuzzy_and_vector_always_enabled(mock_client_facto
     call_kwargs = mock_client_factory.unified_search.call_args[1]
     assert call_kwargs["vector"] is True
     assert call_kwargs["fuzzy"] is True
+
+
+@pytest.mark.asyncio
+async def test_content_type_searches_run_concurrently(mock_client_factory):
+    """Test that per-type searches overlap and keep content_types order."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def unified_search(**kwargs):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return [{"object_name": kwargs["object_model"]}]
+
+    mock_client_factory.unified_search.side_effect = unified_search
+
+    result = await search_all(query="fire", content_types=["Spell", "Creature", "Item"])
+
+    assert max_in_flight == 3
+    assert [r["object_name"] for r in result] == ["Spell", "Creature", "Item"]
+
+
+@pytest.mark.asyncio
+async def test_search_all_documents_overfetches(mock_client_factory):
+    """Test that document filtering requests extra rows to fill the limit."""
+    mock_client_factory.unified_search.return_value = []
+
+    await search_all(query="fire", documents=["srd-5e"], limit=10)
+    assert mock_client_factory.unified_search.call_args[1]["limit"] == 30
+
+    await search_all(query="fire", limit=10)
+    assert mock_client_factory.unified_search.call_args[1]["limit"] == 10
+
+
+@pytest.mark.asyncio
+async def test_search_all_documents_matches_nested_document_key(mock_client_factory):
+    """Test that v2-style nested document objects are matched by key."""
+    mock_client_factory.unified_search.return_value = [
+        {"object_name": "Fireball", "document": {"key": "srd-5e", "name": "SRD"}},
+        {"object_name": "Fire Bolt", "document": {"key": "tce", "name": "Tasha's"}},
+    ]
+
+    result = await search_all(query="fire", documents=["srd-5e"], limit=10)
+
+    assert [r["object_name"] for r in result] == ["Fireball"]
+
+
+def test_open5e_client_is_shared_with_repositories():
+    """Test that search_all reuses the factory's client across calls."""
+    search_module = sys.modules["lorekeeper_mcp.tools.search_all"]
+    RepositoryFactory.reset_client()
+    try:
+        client = search_module._get_open5e_client()
+
+        assert search_module._get_open5e_client() is client
+        assert RepositoryFactory.get_client() is client
+    finally:
+        RepositoryFactory.reset_client()
+
+
+@pytest.mark.asyncio
+async def test_search_all_caches_normalized_query(mock_client_factory):
+    """Test that repeat searches differing only in spacing hit the cache."""
+    mock_client_factory.unified_search.return_value = [
+        {"object_name": "Fireball", "document": "srd-5e"}
+    ]
+
+    first = await search_all(query="Fireball", documents=["srd-5e", "tce"])
+    first.clear()
+    second = await search_all(query="  Fireball ", documents=["tce", "srd-5e"])
+
+    mock_client_factory.unified_search.assert_awaited_once()
+    assert mock_client_factory.unified_search.call_args.kwargs["query"] == "Fireball"
+    assert [r["object_name"] for r in second] == ["Fireball"]
+
+
+@pytest.mark.asyncio
+async def test_search_all_cache_keeps_query_case(mock_client_factory):
+    """Test that queries differing in case are searched upstream as sent."""
+    mock_client_factory.unified_search.return_value = []
+
+    await search_all(query="FIRE")
+    await search_all(query="fire")
+
+    queries = [call.kwargs["query"] for call in mock_client_factory.unified_search.call_args_list]
+    assert queries == ["FIRE", "fire"]
+
+
+@pytest.mark.asyncio
+async def test_search_all_cache_keeps_content_type_order(mock_client_factory):
+    """Test that reordered content_types are cached separately."""
+    mock_client_factory.unified_search.return_value = []
+
+    await search_all(query="fireball", content_types=["Spell", "Item"])
+    await search_all(query="fireball", content_types=["Item", "Spell"])
+
+    assert mock_client_factory.unified_search.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_search_all_coalesces_concurrent_identical_queries(mock_client_factory):
+    """Test that identical in-flight searches share one upstream request."""
+    release = asyncio.Event()
+
+    async def unified_search(**kwargs):
+        await release.wait()
+        return [{"object_name": "Fireball"}]
+
+    mock_client_factory.unified_search.side_effect = unified_search
+
+    tasks = [asyncio.create_task(search_all(query="fireball")) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    mock_client_factory.unified_search.assert_awaited_once()
+    assert all(result == [{"object_name": "Fireball"}] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_content_type_limit_rounds_up_and_interleaves(mock_client_factory):
+    """Test that small limits still query every type and mix results fairly."""
+
+    async def unified_search(**kwargs):
+        model = kwargs["object_model"]
+        return [{"object_name": f"{model}{i}"} for i in range(kwargs["limit"])]
+
+    mock_client_factory.unified_search.side_effect = unified_search
+
+    result = await search_all(query="fire", content_types=["Spell", "Creature", "Item"], limit=4)
+
+    limits = {call[1]["limit"] for call in mock_client_factory.unified_search.call_args_list}
+    assert limits == {2}
+    assert [r["object_name"] for r in result] == ["Spell0", "Creature0", "Item0", "Spell1"]
+
+
+@pytest.mark.asyncio
+async def test_content_type_limit_is_at_least_one(mock_client_factory):
+    """Test that a per-type limit never reaches the API as zero."""
+    search_module = sys.modules["lorekeeper_mcp.tools.search_all"]
+    mock_client_factory.unified_search.return_value = []
+
+    await search_module._unified_search("fire", ["Spell", "Item"], None, 0)
+
+    limits = {call[1]["limit"] for call in mock_client_factory.unified_search.call_args_list}
+    assert limits == {1}
+
+
+@pytest.mark.asyncio
+async def test_duplicate_content_types_are_searched_once(mock_client_factory):
+    """Test that repeated content types do not repeat upstream searches."""
+    mock_client_factory.unified_search.return_value = []
+
+    await search_all(query="fire", content_types=["Spell", "Item", "Spell"], limit=10)
+
+    models = [call[1]["object_model"] for call in mock_client_factory.unified_search.call_args_list]
+    assert models == ["Spell", "Item"]
+    assert mock_client_factory.unified_search.call_args[1]["limit"] == 5
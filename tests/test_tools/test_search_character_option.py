@@ -2,6 +2,7 @@
 
 import importlib
 import inspect
+from typing import get_args
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -85,6 +86,19 @@ async def test_search_invalid_type():
         await search_character_option(type="invalid-type")  # type: ignore[arg-type]
 
 
+def test_valid_option_types_match_option_type_literal():
+    """Test that runtime validation uses exactly the OptionType values."""
+    expected = frozenset(get_args(search_character_option_module.OptionType))
+    assert expected == search_character_option_module.VALID_OPTION_TYPES
+
+
+@pytest.mark.asyncio
+async def test_search_invalid_type_lists_sorted_types():
+    """Test that the error lists the valid option types in a stable order."""
+    with pytest.raises(ValueError, match=r"Must be one of: background, class, feat, race$"):
+        await search_character_option(type="subclass")  # type: ignore[arg-type]
+
+
 @pytest.mark.asyncio
 async def test_search_character_option_with_limit(repository_context):
     """Test that limit parameter is passed to repository."""
@@ -98,6 +112,16 @@ async def test_search_character_option_with_limit(repository_context):
     assert call_kwargs["limit"] == 5
 
 
+@pytest.mark.asyncio
+async def test_search_character_option_passes_name_to_repository(repository_context):
+    """Test that name filtering is delegated to the repository."""
+    repository_context.search.return_value = [{"name": "High Elf"}]
+
+    await search_character_option(type="race", name="elf")
+
+    assert repository_context.search.call_args.kwargs["name"] == "elf"
+
+
 @pytest.mark.asyncio
 async def test_search_character_option_empty_results(repository_context):
     """Test character option search with no results."""
@@ -208,3 +232,20 @@ async def test_search_character_option_search_none_not_passed(repository_context
     call_kwargs = repository_context.search.call_args[1]
     # search should not be in the params when None
     assert "search" not in call_kwargs
+
+
+@pytest.mark.asyncio
+async def test_search_character_option_non_positive_limit_skips_repository(repository_context):
+    """Test that limit=0 returns no results without a repository call."""
+    assert await search_character_option(type="class", limit=0) == []
+    repository_context.search.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_search_character_option_blank_name_is_ignored(repository_context):
+    """Test that a whitespace-only name does not become a filter."""
+    repository_context.search.return_value = []
+
+    await search_character_option(type="feat", name="  ")
+
+    assert "name" not in repository_context.search.call_args.kwargs
@@ -1,8 +1,10 @@
 """Tests for creature search tool."""
 
+import asyncio
 import importlib
 import inspect
-from unittest.mock import AsyncMock, MagicMock
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -665,3 +667,87 @@ async def test_search_creature_search_none_not_passed(repository_context):
     call_kwargs = repository_context.search.call_args[1]
     # search should not be in the params when None
     assert "search" not in call_kwargs
+
+
+@pytest.mark.asyncio
+async def test_search_creature_coalesces_concurrent_queries(repository_context):
+    """Test that concurrent identical queries issue a single repository call."""
+    release = asyncio.Event()
+
+    async def slow_search(**kwargs):
+        await release.wait()
+        return []
+
+    repository_context.search.side_effect = slow_search
+
+    tasks = [asyncio.create_task(search_creature(type="dragon")) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert results == [[], [], []]
+    repository_context.search.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_search_creature_cache_keeps_type_and_size_case(repository_context):
+    """Test that case-only variants of type and size are separate queries."""
+    repository_context.search.return_value = []
+
+    await search_creature(type="Dragon", size="Huge")
+    await search_creature(type="dragon", size="huge")
+
+    assert [
+        (call.kwargs["type"], call.kwargs["size"])
+        for call in repository_context.search.await_args_list
+    ] == [("Dragon", "Huge"), ("dragon", "huge")]
+
+
+@pytest.mark.asyncio
+async def test_search_creature_unfiltered_call_uses_prebuilt_key(repository_context):
+    """Test that unfiltered default-limit calls share the prebuilt cache key."""
+    repository_context.search.return_value = []
+
+    with patch.object(
+        search_creature_module, "make_cache_key", wraps=search_creature_module.make_cache_key
+    ) as make_key:
+        await search_creature()
+        await search_creature(limit=20)
+
+    make_key.assert_not_called()
+    repository_context.search.assert_awaited_once()
+    assert (
+        search_creature_module._creature_cache.get(search_creature_module._DEFAULT_BROWSE_KEY) == []
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_creature_non_positive_limit_skips_repository(repository_context):
+    """Test that limit=0 returns no results without a repository call."""
+    assert await search_creature(limit=0) == []
+    repository_context.search.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_search_creature_results_are_plain_json_types(repository_context):
+    """Test that results serialize with the stdlib encoder and round-trip unchanged."""
+    repository_context.search.return_value = [
+        Creature(
+            name="Adult Red Dragon",
+            slug="adult-red-dragon",
+            size="Huge",
+            type="dragon",
+            alignment="chaotic evil",
+            armor_class=19,
+            hit_points=256,
+            hit_dice="19d12+133",
+            challenge_rating="17",
+            challenge_rating_decimal=17.0,
+            speed={"walk": 40, "fly": 80},
+            actions=[{"name": "Bite", "desc": "Melee Weapon Attack"}],
+        )
+    ]
+
+    result = await search_creature(type="dragon")
+
+    assert json.loads(json.dumps(result)) == result
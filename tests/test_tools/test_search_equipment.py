@@ -3,7 +3,7 @@
 import importlib
 import inspect
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -257,6 +257,14 @@ async def test_search_equipment_default_repository():
     assert "repository" not in sig.parameters
 
 
+def test_search_equipment_name_is_last_parameter():
+    """Test that adding name kept the positional order of existing parameters."""
+    parameters = list(inspect.signature(search_equipment).parameters)
+
+    assert parameters[:2] == ["type", "rarity"]
+    assert parameters[-2:] == ["limit", "name"]
+
+
 @pytest.mark.asyncio
 async def test_search_magic_items(repository_context):
     """Test looking up magic items."""
@@ -360,19 +368,8 @@ async def test_search_all_equipment_types(repository_context):
         requires_attunement=False,
     )
 
-    # Mock returns different items based on item_type filter
-    def search_side_effect(**kwargs: Any) -> list[Any]:
-        """Return different results based on item_type."""
-        item_type = kwargs.get("item_type")
-        if item_type == "weapon":
-            return [sample_longsword]
-        if item_type == "armor":
-            return [sample_armor]
-        if item_type == "magic-item":
-            return [sample_magic]
-        return []
-
-    repository_context.search.side_effect = search_side_effect
+    # Repository searches every item type in a single call
+    repository_context.search.return_value = [sample_longsword, sample_armor, sample_magic]
 
     result = await search_equipment(type="all", limit=20)
 
@@ -380,6 +377,9 @@ async def test_search_all_equipment_types(repository_context):
     assert len(result) == 3
     names = {item["name"] for item in result}
     assert names == {"Longsword", "Plate", "Cloak of Invisibility"}
+    repository_context.search.assert_awaited_once_with(
+        limit=20, item_type=["weapon", "armor", "magic-item"]
+    )
 
 
 @pytest.mark.asyncio
@@ -670,3 +670,70 @@ async def test_search_equipment_search_none_not_passed(repository_context, sampl
     call_kwargs = repository_context.search.call_args[1]
     # search should not be in the params when None
     assert "search" not in call_kwargs
+
+
+@pytest.mark.asyncio
+async def test_search_all_equipment_passes_type_specific_filters(repository_context):
+    """Test that type="all" forwards every filter for the repository to route."""
+    repository_context.search.return_value = []
+
+    await search_equipment(type="all", damage_dice="1d8", rarity="rare", cost_max=50)
+
+    repository_context.search.assert_awaited_once_with(
+        limit=20,
+        item_type=["weapon", "armor", "magic-item"],
+        damage_dice="1d8",
+        rarity="rare",
+        cost_max=50,
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_equipment_name_filter(repository_context):
+    """Test that name is forwarded to the repository rather than post-filtered."""
+    repository_context.search.return_value = []
+
+    await search_equipment(type="armor", name="chain", limit=5)
+
+    repository_context.search.assert_awaited_once_with(limit=5, item_type="armor", name="chain")
+
+
+@pytest.mark.asyncio
+async def test_search_equipment_unfiltered_call_uses_prebuilt_key(repository_context):
+    """Test that unfiltered default-limit calls share the prebuilt cache key."""
+    repository_context.search.return_value = []
+
+    with patch.object(
+        search_equipment_module, "make_cache_key", wraps=search_equipment_module.make_cache_key
+    ) as make_key:
+        await search_equipment()
+        await search_equipment(type="all", limit=20)
+
+    make_key.assert_not_called()
+    repository_context.search.assert_awaited_once()
+    assert (
+        search_equipment_module._equipment_cache.get(search_equipment_module._DEFAULT_BROWSE_KEY)
+        == []
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_equipment_normalizes_name(repository_context):
+    """Test that padded and blank names are normalized before lookup."""
+    repository_context.search.return_value = []
+
+    await search_equipment(type="armor", name="  Plate ")
+    await search_equipment(type="armor", name="plate")
+    await search_equipment(type="armor", name="   ")
+
+    assert repository_context.search.await_count == 2
+    first, blank = repository_context.search.await_args_list
+    assert first.kwargs["name"] == "Plate"
+    assert "name" not in blank.kwargs
+
+
+@pytest.mark.asyncio
+async def test_search_equipment_non_positive_limit_skips_repository(repository_context):
+    """Test that limit=0 returns no results without a repository call."""
+    assert await search_equipment(limit=0) == []
+    repository_context.search.assert_not_called()
@@ -1,13 +1,15 @@
 """Tests for rule search tool."""
 
+import asyncio
 import contextlib
 import importlib
 import inspect
+from typing import get_args
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from lorekeeper_mcp.tools.search_rule import search_rule
+from lorekeeper_mcp.tools.search_rule import RuleQuery, search_rule
 
 search_rule_module = importlib.import_module("lorekeeper_mcp.tools.search_rule")
 
@@ -20,6 +22,22 @@ async def test_search_invalid_rule_type():
         await search_rule(rule_type="invalid-rule-type")  # type: ignore[arg-type]
 
 
+@pytest.mark.asyncio
+async def test_search_invalid_rule_type_lists_sorted_types():
+    """Test that the error lists the valid rule types in sorted order."""
+    with pytest.raises(ValueError) as exc_info:
+        await search_rule(rule_type="spell-slot")  # type: ignore[arg-type]
+
+    listed = str(exc_info.value).split("Must be one of: ")[1].split(", ")
+    assert listed == sorted(get_args(search_rule_module.RuleType))
+
+
+def test_valid_rule_types_match_rule_type_literal():
+    """Test that runtime validation uses exactly the RuleType values."""
+    expected = frozenset(get_args(search_rule_module.RuleType))
+    assert expected == search_rule_module.VALID_RULE_TYPES
+
+
 @pytest.fixture
 def mock_rule_repository() -> MagicMock:
     """Create mock rule repository for testing."""
@@ -307,3 +325,92 @@ async def test_search_rule_search_none_not_passed(repository_context):
     call_kwargs = repository_context.search.call_args[1]
     # search should not be in the params when None
     assert "search" not in call_kwargs
+
+
+@pytest.mark.asyncio
+async def test_search_rule_cache_ignores_section_for_other_types(repository_context):
+    """Test that section does not split cache entries when it is ignored."""
+    repository_context.search.return_value = []
+
+    await search_rule(rule_type="condition")
+    await search_rule(rule_type="condition", section="combat")
+
+    repository_context.search.assert_awaited_once()
+    assert "section" not in repository_context.search.call_args.kwargs
+
+
+@pytest.mark.asyncio
+async def test_search_rule_coalesces_concurrent_queries(repository_context):
+    """Test that concurrent identical lookups issue a single repository call."""
+    release = asyncio.Event()
+
+    async def slow_search(**kwargs):
+        await release.wait()
+        return [{"name": "Prone", "desc": "..."}]
+
+    repository_context.search.side_effect = slow_search
+
+    tasks = [
+        asyncio.create_task(search_rule(rule_type="condition", search="prone")) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert all(result == [{"name": "Prone", "desc": "..."}] for result in results)
+    repository_context.search.assert_awaited_once()
+
+
+def test_rule_query_rejects_unknown_rule_type():
+    """Test that batch queries validate rule_type against RuleType."""
+    with pytest.raises(ValueError, match="rule_type"):
+        RuleQuery(rule_type="spell-slot")  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_search_rule_non_positive_limit_skips_repository(repository_context):
+    """Test that limit=0 returns no results without a repository call."""
+    assert await search_rule(rule_type="condition", limit=0) == []
+    repository_context.search.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_rules_loads_every_rule_type(repository_context):
+    """Test that warm-up loads each rule type in full and primes its default search."""
+    repository_context.search.return_value = []
+
+    await search_rule_module.warm_up_rules()
+
+    rule_types = set(get_args(search_rule_module.RuleType))
+    warmed = {
+        call.kwargs["rule_type"]
+        for call in repository_context.search.call_args_list
+        if call.kwargs["limit"] == search_rule_module._WARM_UP_LIMIT
+    }
+    assert warmed == rule_types
+    assert repository_context.search.await_count == 2 * len(rule_types)
+
+    await search_rule(rule_type="condition")
+    assert repository_context.search.await_count == 2 * len(rule_types)
+
+
+@pytest.mark.asyncio
+async def test_warm_up_rules_tolerates_failures(repository_context, caplog):
+    """Test that a failing rule type is logged without aborting the others."""
+
+    async def search(**kwargs):
+        if kwargs["rule_type"] == "skill":
+            raise RuntimeError("upstream down")
+        return []
+
+    repository_context.search.side_effect = search
+
+    await search_rule_module.warm_up_rules()
+
+    assert "Failed to warm skill rules" in caplog.text
+    assert (
+        search_rule_module._rule_cache.get(
+            search_rule_module.make_cache_key("condition", None, None, None, 20)
+        )
+        == []
+    )
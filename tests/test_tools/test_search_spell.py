@@ -589,3 +589,101 @@ async def test_search_spell_search_none_not_passed(repository_context):
     call_kwargs = repository_context.search.call_args[1]
     # search should not be in the params when None
     assert "search" not in call_kwargs
+
+
+@pytest.mark.asyncio
+async def test_search_spell_non_positive_limit_skips_repository(repository_context):
+    """Test that limit=0 returns no results without a repository call."""
+    assert await search_spell(limit=0) == []
+    repository_context.search.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_spells_fetches_full_list(repository_context):
+    """Test that warm-up fetches every spell and primes the default search."""
+    repository_context.search.return_value = []
+
+    await search_spell_module.warm_up_spells()
+
+    assert repository_context.search.await_args_list[0].kwargs == {
+        "limit": search_spell_module._WARM_UP_LIMIT
+    }
+    await search_spell()
+    assert repository_context.search.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_warm_up_spells_logs_failures(repository_context, caplog):
+    """Test that a failed warm-up is logged instead of raised."""
+    repository_context.search.side_effect = NetworkError("Connection timeout")
+
+    await search_spell_module.warm_up_spells()
+
+    assert "Failed to warm spell cache" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_search_spell_cache_keeps_school_case(repository_context):
+    """Test that school variants differing only in case are not served from one entry."""
+    fireball = Spell(
+        name="Fireball",
+        slug="fireball",
+        level=3,
+        school="evocation",
+        casting_time="1 action",
+        range="150 feet",
+        components="V,S,M",
+        duration="Instantaneous",
+        concentration=False,
+        ritual=False,
+        desc="A bright streak flashes...",
+        document_url="https://example.com/fireball",
+    )
+    repository_context.search.side_effect = [[], [fireball]]
+
+    capitalized = await search_spell(school="Evocation")
+    lowercase = await search_spell(school="evocation")
+
+    assert capitalized == []
+    assert [spell["name"] for spell in lowercase] == ["Fireball"]
+    assert repository_context.search.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_search_spell_default_browse_uses_prebuilt_key(repository_context):
+    """Test that the unfiltered default call is cached under the prebuilt key."""
+    repository_context.search.return_value = []
+
+    await search_spell()
+
+    assert search_spell_module._spell_cache.get(search_spell_module._DEFAULT_BROWSE_KEY) == []
+    await search_spell(limit=20)
+    repository_context.search.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_search_spell_collapses_equivalent_level_filters(repository_context):
+    """Test that redundant level ranges reduce to an exact level."""
+    repository_context.search.return_value = []
+
+    await search_spell(level_min=3, level_max=3)
+    assert repository_context.search.call_args.kwargs == {"limit": 20, "level": 3}
+
+    # Equivalent forms share the cached result
+    await search_spell(level=3)
+    await search_spell(level=3, level_min=1, level_max=5)
+    repository_context.search.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_search_spell_keeps_unsatisfiable_level_filters(repository_context):
+    """Test that a level outside its range is passed through unchanged."""
+    repository_context.search.return_value = []
+
+    await search_spell(level=7, level_max=5)
+
+    assert repository_context.search.call_args.kwargs == {
+        "limit": 20,
+        "level": 7,
+        "level_max": 5,
+    }
@@ -0,0 +1,294 @@
+"""Tests for the repository, result caching and batching shared by the search tools."""
+
+import asyncio
+import importlib
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from lorekeeper_mcp.models import Creature, Spell
+from lorekeeper_mcp.tools import batch
+
+
+def _tool_module(name: str) -> ModuleType:
+    """Import a tool module by its short name."""
+    return importlib.import_module(f"lorekeeper_mcp.tools.{name}")
+
+
+def _creature(name: str) -> Creature:
+    """Build a minimal creature named after the query that found it."""
+    return Creature(
+        name=name,
+        slug=name.lower().replace(" ", "-"),
+        desc="",
+        size="Medium",
+        type="undead",
+        alignment="neutral evil",
+        armor_class=12,
+        hit_points=10,
+        hit_dice="2d8",
+        challenge_rating="1",
+    )
+
+
+def _spell(name: str) -> Spell:
+    """Build a minimal spell named after the query that found it."""
+    return Spell(
+        name=name,
+        slug=name.lower().replace(" ", "-"),
+        level=3,
+        school="Evocation",
+        casting_time="1 action",
+        range="Self",
+        components="V",
+        duration="Instantaneous",
+        desc="",
+    )
+
+
+def _rule(name: str) -> dict[str, Any]:
+    """Build a minimal rule named after the query that found it."""
+    return {"name": name, "desc": "..."}
+
+
+@pytest.fixture
+def mock_repository() -> MagicMock:
+    """Create a mock repository whose searches return nothing."""
+    repo = MagicMock()
+    repo.search = AsyncMock(return_value=[])
+    return repo
+
+
+@pytest.mark.parametrize(
+    ("module_name", "factory_method"),
+    [
+        ("search_spell", "create_spell_repository"),
+        ("search_creature", "create_creature_repository"),
+        ("search_equipment", "create_equipment_repository"),
+        ("search_rule", "create_rule_repository"),
+        ("search_character_option", "create_character_option_repository"),
+    ],
+)
+def test_get_repository_reuses_default_repository(module_name: str, factory_method: str):
+    """Test that the default repository is created once and then reused."""
+    module = _tool_module(module_name)
+    module._default_repository.cache_clear()
+    with patch.object(module.RepositoryFactory, factory_method) as create_repository:
+        first = module._get_repository()
+        second = module._get_repository()
+
+    assert first is second
+    create_repository.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("module_name", "tool_name", "first", "second"),
+    [
+        (
+            "search_spell",
+            "search_spell",
+            {"school": "Evocation", "class_key": "Wizard", "documents": ["srd-5e", "tce"]},
+            {"school": "Evocation", "class_key": "wizard", "documents": ["tce", "srd-5e"]},
+        ),
+        (
+            "search_creature",
+            "search_creature",
+            {"type": "humanoid", "documents": ["srd-5e", "tce"]},
+            {"type": "humanoid", "documents": ["tce", "srd-5e"]},
+        ),
+        (
+            "search_equipment",
+            "search_equipment",
+            {"type": "armor", "name": "Chain"},
+            {"type": "armor", "name": "chain"},
+        ),
+        (
+            "search_rule",
+            "search_rule",
+            {"rule_type": "condition", "documents": ["srd-5e", "tce"]},
+            {"rule_type": "condition", "documents": ["tce", "srd-5e"]},
+        ),
+    ],
+)
+async def test_tool_caches_repeated_queries(
+    mock_repository: MagicMock,
+    module_name: str,
+    tool_name: str,
+    first: dict[str, Any],
+    second: dict[str, Any],
+):
+    """Test that equivalent repeated queries are served from the result cache."""
+    module = _tool_module(module_name)
+    module._repository_context["repository"] = mock_repository
+
+    await getattr(module, tool_name)(**first)
+    await getattr(module, tool_name)(**second)
+
+    mock_repository.search.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("module_name", "tool_name", "clear_name", "query"),
+    [
+        ("search_spell", "search_spell", "clear_spell_cache", {"level": 3}),
+        ("search_creature", "search_creature", "clear_creature_cache", {"type": "undead"}),
+        ("search_equipment", "search_equipment", "clear_equipment_cache", {"type": "weapon"}),
+        ("search_rule", "search_rule", "clear_rule_cache", {"rule_type": "skill"}),
+    ],
+)
+async def test_clear_cache_forces_refetch(
+    mock_repository: MagicMock,
+    module_name: str,
+    tool_name: str,
+    clear_name: str,
+    query: dict[str, Any],
+):
+    """Test that clearing a tool's result cache forces a repository call."""
+    module = _tool_module(module_name)
+    module._repository_context["repository"] = mock_repository
+
+    await getattr(module, tool_name)(**query)
+    getattr(module, clear_name)()
+    await getattr(module, tool_name)(**query)
+
+    assert mock_repository.search.await_count == 2
+
+
+@dataclass(frozen=True)
+class _BatchTool:
+    """A batch search tool and two distinct queries for it."""
+
+    module_name: str
+    batch_name: str
+    query_name: str
+    queries: tuple[dict[str, Any], dict[str, Any]]
+    # Filter each query is told apart by, and a row named after its value
+    field: str
+    make_row: Callable[[str], Any]
+    expected: tuple[str, str]
+
+
+_BATCH_TOOLS = [
+    pytest.param(
+        _BatchTool(
+            "search_creature",
+            "search_creatures",
+            "CreatureQuery",
+            ({"cr": 3, "type": "undead"}, {"cr": 1, "type": "undead"}),
+            "challenge_rating",
+            _creature,
+            ("3.0", "1.0"),
+        ),
+        id="creature",
+    ),
+    pytest.param(
+        _BatchTool(
+            "search_rule",
+            "search_rules",
+            "RuleQuery",
+            ({"rule_type": "skill"}, {"rule_type": "condition", "search": "prone"}),
+            "rule_type",
+            _rule,
+            ("skill", "condition"),
+        ),
+        id="rule",
+    ),
+    pytest.param(
+        _BatchTool(
+            "search_spell",
+            "search_spells",
+            "SpellQuery",
+            ({"class_key": "wizard", "level": 3}, {"class_key": "cleric", "level": 3}),
+            "class_key",
+            _spell,
+            ("wizard", "cleric"),
+        ),
+        id="spell",
+    ),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("tool", _BATCH_TOOLS)
+async def test_batch_tool_returns_results_in_query_order(
+    mock_repository: MagicMock, tool: _BatchTool
+):
+    """Test that batch results line up with the queries they answer."""
+    module = _tool_module(tool.module_name)
+    module._repository_context["repository"] = mock_repository
+
+    async def search(**filters: Any) -> list[Any]:
+        return [tool.make_row(str(filters[tool.field]))]
+
+    mock_repository.search.side_effect = search
+    query_model = getattr(module, tool.query_name)
+
+    results = await getattr(module, tool.batch_name)(
+        [query_model(**query) for query in tool.queries]
+    )
+
+    assert [[row["name"] for row in batch] for batch in results] == [
+        [name] for name in tool.expected
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("tool", _BATCH_TOOLS)
+async def test_batch_tool_shares_duplicate_queries(mock_repository: MagicMock, tool: _BatchTool):
+    """Test that identical queries in one batch trigger a single lookup."""
+    module = _tool_module(tool.module_name)
+    module._repository_context["repository"] = mock_repository
+    query_model = getattr(module, tool.query_name)
+    first, second = tool.queries
+
+    results = await getattr(module, tool.batch_name)(
+        [query_model(**first), query_model(**first), query_model(**second)]
+    )
+
+    assert results == [[], [], []]
+    assert mock_repository.search.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("tool", _BATCH_TOOLS)
+async def test_batch_tool_rejects_oversized_batch(mock_repository: MagicMock, tool: _BatchTool):
+    """Test that a batch over the size limit fails before any lookup."""
+    module = _tool_module(tool.module_name)
+    module._repository_context["repository"] = mock_repository
+    query = getattr(module, tool.query_name)(**tool.queries[0])
+
+    with pytest.raises(ValueError, match="Too many queries"):
+        await getattr(module, tool.batch_name)([query] * (batch.MAX_BATCH_QUERIES + 1))
+
+    mock_repository.search.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_run_batch_bounds_concurrent_queries():
+    """Test that a batch never runs more than BATCH_CONCURRENCY queries at once."""
+    running = 0
+    peak = 0
+
+    async def search(**query: Any) -> list[dict[str, Any]]:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return [query]
+
+    class Query(BaseModel):
+        index: int
+
+    queries = [Query(index=i) for i in range(batch.MAX_BATCH_QUERIES)]
+    results = await batch.run_batch(search, queries)
+
+    assert peak == batch.BATCH_CONCURRENCY
+    assert results == [[{"index": i}] for i in range(batch.MAX_BATCH_QUERIES)]